@@ -0,0 +1,62 @@
+from collections import namedtuple
+
+from gameboard.FeatureTracker import FeatureTracker
+
+# How much each feature of a board (see gameboard.FeatureTracker.BoardFeatures) counts
+# towards its score, plus the rows cleared getting there. Positive weights are good.
+Weights = namedtuple("Weights", ["aggregate_height", "holes", "bumpiness", "rows_cleared",
+                                 "wells", "row_transitions", "column_transitions"],
+                     defaults=[0, 0, 0])
+
+# A well known set of weights for this kind of evaluation, found by tuning against full games
+DEFAULT_WEIGHTS = Weights(aggregate_height=-0.510066, holes=-0.35663, bumpiness=-0.184483, rows_cleared=0.760666)
+
+
+def board_features(rows, width):
+    """
+    Args:
+        rows (sequence): one bitmask per row, top row first, as in BitboardGrid.rows
+        width (int): the number of columns
+
+    Returns:
+        gameboard.FeatureTracker.BoardFeatures: the features of the board
+    """
+    return FeatureTracker.from_rows(rows, width).get_features()
+
+
+def score_features(features, rows_cleared, weights=DEFAULT_WEIGHTS):
+    """
+    Scores a board from its features. Higher is better.
+
+    Args:
+        features (gameboard.FeatureTracker.BoardFeatures): the board, after any completed rows
+            have been cleared
+        rows_cleared (int): how many rows were cleared getting to this board
+        weights (Weights): how much each feature counts
+
+    Returns:
+        float
+    """
+    return (weights.aggregate_height * features.aggregate_height +
+            weights.holes * features.holes +
+            weights.bumpiness * features.bumpiness +
+            weights.wells * features.wells +
+            weights.row_transitions * features.row_transitions +
+            weights.column_transitions * features.column_transitions +
+            weights.rows_cleared * rows_cleared)
+
+
+def evaluate(rows, width, rows_cleared, weights=DEFAULT_WEIGHTS):
+    """
+    Scores a board given as its rows. See score_features().
+
+    Args:
+        rows (sequence): the board, after any completed rows have been cleared
+        width (int): the number of columns
+        rows_cleared (int): how many rows were cleared getting to this board
+        weights (Weights): how much each feature counts
+
+    Returns:
+        float
+    """
+    return score_features(board_features(rows, width), rows_cleared, weights)
@@ -0,0 +1,231 @@
+from collections import deque
+
+from ai.placements import Placement
+from gameplay.key_function import KeyFunction
+from geometry.Coordinate import Coordinate
+
+# How far above the top of the playing field a piece can be. Pieces start inside the field,
+# but rotating near the top can push the corner of the piece above it.
+_ABOVE_FIELD = 4
+
+
+def _free_columns(rows, width, height, shape):
+    """
+    For every y the piece's corner could be at, a bitmask of the x values where the shape
+    fits: it doesn't overlap a filled cell or stick out of the side or bottom of the playing
+    field. Index y + _ABOVE_FIELD in the result to look up row y.
+    """
+    in_bounds = (1 << (width - shape.width + 1)) - 1
+    # for each piece row, the columns within the piece that are filled
+    row_cells = [[dx for dx in range(shape.width) if mask >> dx & 1] for mask in shape.row_masks]
+
+    free = []
+    for y in range(-_ABOVE_FIELD, height):
+        if y + shape.height > height:
+            free.append(0)
+            continue
+        # the piece collides at x if, for any of its cells (dx, dy), the grid has a block
+        # at (x + dx, y + dy), which is bit x of that grid row shifted right by dx
+        hits = 0
+        for dy, cells in enumerate(row_cells):
+            if y + dy < 0:
+                continue
+            row = rows[y + dy]
+            if row:
+                for dx in cells:
+                    hits |= row >> dx
+        free.append(in_bounds & ~hits)
+    return free
+
+
+class ReachableMoves(object):
+    """
+    Every place a piece can come to rest by moving, rotating and falling from where it
+    starts, following the same rules as Board. This includes tucking under overhangs and
+    rotating into gaps, which straight drops can't reach.
+
+    The search keeps one bitmask of reachable x values per (rotation, y), so sliding sideways
+    fills a whole row of states at once and the visited set is a few integers.
+    """
+
+    def __init__(self, rows, width, piece_type, x, y, rotation):
+        """
+        Args:
+            rows (sequence): one bitmask per row, top row first, as in BitboardGrid.rows
+            width (int): the number of columns
+            piece_type (type): the Piece subclass being moved
+            x, y (int): the playing field position of the piece's corner to start from
+            rotation (int): the index into the piece's 'fill_arrays' to start from
+        """
+        self.piece_type = piece_type
+        self.width = width
+        self.start = (x, y, rotation)
+        shapes = piece_type.shapes
+        num_rotations = len(shapes)
+        height = len(rows)
+        span = height + _ABOVE_FIELD
+        self.span = span
+
+        # free[rotation][y + _ABOVE_FIELD]: where the piece fits in that orientation and row
+        free = [_free_columns(rows, width, height, shape) for shape in shapes]
+        self.free = free
+        # reach[rotation][y + _ABOVE_FIELD]: the x values the piece can get to
+        reach = [[0] * span for _ in range(num_rotations)]
+        self.reach = reach
+
+        # rotation -> the (new rotation, x offset, y offset) of rotating left and right
+        self.rotations = []
+        for rot in range(num_rotations):
+            targets = []
+            for new_rot in ((rot - 1) % num_rotations, (rot + 1) % num_rotations):
+                dx, dy = shapes[rot].rotation_deltas[new_rot]
+                targets.append((new_rot, dx, dy))
+            self.rotations.append(targets)
+
+        self.placements = []
+        row = y + _ABOVE_FIELD
+        if not 0 <= row < span or not free[rotation][row] >> x & 1:
+            return
+
+        reach[rotation][row] = 1 << x
+        pending = [(rotation, row)]
+        while pending:
+            rot, row = pending.pop()
+            rot_free = free[rot]
+            row_free = rot_free[row]
+            bits = reach[rot][row]
+
+            # slide left and right as far as the piece fits
+            while True:
+                grown = bits | ((bits << 1) | (bits >> 1)) & row_free
+                if grown == bits:
+                    break
+                bits = grown
+            reach[rot][row] = bits
+
+            if row + 1 < span:
+                down = bits & rot_free[row + 1]
+                if down & ~reach[rot][row + 1]:
+                    reach[rot][row + 1] |= down
+                    pending.append((rot, row + 1))
+
+            for new_rot, dx, dy in self.rotations[rot]:
+                new_row = row + dy
+                if not 0 <= new_row < span:
+                    continue
+                moved = bits << dx if dx >= 0 else bits >> -dx
+                moved &= free[new_rot][new_row]
+                if moved & ~reach[new_rot][new_row]:
+                    reach[new_rot][new_row] |= moved
+                    pending.append((new_rot, new_row))
+
+        self.placements = self._resting_placements(rows)
+
+    def _resting_placements(self, rows):
+        full_mask = (1 << self.width) - 1
+        placements = []
+        seen = set()
+        for rotation, shape in enumerate(self.piece_type.shapes):
+            rot_reach = self.reach[rotation]
+            rot_free = self.free[rotation]
+            # rows above the top of the playing field would stick out of it
+            for row in range(_ABOVE_FIELD, self.span):
+                below = rot_free[row + 1] if row + 1 < self.span else 0
+                resting = rot_reach[row] & ~below
+                y = row - _ABOVE_FIELD
+                x = 0
+                while resting:
+                    if resting & 1:
+                        cells = (y, tuple(mask << x for mask in shape.row_masks))
+                        if cells not in seen:
+                            seen.add(cells)
+                            cleared = 0
+                            for i, mask in enumerate(cells[1]):
+                                if rows[y + i] | mask == full_mask:
+                                    cleared += 1
+                            placements.append(Placement(rotation, x, y, cleared))
+                    resting >>= 1
+                    x += 1
+        return placements
+
+    def path_to(self, placement):
+        """
+        The fewest moves that take the piece from where it started to the placement and land
+        it there. Any run of moves down at the end is replaced with a single drop.
+
+        Args:
+            placement (Placement): one of self.placements
+
+        Returns:
+            list: KeyFunction values
+        """
+        width = self.width
+        span = self.span
+
+        def encode(x, row, rotation):
+            return ((rotation * span) + row) * width + x
+
+        start_x, start_y, start_rotation = self.start
+        start = encode(start_x, start_y + _ABOVE_FIELD, start_rotation)
+        target = encode(placement.x, placement.y + _ABOVE_FIELD, placement.rotation)
+
+        # A plain breadth-first search over single states, only through states already known
+        # to be reachable. Each state remembers the state it came from and the move used.
+        came_from = {start: None}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            if state == target:
+                break
+            rest, x = divmod(state, width)
+            rot, row = divmod(rest, span)
+
+            steps = []
+            if x > 0:
+                steps.append((x - 1, row, rot, KeyFunction.MOVE_LEFT))
+            if x + 1 < width:
+                steps.append((x + 1, row, rot, KeyFunction.MOVE_RIGHT))
+            if row + 1 < span:
+                steps.append((x, row + 1, rot, KeyFunction.MOVE_DOWN))
+            for (new_rot, dx, dy), function in zip(self.rotations[rot],
+                                                   (KeyFunction.ROTATE_LEFT, KeyFunction.ROTATE_RIGHT)):
+                if x + dx >= 0 and 0 <= row + dy < span:
+                    steps.append((x + dx, row + dy, new_rot, function))
+
+            for new_x, new_row, new_rot, function in steps:
+                # a move is legal if the piece fits where it ends up, and everywhere it
+                # fits next to a reachable state was reached by the search
+                if not self.reach[new_rot][new_row] >> new_x & 1:
+                    continue
+                new_state = encode(new_x, new_row, new_rot)
+                if new_state not in came_from:
+                    came_from[new_state] = (state, function)
+                    queue.append(new_state)
+
+        path = []
+        state = target
+        while came_from[state] is not None:
+            state, function = came_from[state]
+            path.append(function)
+        path.reverse()
+
+        while path and path[-1] == KeyFunction.MOVE_DOWN:
+            path.pop()
+        path.append(KeyFunction.DROP)
+        return path
+
+
+def find_reachable(grid, piece):
+    """
+    Searches every move of a piece from where it is on the grid.
+
+    Args:
+        grid (gameboard.BitboardGrid.BitboardGrid): the settled blocks
+        piece (pyblocks.pieces.Piece.Piece): the piece, at its current position and rotation
+
+    Returns:
+        ReachableMoves
+    """
+    return ReachableMoves(grid.rows, grid.width, type(piece),
+                          piece.get_x(Coordinate.PLAYING_FIELD), piece.get_y(Coordinate.PLAYING_FIELD),
+                          piece.rotation_index)
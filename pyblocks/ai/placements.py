@@ -0,0 +1,112 @@
+from collections import namedtuple
+
+from gameboard.SurfaceProfile import SurfaceProfile
+
+# Where a piece comes to rest after being dropped straight down from above the stack.
+#  rotation: the index into the piece's 'fill_arrays'
+#  x, y: the playing field coordinates of the piece's corner once it has landed
+#  rows_cleared: how many rows the placement would complete
+Placement = namedtuple("Placement", ["rotation", "x", "y", "rows_cleared"])
+
+
+def column_tops(rows, width):
+    """
+    Works out the top of the stack from the rows alone, for boards that have no
+    SurfaceProfile (e.g. ones produced by apply_placement()).
+
+    Args:
+        rows (sequence): one bitmask per row, top row first, as in BitboardGrid.rows
+        width (int): the number of columns
+
+    Returns:
+        list: the y of the highest filled cell in each column, or len(rows) if it is empty
+    """
+    return SurfaceProfile.from_rows(rows, width).tops.tolist()
+
+
+def find_placements(grid, piece_type):
+    """
+    Every distinct way the piece can land on the grid by dropping it from above the stack.
+    The grid is not changed.
+
+    Args:
+        grid (gameboard.BitboardGrid.BitboardGrid): the settled blocks
+        piece_type (type): the Piece subclass to place
+
+    Returns:
+        list: a Placement for each distinct set of cells the piece could end up covering
+    """
+    return placements_on_rows(grid.rows, grid.width, piece_type, grid.surface)
+
+
+def placements_on_rows(rows, width, piece_type, surface=None):
+    """
+    The same as find_placements(), for a board given as its row bitmasks.
+
+    Args:
+        rows (sequence): one bitmask per row, top row first
+        width (int): the number of columns
+        piece_type (type): the Piece subclass to place
+        surface (sequence): the y of the highest filled cell in each column, if already
+            known. Worked out from the rows otherwise.
+
+    Returns:
+        list: Placement tuples
+    """
+    if surface is None:
+        surface = column_tops(rows, width)
+    height = len(rows)
+    full_mask = (1 << width) - 1
+
+    placements = []
+    seen = set()
+    for rotation, shape in enumerate(piece_type.shapes):
+        bottom_profile = shape.bottom_profile
+        row_masks = shape.row_masks
+        for x in range(width - shape.width + 1):
+            # the lowest cell of each of the piece's columns stops just above the stack
+            y = height
+            for col, dy in enumerate(bottom_profile):
+                landing_y = surface[x + col] - 1 - dy
+                if landing_y < y:
+                    y = landing_y
+            if y < 0:
+                # it would stick out of the top of the playing field
+                continue
+
+            cells = (y, tuple(mask << x for mask in row_masks))
+            if cells in seen:
+                continue
+            seen.add(cells)
+
+            cleared = 0
+            for i, mask in enumerate(cells[1]):
+                if rows[y + i] | mask == full_mask:
+                    cleared += 1
+            placements.append(Placement(rotation, x, y, cleared))
+    return placements
+
+
+def apply_placement(rows, width, piece_type, placement):
+    """
+    The board that would result from a placement, with any completed rows cleared.
+
+    Args:
+        rows (sequence): one bitmask per row, top row first
+        width (int): the number of columns
+        piece_type (type): the Piece subclass being placed
+        placement (Placement): where it lands, as returned by placements_on_rows()
+
+    Returns:
+        list: the new row bitmasks. 'rows' is left alone.
+    """
+    full_mask = (1 << width) - 1
+    new_rows = list(rows)
+    y = placement.y
+    for i, mask in enumerate(piece_type.shapes[placement.rotation].row_masks):
+        new_rows[y + i] |= mask << placement.x
+
+    if placement.rows_cleared:
+        kept = [row for row in new_rows if row != full_mask]
+        new_rows = [0] * (len(new_rows) - len(kept)) + kept
+    return new_rows
@@ -0,0 +1,144 @@
+from ai.evaluation import DEFAULT_WEIGHTS
+from ai.evaluation import score_features
+from ai.moves import ReachableMoves
+from ai.placements import apply_placement
+from ai.placements import placements_on_rows
+from gameboard.FeatureTracker import FeatureTracker
+from gameplay.key_function import KeyFunction
+from geometry.Coordinate import Coordinate
+
+
+class AiPlayer(object):
+    """
+    Plays the game through the same KeyFunction actions a player's keys are turned into.
+    For each new piece it searches every placement it can reach, scores the board each one
+    leaves behind (looking ahead at the pieces in the "coming next" box), and then moves
+    the piece there one action at a time.
+    """
+
+    def __init__(self, weights=DEFAULT_WEIGHTS, lookahead=1):
+        """
+        Args:
+            weights (ai.evaluation.Weights): how to score a board
+            lookahead (int): how many of the upcoming pieces to take into account
+        """
+        self.weights = weights
+        self.lookahead = lookahead
+        # the actions still to do, in reverse order, and where they should leave the piece
+        self.plan = []
+        self.expected = None
+        # the Placement the plan is heading for
+        self.target = None
+
+    def next_action(self, gameplay):
+        """
+        Args:
+            gameplay (gameplay.gameplay.Gameplay): the game being played
+
+        Returns:
+            int: the KeyFunction to apply next, or None if there is nothing to do
+        """
+        board = gameplay.board
+        piece = board.active_piece
+        state = (gameplay.pieces_placed, piece.get_x(Coordinate.PLAYING_FIELD),
+                 piece.get_y(Coordinate.PLAYING_FIELD), piece.rotation_index)
+
+        # Work out a new plan for each new piece. If the piece isn't where the plan left it
+        # (e.g. because it fell a row in the meantime), find a new way to the same placement.
+        if self.expected is None or state[0] != self.expected[0] or not self.plan:
+            self.plan = self.choose_moves(board)[::-1]
+        elif state != self.expected:
+            self.plan = self.moves_to_target(board)[::-1]
+
+        if not self.plan:
+            return None
+        action = self.plan.pop()
+        self.expected = self.__after(state, action, type(piece))
+        return action
+
+    # Where an action should leave the piece. A drop lands it, so the next piece is expected.
+    @staticmethod
+    def __after(state, action, piece_type):
+        pieces_placed, x, y, rotation = state
+        if action == KeyFunction.MOVE_LEFT:
+            return pieces_placed, x - 1, y, rotation
+        elif action == KeyFunction.MOVE_RIGHT:
+            return pieces_placed, x + 1, y, rotation
+        elif action == KeyFunction.MOVE_DOWN:
+            return pieces_placed, x, y + 1, rotation
+        elif action in (KeyFunction.ROTATE_LEFT, KeyFunction.ROTATE_RIGHT):
+            num_rotations = len(piece_type.shapes)
+            step = -1 if action == KeyFunction.ROTATE_LEFT else 1
+            new_rotation = (rotation + step) % num_rotations
+            dx, dy = piece_type.shapes[rotation].rotation_deltas[new_rotation]
+            return pieces_placed, x + dx, y + dy, new_rotation
+        return None
+
+    # A new path from where the active piece is to the current target, or a whole new plan if
+    # the target can't be reached any more
+    def moves_to_target(self, board):
+        moves = self.__search(board)
+        if self.target in moves.placements:
+            return moves.path_to(self.target)
+        return self.choose_moves(board)
+
+    @staticmethod
+    def __search(board):
+        grid = board.backing_grid
+        piece = board.active_piece
+        return ReachableMoves(grid.rows, grid.width, type(piece),
+                              piece.get_x(Coordinate.PLAYING_FIELD), piece.get_y(Coordinate.PLAYING_FIELD),
+                              piece.rotation_index)
+
+    def choose_moves(self, board):
+        """
+        Picks the best placement for the active piece.
+
+        Args:
+            board (gameboard.Board.Board): the board being played on
+
+        Returns:
+            list: the KeyFunction actions that put the active piece there, ending with a drop.
+                Empty if the piece can't go anywhere.
+        """
+        grid = board.backing_grid
+        piece = board.active_piece
+        upcoming = [type(queued) for queued in board.incoming_queue][:self.lookahead]
+        moves = self.__search(board)
+
+        best = None
+        best_score = None
+        for placement in moves.placements:
+            score = self.__placement_score(grid.rows, grid.features, type(piece), placement, upcoming, 0)
+            if best_score is None or score > best_score:
+                best = placement
+                best_score = score
+
+        self.target = best
+        if best is None:
+            return []
+        return moves.path_to(best)
+
+    # The score of making a placement on a board, then dropping each of the upcoming pieces
+    # in turn as well as possible. 'tracker' is the FeatureTracker of the board.
+    def __placement_score(self, rows, tracker, piece_type, placement, upcoming, rows_cleared):
+        rows_cleared += placement.rows_cleared
+        if not upcoming:
+            shape = piece_type.shapes[placement.rotation]
+            features = tracker.features_after(rows, shape, placement.x, placement.y)
+            return score_features(features, rows_cleared, self.weights)
+
+        width = tracker.width
+        next_rows = apply_placement(rows, width, piece_type, placement)
+        next_tracker = FeatureTracker.from_rows(next_rows, width)
+        best_score = None
+        for next_placement in placements_on_rows(next_rows, width, upcoming[0], next_tracker.surface):
+            score = self.__placement_score(next_rows, next_tracker, upcoming[0], next_placement,
+                                           upcoming[1:], rows_cleared)
+            if best_score is None or score > best_score:
+                best_score = score
+
+        if best_score is None:
+            # the next piece won't fit anywhere, so this is as good as it gets
+            return score_features(next_tracker.get_features(), rows_cleared, self.weights)
+        return best_score
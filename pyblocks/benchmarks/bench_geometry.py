@@ -0,0 +1,84 @@
+import timeit
+
+from gameboard.Board import Board
+from geometry.Geometry import Geometry
+from pyblocks.pieces.Tee import Tee
+
+# Benchmarks the boundary lookups Board does for every move. Run from the pyblocks directory:
+#   python -m benchmarks.bench_geometry
+
+# The playing field of the real game (see GFX_CONSTANTS)
+BLOCK_SIZE = 25
+PLAY_AREA = (125, 75, 125 + 14 * BLOCK_SIZE, 75 + 17 * BLOCK_SIZE)
+ITERATIONS = 200000
+
+
+# How Geometry used to work out the boundaries checked on each move: from the pixel
+# tuple, on every call
+class RecomputingGeometry(object):
+    def __init__(self, block_width, block_height, playable_field):
+        self.block_width = block_width
+        self.block_height = block_height
+        self.playing_field = playable_field
+
+    def get_left_boundary_playing_field(self):
+        return 0
+
+    def get_right_boundary_playing_field(self):
+        width_px = self.playing_field[2] - self.playing_field[0]
+        return width_px // self.block_width
+
+    def get_lower_boundary_grid(self):
+        return self.playing_field[3] // self.block_width
+
+    def get_lower_boundary_playing_field(self):
+        height_px = self.playing_field[3] - self.playing_field[1]
+        return height_px // self.block_width
+
+
+# The lookups for one move: the move down check plus the bounds check of a rotation
+def per_move_recomputed(geometry):
+    geometry.get_lower_boundary_grid()
+    geometry.get_right_boundary_playing_field()
+    geometry.get_left_boundary_playing_field()
+    geometry.get_lower_boundary_playing_field()
+
+
+def per_move_layout(layout):
+    layout.lower_grid
+    layout.right_field
+    layout.left_field
+    layout.lower_field
+
+
+# A full move through the board: move down check, sideways moves and a rotation
+def board_moves(board):
+    board.piece_can_move_down(board.active_piece)
+    board.move_left()
+    board.move_right()
+    board.rotate_right()
+    board.rotate_left()
+
+
+def report(name, seconds):
+    print("{:<28} {:8.1f} ns/move".format(name, seconds / ITERATIONS * 1e9))
+
+
+def main():
+    old_geometry = RecomputingGeometry(BLOCK_SIZE, BLOCK_SIZE, PLAY_AREA)
+    geometry = Geometry(BLOCK_SIZE, BLOCK_SIZE, PLAY_AREA)
+    recomputed = timeit.timeit(lambda: per_move_recomputed(old_geometry), number=ITERATIONS)
+    precomputed = timeit.timeit(lambda: per_move_layout(geometry.layout), number=ITERATIONS)
+
+    board = Board(geometry)
+    board.set_starting_pieces([Tee(geometry) for _ in range(3)], Tee(geometry))
+    moves = timeit.timeit(lambda: board_moves(board), number=ITERATIONS)
+
+    report("boundaries, recomputed", recomputed)
+    report("boundaries, precomputed", precomputed)
+    report("saved per move", recomputed - precomputed)
+    report("Board moves (for scale)", moves)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import random
+import timeit
+
+from ai.moves import ReachableMoves
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+# Times a full reachability search of each piece on a partly filled board the size of the
+# real game's. Run from the pyblocks directory:
+#   python -m benchmarks.bench_moves
+
+FIELD_WIDTH = 14
+FIELD_HEIGHT = 17
+# where pieces come into the playing field
+START = (7, 0)
+ITERATIONS = 2000
+
+
+# The bottom half of the board filled with random junk, which leaves plenty of overhangs
+def messy_rows(seed):
+    rng = random.Random(seed)
+    full_mask = (1 << FIELD_WIDTH) - 1
+    rows = [0] * FIELD_HEIGHT
+    for y in range(FIELD_HEIGHT // 2, FIELD_HEIGHT):
+        rows[y] = rng.getrandbits(FIELD_WIDTH) & full_mask
+    return rows
+
+
+def main():
+    rows = messy_rows(1)
+    for piece_class in PieceFactory.PIECE_TYPES:
+        seconds = timeit.timeit(lambda: ReachableMoves(rows, FIELD_WIDTH, piece_class, START[0], START[1], 0),
+                                number=ITERATIONS)
+        moves = ReachableMoves(rows, FIELD_WIDTH, piece_class, START[0], START[1], 0)
+        print("{:<6} {:8.1f} us/search {:4} placements".format(
+            piece_class.__name__, seconds / ITERATIONS * 1e6, len(moves.placements)))
+
+
+if __name__ == "__main__":
+    main()
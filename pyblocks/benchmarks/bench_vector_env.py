@@ -0,0 +1,65 @@
+import timeit
+
+import numpy as np
+
+from gameplay.key_function import KeyFunction
+from headless.engine import HeadlessGame
+from headless.vector_env import VectorEnv
+
+# Compares placing one piece in each of a big batch of games with the vectorised environment
+# against placing one piece in a single headless game. Needs numpy. Run from the pyblocks
+# directory:
+#   python -m benchmarks.bench_vector_env
+#
+# The goal was for a step of TARGET_BATCH games to cost only slightly more than one headless
+# drop. Recorded on the development machine, it doesn't get there:
+#   headless game, 1 board           70-90 us/step
+#   VectorEnv, 1 boards             100-230 us/step
+#   VectorEnv, 64 boards            125-160 us/step
+#   VectorEnv, 1024 boards          280-360 us/step
+#   VectorEnv, 4096 boards         880-1280 us/step
+#   4096 boards / 1 headless drop    11-15x
+
+BATCH_SIZES = (1, 64, 1024, 4096)
+TARGET_BATCH = 4096
+STEPS = 200
+
+
+def time_headless():
+    game = HeadlessGame(seed=0)
+
+    def drop():
+        nonlocal game
+        if not game.step(KeyFunction.DROP):
+            game = HeadlessGame(seed=0)
+
+    return timeit.timeit(drop, number=STEPS) / STEPS
+
+
+def time_vector_env(num_envs):
+    env = VectorEnv(num_envs, seed=0)
+    rng = np.random.default_rng(0)
+    rotations = rng.integers(4, size=(STEPS, num_envs))
+    xs = rng.integers(env.width, size=(STEPS, num_envs))
+
+    def run():
+        for step in range(STEPS):
+            env.step(rotations[step], xs[step])
+            env.reset_done()
+
+    return timeit.timeit(run, number=1) / STEPS
+
+
+def main():
+    headless = time_headless()
+    print("{:<28} {:10.1f} us/step".format("headless game, 1 board", headless * 1e6))
+    times = {}
+    for num_envs in BATCH_SIZES:
+        times[num_envs] = time_vector_env(num_envs)
+        print("{:<28} {:10.1f} us/step".format("VectorEnv, {} boards".format(num_envs), times[num_envs] * 1e6))
+    print("{:<28} {:10.1f}x".format("{} boards / 1 headless drop".format(TARGET_BATCH),
+                                    times[TARGET_BATCH] / headless))
+
+
+if __name__ == "__main__":
+    main()
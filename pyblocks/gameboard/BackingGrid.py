@@ -1,4 +1,4 @@
-from functools import reduce
+from gameboard.SurfaceProfile import SurfaceProfile
 from geometry.Coordinate import Coordinate
 
 
@@ -36,9 +36,32 @@ class BackingGrid(object):
         # who only has access to the tuple, can see the grid-relative location
         self.grid = [[(False, None, None, None) for col in range(width)] for row in range(height)]
 
+        # row_counts[i] is the number of filled cells in grid[i]
+        self.row_counts = [0] * height
+
+        # The rows that pieces have been added to since the last time filled rows were
+        # cleared. Those are the only rows that could have become full.
+        self.landed_rows = set()
+
+        self.profile = SurfaceProfile(width, height)
+
+        # Bumped whenever the contents of the grid change, so anything derived from the
+        # grid can tell when it is stale
+        self.version = 0
+
     def __iter__(self):
         return iter(_grid_as_list(self.grid))
 
+    # A read-only view of the height of the stack in each column
+    @property
+    def column_heights(self):
+        return self.profile.column_heights
+
+    # A read-only view of the y (playing field) of the highest filled cell in each column
+    @property
+    def surface(self):
+        return self.profile.surface
+
     def add(self, piece):
         # for bounds checking, coords are based on playing field
         x = piece.get_x(Coordinate.PLAYING_FIELD)
@@ -50,6 +73,8 @@ class BackingGrid(object):
         x_offset = piece.get_x(Coordinate.GRID) - x
         y_offset = piece.get_y(Coordinate.GRID) - y
 
+        self.version += 1
+
         # break apart the piece into individual cells
         mask = piece.get_fill_mask()
         x_field = x
@@ -61,6 +86,9 @@ class BackingGrid(object):
                         raise Exception('Tried to add a piece to a cell that was already occupied')
                     self.grid[y_field][x_field] = (True,
                                                    x_field + x_offset, y_field + y_offset, piece.get_color())
+                    self.row_counts[y_field] += 1
+                    self.landed_rows.add(y_field)
+                    self.profile.on_cell_filled(x_field, y_field)
                 x_field += 1
             x_field = x
             y_field += 1
@@ -101,19 +129,23 @@ class BackingGrid(object):
             backing_y += 1
         return False
 
+    # How many columns a piece (represented by a bitmap) at (x, y) could slide sideways before
+    # it hit something or the edge of the playing field. direction is -1 for left, 1 for right.
+    # Same assumptions as is_collision.
+    def slide_distance(self, x, y, bitmap, direction):
+        width = len(bitmap[0])
+        distance = 0
+        while True:
+            new_x = x + (distance + 1) * direction
+            if new_x < 0 or new_x + width > self.width or self.is_collision(new_x, y, bitmap):
+                return distance
+            distance += 1
+
     # Clears any rows that are filled all the way across. Collapses everything above into those newly empty rows
     # Returns the number of rows that were cleared
     def clear_filled_rows(self):
-        # full_indication[i] is True if grid[i] is full 
-        full_indication = list(map(
-            lambda row: reduce(lambda prev, curr: prev == curr[0] == True, row, True),
-            self.grid))
-   
-        # convert that indicator list into a list of indices
-        full_rows = []
-        for i in range(0, self.height):
-            if full_indication[i]:
-                full_rows.append(i)
+        full_rows = sorted(y for y in self.landed_rows if self.row_counts[y] == self.width)
+        self.landed_rows.clear()
 
         if not full_rows:
             return 0
@@ -125,16 +157,23 @@ class BackingGrid(object):
                     row[pos] = (cell[0], cell[1], cell[2] + y_offset, cell[3])
 
         # Collapse from bottom to top (top to bottom would require multiple passes if more than one row was cleared)
+        full_set = set(full_rows)
         dest = full_rows[-1]
         src = dest - 1
         while src >= 0:
-            while src in full_rows:
+            while src in full_set:
                 src -= 1
+            if src < 0:
+                break
             self.grid[dest] = self.grid[src]
+            self.row_counts[dest] = self.row_counts[src]
             fudge_coords(self.grid[dest], dest - src)
             src -= 1
             dest -= 1
         for y in range(len(full_rows)):
             self.grid[y] = [(False, None, None, None)] * self.width
+            self.row_counts[y] = 0
 
+        self.version += 1
+        self.profile.on_rows_cleared(full_rows, lambda x, y: self.grid[y][x][0])
         return len(full_rows)
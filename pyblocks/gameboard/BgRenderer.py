@@ -58,55 +58,73 @@ class BgRenderer(object):
 
         self.score_font = pygame.font.Font(font, 30)
 
+        # The score box only changes when a piece lands, so it is drawn to its own surface
+        # and only redrawn when what it shows is different
+        self.score_box_surface = pygame.Surface(self.score_box[2:]).convert()
+        self.score_box_key = None
+
+        # Every piece of text the score box can show, rasterised once up front. Numbers are
+        # put together from the digit glyphs.
+        self.score_glyphs = {}
+        for text in ["Score: ", "Level: ", "Rows: "] + [str(digit) for digit in range(10)]:
+            self.score_glyphs[text] = self.score_font.render(text, 1, BgRenderer.SCORE_FONT_COLOR)
+
+        # Everything in the base layer that never changes, composited into one surface
+        self.static_layer = None
+        self.prerender_static_layer()
+
+    def prerender_static_layer(self):
+        self.static_layer = pygame.Surface(self.screen.get_size()).convert()
+        self.static_layer.blit(self.bg_image, (0, 0))
+        self.draw_main_border(self.static_layer)
+        self.draw_upcoming_box(self.static_layer)
+
     def render_base_layer(self):
-        self.screen.blit(self.bg_image, (0, 0))
-        # self.screen.fill(BgRenderer.BLACK)
-        self.draw_main_border()
+        self.screen.blit(self.static_layer, (0, 0))
         self.draw_score_box()
-        self.draw_upcoming_box()
 
-    def draw_main_border(self):
-        # self.screen.fill(BgRenderer.BORDER_COLOR, _inflate_rect(self.playing_field, 20))
-        # self.screen.fill(BgRenderer.BLACK, self.playing_field, 0)
-        pygame.draw.rect(self.screen, BgRenderer.BORDER_COLOR,
+    def draw_main_border(self, surface):
+        # surface.fill(BgRenderer.BORDER_COLOR, _inflate_rect(self.playing_field, 20))
+        # surface.fill(BgRenderer.BLACK, self.playing_field, 0)
+        pygame.draw.rect(surface, BgRenderer.BORDER_COLOR,
                          self.playing_field, 10)
-        pygame.draw.rect(self.screen, BgRenderer.BLACK, self.playing_field, 0)
+        pygame.draw.rect(surface, BgRenderer.BLACK, self.playing_field, 0)
 
     # TODO: move ScoreBox to its own class that Board owns. Either the main
     # game loop in tetris.py can render it on every tick, or Board can render
     # it only when the score changes. Someone needs to be able to update the
     # score, and BgRenderer is not the place to track that.
     def draw_score_box(self):
-        score = "Score: {}".format(str(self.score_keeper.get_score()))
-        rows = "Rows: {}".format(str(self.score_keeper.get_rows()))
-        level = "Level: {} ".format(str(self.score_keeper.get_difficulty()))
-
-        scoretext = self.score_font.render(score, 1, BgRenderer.SCORE_FONT_COLOR)
-        leveltext = self.score_font.render(level, 1, BgRenderer.SCORE_FONT_COLOR)
-        rowstext = self.score_font.render(rows, 1, BgRenderer.SCORE_FONT_COLOR)
-
-        pygame.draw.rect(self.screen, BgRenderer.BLACK, self.score_box, 0)
-        pygame.draw.rect(self.screen, BgRenderer.SCORE_BOX_COLOR,
-                         self.score_box, 5)
-
-        ypos = self.score_box[1] + 10
-        self.screen.blit(
-            scoretext,
-            (self.score_box[0] + 10, ypos))
-
+        key = (self.score_keeper.get_score(), self.score_keeper.get_rows(), self.score_keeper.get_difficulty())
+        if key != self.score_box_key:
+            self.redraw_score_box(*key)
+            self.score_box_key = key
+        self.screen.blit(self.score_box_surface, self.score_box[:2])
+
+    def redraw_score_box(self, score, rows, level):
+        surface = self.score_box_surface
+        box = (0, 0, self.score_box[2], self.score_box[3])
+        pygame.draw.rect(surface, BgRenderer.BLACK, box, 0)
+        pygame.draw.rect(surface, BgRenderer.SCORE_BOX_COLOR, box, 5)
+
+        ypos = 10
+        self.draw_score_line(surface, "Score: ", score, ypos)
         ypos += 25
-        self.screen.blit(
-            leveltext,
-            (self.score_box[0] + 10, ypos))
-
+        self.draw_score_line(surface, "Level: ", level, ypos)
         ypos += 25
-        self.screen.blit(
-            rowstext,
-            (self.score_box[0] + 10, ypos))
-
-    def draw_upcoming_box(self):
-        pygame.draw.rect(self.screen, BgRenderer.BLACK, self.upcoming_box, 0)
-        pygame.draw.rect(self.screen, BgRenderer.SCORE_BOX_COLOR,
+        self.draw_score_line(surface, "Rows: ", rows, ypos)
+
+    # Draws a label followed by a number using the pre-rendered glyphs
+    def draw_score_line(self, surface, label, value, ypos):
+        xpos = 10
+        for text in [label] + list(str(value)):
+            glyph = self.score_glyphs[text]
+            surface.blit(glyph, (xpos, ypos))
+            xpos += glyph.get_width()
+
+    def draw_upcoming_box(self, surface):
+        pygame.draw.rect(surface, BgRenderer.BLACK, self.upcoming_box, 0)
+        pygame.draw.rect(surface, BgRenderer.SCORE_BOX_COLOR,
                          self.upcoming_box, 5)
 
     def render_top_layer(self):
@@ -0,0 +1,243 @@
+from array import array
+
+from gameboard.FeatureTracker import FeatureTracker
+from gameboard.SurfaceProfile import SurfaceProfile
+from geometry.Coordinate import Coordinate
+
+
+# The compiled row masks of every bitmap seen so far, keyed on the identity of the bitmap.
+# The entry keeps a reference to the bitmap so its id cannot be recycled while cached.
+# Piece bitmaps are class-level constants, so in practice this holds one entry per rotation.
+_compiled_bitmaps = {}
+
+# Guard against callers that build a fresh bitmap for every call
+_MAX_COMPILED_BITMAPS = 256
+
+# The widest grid whose rows fit in the unsigned 64-bit integers of packed_rows
+_MAX_PACKED_WIDTH = 64
+
+
+# Converts a Piece bitmap into a tuple of integers, one per row, where bit i is set if
+# column i of that row is filled.
+def _compile_bitmap(bitmap):
+    try:
+        entry = _compiled_bitmaps[id(bitmap)]
+        if entry[0] is bitmap:
+            return entry[1]
+    except KeyError:
+        pass
+
+    masks = []
+    for row in bitmap:
+        mask = 0
+        for col, bit in enumerate(row):
+            if bit == 1:
+                mask |= 1 << col
+        masks.append(mask)
+    masks = tuple(masks)
+
+    if len(_compiled_bitmaps) >= _MAX_COMPILED_BITMAPS:
+        _compiled_bitmaps.clear()
+    _compiled_bitmaps[id(bitmap)] = (bitmap, masks)
+    return masks
+
+
+# A drop-in replacement for BackingGrid that stores each row of the playing field as an
+# integer bitmask (bit x is set if column x is filled). Collision checks become a bitwise
+# AND per piece row, and a row is full when it equals full_mask.
+class BitboardGrid(object):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.full_mask = (1 << width) - 1
+        self.rows = [0] * height
+
+        # A copy of the rows as unsigned 64-bit integers, so they can be handed out as a
+        # buffer (see row_view) without building anything. None if the grid is too wide.
+        self.packed_rows = array('Q', [0] * height) if width <= _MAX_PACKED_WIDTH else None
+
+        # The color of each filled cell. Only meaningful where the matching bit is set.
+        self.colors = [[None] * width for row in range(height)]
+
+        # The rows that pieces have been added to since the last time filled rows were
+        # cleared. Those are the only rows that could have become full.
+        self.landed_rows = set()
+
+        self.profile = SurfaceProfile(width, height)
+        # holes, transitions, etc. for evaluating the board
+        self.features = FeatureTracker(width, height, self.profile)
+
+        # Bumped whenever the contents of the grid change, so anything derived from the
+        # grid can tell when it is stale
+        self.version = 0
+
+        # Add this to playing field coords to get grid coords. Only known once a piece
+        # has been added, but nothing is reported in grid coords before that.
+        self.x_offset = 0
+        self.y_offset = 0
+
+    # Produces the same (filled?, x-grid, y-grid, color) tuples as BackingGrid, in row-major order
+    def __iter__(self):
+        return iter(self._cells())
+
+    # A read-only view of the height of the stack in each column
+    @property
+    def column_heights(self):
+        return self.profile.column_heights
+
+    # A read-only view of the y (playing field) of the highest filled cell in each column
+    @property
+    def surface(self):
+        return self.profile.surface
+
+    # A read-only view of the row bitmasks (top row first) that always reflects the current
+    # contents of the grid. numpy.asarray() can wrap it without copying. None if the grid
+    # is wider than 64 columns.
+    @property
+    def row_view(self):
+        if self.packed_rows is None:
+            return None
+        return memoryview(self.packed_rows).toreadonly()
+
+    def _cells(self):
+        cells = []
+        empty = (False, None, None, None)
+        for y, row in enumerate(self.rows):
+            if row == 0:
+                cells.extend([empty] * self.width)
+                continue
+            colors = self.colors[y]
+            for x in range(self.width):
+                if row >> x & 1:
+                    cells.append((True, x + self.x_offset, y + self.y_offset, colors[x]))
+                else:
+                    cells.append(empty)
+        return cells
+
+    def add(self, piece):
+        # for bounds checking, coords are based on playing field
+        x = piece.get_x(Coordinate.PLAYING_FIELD)
+        y = piece.get_y(Coordinate.PLAYING_FIELD)
+        self.verify_in_bounds(x, y, piece)
+
+        self.x_offset = piece.get_x(Coordinate.GRID) - x
+        self.y_offset = piece.get_y(Coordinate.GRID) - y
+
+        shape = piece.get_shape()
+        masks = shape.row_masks
+        for i, mask in enumerate(masks):
+            if self.rows[y + i] & (mask << x):
+                raise Exception('Tried to add a piece to a cell that was already occupied')
+
+        self.version += 1
+        color = piece.get_color()
+        packed = self.packed_rows
+        for i, mask in enumerate(masks):
+            self.rows[y + i] |= mask << x
+            if packed is not None:
+                packed[y + i] = self.rows[y + i]
+            self.landed_rows.add(y + i)
+            colors = self.colors[y + i]
+            col = x
+            while mask:
+                if mask & 1:
+                    colors[col] = color
+                mask >>= 1
+                col += 1
+
+        for col, dy in enumerate(shape.top_profile):
+            if dy is not None:
+                self.profile.on_cell_filled(x + col, y + dy)
+        self.features.on_piece_added(self.rows, x, y, shape)
+
+    # Throws an exception if this piece does not fit in the play area
+    # target_x: the x-coordinate in the playing field to test
+    # target_y: the y-coordinate in the playing field to test
+    # piece: the piece to consider in the (target_x, target_y) position
+    def verify_in_bounds(self, target_x, target_y, piece):
+        width_oob = target_x < 0 or target_x + piece.get_width() > self.width
+        height_oob = target_y < 0 or target_y + piece.get_height() > self.height
+        if width_oob or height_oob:
+            raise Exception('Piece out of bounds')
+
+    # checks whether a piece (represented by a bitmap) collides
+    # with any other pieces in the board.
+    # Assumptions: x must be in bounds. If y is negative, only the portion of the
+    #   piece in bounds will be considered.
+    # x and y are relative to the playing field
+    def is_collision(self, x, y, bitmap):
+        masks = _compile_bitmap(bitmap)
+        # rows above the top of the play area can't collide with anything
+        if y < 0:
+            masks = masks[-y:]
+            y = 0
+
+        rows = self.rows
+        for mask in masks:
+            if rows[y] & (mask << x):
+                return True
+            y += 1
+        return False
+
+    # How many columns a piece (represented by a bitmap) at (x, y) could slide sideways before
+    # it hit something or the edge of the playing field. direction is -1 for left, 1 for right.
+    # Same assumptions as is_collision.
+    # Rather than trying one column at a time, this finds the nearest filled cell beside each
+    # cell of the piece straight from the row bitmasks.
+    def slide_distance(self, x, y, bitmap, direction):
+        masks = _compile_bitmap(bitmap)
+        # as far as the edge of the playing field, if nothing is in the way
+        if direction < 0:
+            distance = x
+        else:
+            distance = self.width - x - len(bitmap[0])
+
+        rows = self.rows
+        for i, mask in enumerate(masks):
+            # rows above the top of the play area are empty
+            if y + i < 0 or not rows[y + i]:
+                continue
+            row = rows[y + i]
+            col = x
+            while mask:
+                if mask & 1:
+                    if direction < 0:
+                        # the nearest filled cell to the left is the highest bit below col
+                        blockers = row & ((1 << col) - 1)
+                        free = col - blockers.bit_length()
+                    else:
+                        # the nearest filled cell to the right is the lowest bit above col
+                        blockers = row >> (col + 1)
+                        free = (blockers & -blockers).bit_length() - 1 if blockers else distance
+                    if free < distance:
+                        distance = free
+                mask >>= 1
+                col += 1
+        return distance
+
+    # Clears any rows that are filled all the way across. Collapses everything above into those newly empty rows
+    # Returns the number of rows that were cleared
+    def clear_filled_rows(self):
+        full_mask = self.full_mask
+        full_rows = sorted(y for y in self.landed_rows if self.rows[y] == full_mask)
+        self.landed_rows.clear()
+
+        if not full_rows:
+            return 0
+
+        # Keep the surviving rows in order and push empty ones in on top. The color lists
+        # are recycled for the new rows since the cleared rows' colors are dead anyway.
+        full_set = set(full_rows)
+        kept = [y for y in range(self.height) if y not in full_set]
+        self.rows = [0] * len(full_rows) + [self.rows[y] for y in kept]
+        self.colors = [self.colors[y] for y in full_rows] + [self.colors[y] for y in kept]
+        if self.packed_rows is not None:
+            # in place, so that views of it stay valid
+            self.packed_rows[:] = array('Q', self.rows)
+
+        self.version += 1
+        rows = self.rows
+        self.profile.on_rows_cleared(full_rows, lambda x, y: rows[y] >> x & 1)
+        self.features.on_rows_cleared(rows)
+
+        return len(full_rows)
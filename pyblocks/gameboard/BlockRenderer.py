@@ -2,13 +2,25 @@ import pygame
 
 
 class BlockRenderer:
+    # How opaque the ghost piece is (0-255)
+    GHOST_ALPHA = 70
+    BLACK = (0, 0, 0)
 
     def __init__(self, screen, geometry):
         self.screen = screen
         self.geometry = geometry
         self.blocks = {}
+        self.ghost_blocks = {}
         self.load_gfx()
 
+        # All the blocks that have landed, pre-drawn over the playing field so they can be
+        # put on the screen with one blit. It is redrawn only when the grid changes.
+        self.settled_pos = (geometry.get_left_boundary_px(), geometry.get_upper_boundary_px())
+        self.settled_layer = pygame.Surface(
+            (geometry.get_right_boundary_px() - self.settled_pos[0],
+             geometry.get_lower_boundary_px() - self.settled_pos[1])).convert()
+        self.settled_version = None
+
     def load_gfx(self):
         self.blocks['red'] = pygame.image.load('gfx/25px/redblock.png').convert()
         self.blocks['blue'] = pygame.image.load('gfx/25px/blueblock.png').convert()
@@ -19,6 +31,12 @@ class BlockRenderer:
         self.blocks['brown'] = pygame.image.load('gfx/25px/brownblock.png').convert()
         self.blocks['lightblue'] = pygame.image.load('gfx/25px/ltblueblock.png').convert()
 
+        # translucent copies of the blocks for showing where a piece will land
+        for color, block in self.blocks.items():
+            ghost = block.copy()
+            ghost.set_alpha(BlockRenderer.GHOST_ALPHA)
+            self.ghost_blocks[color] = ghost
+
     # Renders an entire playing piece
     def render(self, piece):
         block = self.blocks[piece.get_color()]
@@ -33,6 +51,32 @@ class BlockRenderer:
                 curr_x += self.geometry.get_block_width()
             curr_y += self.geometry.get_block_height()
 
+    # Renders a see-through copy of the piece at grid row y, showing where it will land
+    def render_ghost(self, piece, y):
+        block = self.ghost_blocks[piece.get_color()]
+        block_width = self.geometry.get_block_width()
+        block_height = self.geometry.get_block_height()
+        x = piece.get_x()
+        for dx, dy in piece.get_shape().cells:
+            self.screen.blit(block, [(x + dx) * block_width, (y + dy) * block_height])
+
+    # Renders every block that has landed in the backing grid
+    def render_settled(self, grid):
+        if grid.version != self.settled_version:
+            self.redraw_settled_layer(grid)
+        self.screen.blit(self.settled_layer, self.settled_pos)
+
+    def redraw_settled_layer(self, grid):
+        self.settled_layer.fill(BlockRenderer.BLACK)
+        block_width = self.geometry.get_block_width()
+        block_height = self.geometry.get_block_height()
+        for filled, x, y, color in grid:
+            if filled:
+                self.settled_layer.blit(self.blocks[color],
+                                        [x * block_width - self.settled_pos[0],
+                                         y * block_height - self.settled_pos[1]])
+        self.settled_version = grid.version
+
     # Renders one square of the grid
     # param x: The x-coordinate in grid-relative coordinates
     # param y: The x-coordinate in grid-relative coordinates
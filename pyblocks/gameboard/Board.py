@@ -1,7 +1,7 @@
 from collections import namedtuple
 
 from gameboard.IncomingQueue import IncomingQueue
-from gameboard.BackingGrid import BackingGrid
+from gameboard.BitboardGrid import BitboardGrid
 from geometry.Coordinate import Coordinate
 from pyblocks.pieces.Piece import Piece
 
@@ -18,17 +18,26 @@ class Board:
 
     # pieces enter the board
     def __init__(self, geometry):
-        self.backing_grid = BackingGrid(
+        self.backing_grid = BitboardGrid(
             geometry.get_play_area_width(),
             geometry.get_play_area_height())
         self.active_piece = None
         self.incoming_queue = None
         self.geometry = geometry
+        self.layout = geometry.layout
         # where the "coming next" panel is drawn
         self.incoming_panel_pos = Coordinate(22, 2, geometry, Coordinate.GRID)
         # the position where the next piece comes in
         self.active_piece_start = Coordinate(self.PIECE_DROP_POS[0], self.PIECE_DROP_POS[1], geometry, Coordinate.GRID)
 
+        # whether to show where the active piece will land
+        self.show_ghost = True
+
+        # (piece type, rotation, x) -> the y a piece dropped from above the stack lands at.
+        # Only valid for the backing grid version it was computed from.
+        self.drop_cache = {}
+        self.drop_cache_version = self.backing_grid.version
+
     def set_starting_pieces(self, starting_queue, active_piece):
         self.incoming_queue = IncomingQueue(
             self.incoming_panel_pos, Board.MAX_PIECE_HEIGHT,
@@ -49,6 +58,10 @@ class Board:
 
     # play a piece from the incoming queue and make it active
     def play_next_piece(self, piece_factory):
+        # the piece that just landed is part of the grid now, so it can be recycled
+        if self.active_piece is not None:
+            piece_factory.release(self.active_piece)
+
         # make the next piece active
         piece = self.incoming_queue.play_next_piece(
             piece_factory.random_piece())
@@ -66,13 +79,76 @@ class Board:
     def piece_can_move_down(self, piece):
         # for now just let it fall to the bottom
         piece_bottom = piece.get_y() + piece.get_height()
-        if piece_bottom >= self.geometry.get_lower_boundary_grid():
+        if piece_bottom >= self.layout.lower_grid:
             return False
         elif self.collided_down(piece):
             return False
         else:
             return True
 
+    # The playing field y where the piece would come to rest if it fell straight down
+    # from where it is now. Normally this comes straight from the surface of the stack,
+    # without stepping the piece down row by row.
+    def find_drop_y(self, piece):
+        x = piece.get_x(Coordinate.PLAYING_FIELD)
+        y = piece.get_y(Coordinate.PLAYING_FIELD)
+
+        landing_y = self.__surface_drop_y(piece, x)
+        if landing_y >= y:
+            return landing_y
+
+        # The piece has been slid under an overhang, so the top of the stack is above it
+        # and doesn't say where it stops. Sweep down the bitboard instead.
+        shape = piece.get_shape()
+        bottom_limit = self.backing_grid.height - shape.height
+        fill_mask = shape.fill_mask
+        while y < bottom_limit and not self.backing_grid.is_collision(x, y + 1, fill_mask):
+            y += 1
+        return y
+
+    # Where the piece would land if it fell onto the top of the stack in column x. This only
+    # changes when the grid does, so it is cached per piece type, rotation and column.
+    def __surface_drop_y(self, piece, x):
+        if self.drop_cache_version != self.backing_grid.version:
+            self.drop_cache.clear()
+            self.drop_cache_version = self.backing_grid.version
+
+        key = (type(piece), piece.rotation_index, x)
+        landing_y = self.drop_cache.get(key)
+        if landing_y is None:
+            # The lowest cell of each of the piece's columns has to stop just above the top
+            # of the stack in that column
+            surface = self.backing_grid.surface
+            landing_y = self.backing_grid.height
+            for col, dy in enumerate(piece.get_shape().bottom_profile):
+                landing_y = min(landing_y, surface[x + col] - 1 - dy)
+            self.drop_cache[key] = landing_y
+        return landing_y
+
+    # The grid y where the active piece would land, for drawing the ghost piece
+    def get_ghost_y(self):
+        field_y = self.active_piece.get_y(Coordinate.PLAYING_FIELD)
+        return self.active_piece.get_y() + self.find_drop_y(self.active_piece) - field_y
+
+    # Moves the active piece straight down as far as it can go, without landing it.
+    # Returns the number of rows it fell.
+    def drop_piece(self):
+        old_y = self.active_piece.get_y(Coordinate.PLAYING_FIELD)
+        new_y = self.find_drop_y(self.active_piece)
+        self.active_piece.set_y(new_y, Coordinate.PLAYING_FIELD)
+        return new_y - old_y
+
+    # Slides the active piece as far as it can go to the left (direction -1) or right
+    # (direction 1) in one go. Returns the number of columns it moved.
+    def shift_to_wall(self, direction):
+        piece = self.active_piece
+        distance = self.backing_grid.slide_distance(piece.get_x(Coordinate.PLAYING_FIELD),
+                                                    piece.get_y(Coordinate.PLAYING_FIELD),
+                                                    piece.get_fill_mask(), direction)
+        if distance:
+            piece.set_x(piece.get_x(Coordinate.GRID) + distance * direction)
+        return distance
+
     def collided_down(self, piece):
         new_y = piece.get_y(Coordinate.PLAYING_FIELD) + 1
         return self.backing_grid.is_collision(piece.get_x(Coordinate.PLAYING_FIELD),
@@ -94,7 +170,7 @@ class Board:
 
     def can_move_right(self, piece):
         new_x = piece.get_x(Coordinate.PLAYING_FIELD) + 1
-        in_bounds = new_x + piece.get_width() <= self.geometry.get_play_area_width()
+        in_bounds = new_x + piece.get_width() <= self.layout.play_area_width
         return in_bounds and not self.backing_grid.is_collision(new_x, piece.get_y(Coordinate.PLAYING_FIELD),
                                                                 piece.get_fill_mask())
 
@@ -135,12 +211,10 @@ class Board:
         newX = oldX + offset[0]
         newY = oldY + offset[1]
 
-        in_bounds = newX + self.active_piece.get_width() \
-                    <= self.geometry.get_right_boundary_playing_field()
-        in_bounds = in_bounds and newX >= \
-                    self.geometry.get_left_boundary_playing_field()
-        in_bounds = in_bounds and newY + self.active_piece.get_height() \
-                    <= self.geometry.get_lower_boundary_playing_field()
+        layout = self.layout
+        in_bounds = newX + self.active_piece.get_width() <= layout.right_field
+        in_bounds = in_bounds and newX >= layout.left_field
+        in_bounds = in_bounds and newY + self.active_piece.get_height() <= layout.lower_field
 
         success = False
 
@@ -163,13 +237,30 @@ class Board:
     def __detect_game_over(self):
         return self.active_piece.get_y(Coordinate.GRID) <= self.active_piece_start.getY(Coordinate.GRID)
 
+    # The (left, top, width, height) pixel rectangle the piece covers. If y is given, it is
+    # the grid row to measure the piece at instead of where it is.
+    def get_piece_rect(self, piece, y=None):
+        if y is None:
+            y = piece.get_y()
+        block_width = self.geometry.get_block_width()
+        block_height = self.geometry.get_block_height()
+        return (piece.get_x() * block_width, y * block_height,
+                piece.get_width() * block_width, piece.get_height() * block_height)
+
+    # The pixel rectangle covered by the playing field, where the landed pieces are drawn
+    def get_field_rect(self):
+        left = self.geometry.get_left_boundary_px()
+        top = self.geometry.get_upper_boundary_px()
+        return (left, top, self.geometry.get_right_boundary_px() - left, self.geometry.get_lower_boundary_px() - top)
+
     def render(self, renderer):
         for piece in self.incoming_queue:
             renderer.render(piece)
 
-        for filled, x, y, color in self.backing_grid:
-            if filled:
-                renderer.render_tile(x, y, color)
+        renderer.render_settled(self.backing_grid)
+
+        if self.show_ghost:
+            renderer.render_ghost(self.active_piece, self.get_ghost_y())
 
         # render the active piece last. Otherwise on the very last
         # piece it will look like the game glitched right before Game Over,
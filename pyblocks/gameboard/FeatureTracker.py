@@ -0,0 +1,214 @@
+from collections import namedtuple
+
+from gameboard.SurfaceProfile import SurfaceProfile
+
+# The features of a board that evaluators score it on.
+#  aggregate_height: the total height of all of the columns
+#  holes: empty cells with a filled cell somewhere above them in the same column
+#  bumpiness: the sum of the height differences between neighbouring columns
+#  wells: the total depth of the wells, where a well is a column lower than both of its
+#    neighbours (the walls count as being as tall as the playing field)
+#  row_transitions: going across each row from the top of the stack down, the number of
+#    times a filled cell is next to an empty one. The walls count as filled.
+#  column_transitions: going down each column, the number of times a filled cell is next
+#    to an empty one. The floor counts as filled.
+BoardFeatures = namedtuple("BoardFeatures", ["aggregate_height", "holes", "bumpiness", "wells",
+                                             "row_transitions", "column_transitions"])
+
+
+def _popcount(bits):
+    return bin(bits).count('1')
+
+
+# Keeps the features of a grid up to date as pieces are added and rows are cleared, so that
+# evaluators don't have to scan the whole grid for them. Like SurfaceProfile, the owning
+# grid reports every change. The rows themselves are always passed in, as the integer
+# bitmasks BitboardGrid keeps (bit x of a row is set if column x is filled).
+class FeatureTracker(object):
+
+    # profile: the grid's SurfaceProfile, which supplies the column heights
+    def __init__(self, width, height, profile):
+        self.width = width
+        self.height = height
+        self.full_mask = (1 << width) - 1
+        self.profile = profile
+
+        # the number of filled cells in the grid
+        self.filled = 0
+        # worked out from the column heights whenever they change. bumps[x] is the height
+        # difference between columns x and x + 1, and well_depths[x] is the depth of column x
+        # if it is a well (0 otherwise).
+        self.aggregate_height = 0
+        self.bumps = [0] * max(width - 1, 0)
+        self.well_depths = [0] * width
+        self.bumpiness = 0
+        self.wells = 0
+        # row_transitions[y]: the transitions across row y
+        self.row_transitions = [2] * height
+        self.total_row_transitions = 2 * height
+        # vertical_transitions[y]: the transitions between row y - 1 and row y, where the row
+        # above the top of the playing field is empty
+        self.vertical_transitions = [0] * height
+        self.total_vertical_transitions = 0
+        # the transitions between the bottom row and the floor
+        self.floor_transitions = width
+
+    # Builds a tracker for a board given only as its rows, e.g. one made up for a lookahead
+    @staticmethod
+    def from_rows(rows, width):
+        tracker = FeatureTracker(width, len(rows), SurfaceProfile.from_rows(rows, width))
+        tracker.rebuild(rows)
+        return tracker
+
+    # The y of the highest filled cell in each column
+    @property
+    def surface(self):
+        return self.profile.tops
+
+    def __row_transitions(self, row):
+        # put a filled wall on either side of the row, then count where neighbours differ
+        walled = (row << 1) | 1 | (1 << (self.width + 1))
+        return _popcount((walled ^ (walled >> 1)) & ((1 << (self.width + 1)) - 1))
+
+    # The bumpiness and wells of the columns from 'first' to 'last' (inclusive), counting the
+    # bumps between each of those columns and the next one. 'heights' holds the heights from
+    # column first - 1 to last + 1, with the walls as tall as the grid.
+    def __surface_features(self, heights, first, last):
+        bumpiness = 0
+        wells = 0
+        for i in range(1, last - first + 2):
+            h = heights[i]
+            left = heights[i - 1]
+            right = heights[i + 1]
+            if first + i <= self.width - 1:
+                bumpiness += h - right if h > right else right - h
+            lower_neighbour = left if left < right else right
+            if lower_neighbour > h:
+                wells += lower_neighbour - h
+        return bumpiness, wells
+
+    # The column heights from column first - 1 to last + 1, with the walls as tall as the grid
+    def __heights_around(self, first, last):
+        heights = self.profile.heights
+        return [heights[x] if 0 <= x < self.width else self.height for x in range(first - 1, last + 2)]
+
+    # Works everything out from scratch
+    def rebuild(self, rows):
+        self.filled = sum(_popcount(row) for row in rows)
+        self.__update_surface_features()
+        self.row_transitions = [self.__row_transitions(row) for row in rows]
+        self.total_row_transitions = sum(self.row_transitions)
+        above = 0
+        for y, row in enumerate(rows):
+            self.vertical_transitions[y] = _popcount(above ^ row)
+            above = row
+        self.total_vertical_transitions = sum(self.vertical_transitions)
+        self.floor_transitions = _popcount(self.full_mask & ~rows[-1])
+
+    def __update_surface_features(self):
+        heights = self.__heights_around(0, self.width - 1)
+        for x in range(self.width):
+            h = heights[x + 1]
+            if x < self.width - 1:
+                self.bumps[x] = abs(h - heights[x + 2])
+            lower_neighbour = min(heights[x], heights[x + 2])
+            self.well_depths[x] = lower_neighbour - h if lower_neighbour > h else 0
+        self.aggregate_height = sum(self.profile.heights)
+        self.bumpiness = sum(self.bumps)
+        self.wells = sum(self.well_depths)
+
+    # Must be called after a piece has been added to the rows, and after the profile has been
+    # told about it. (x, y) is where the corner of the piece's Shape went.
+    def on_piece_added(self, rows, x, y, shape):
+        self.filled += len(shape.cells)
+        self.__update_surface_features()
+        for i in range(shape.height):
+            row = rows[y + i]
+            transitions = self.__row_transitions(row)
+            self.total_row_transitions += transitions - self.row_transitions[y + i]
+            self.row_transitions[y + i] = transitions
+        # the piece changes the pairs of rows from just above it down to just below it
+        above = rows[y - 1] if y > 0 else 0
+        for row_y in range(y, min(y + shape.height + 1, self.height)):
+            transitions = _popcount(above ^ rows[row_y])
+            self.total_vertical_transitions += transitions - self.vertical_transitions[row_y]
+            self.vertical_transitions[row_y] = transitions
+            above = rows[row_y]
+        if y + shape.height == self.height:
+            self.floor_transitions = _popcount(self.full_mask & ~rows[-1])
+
+    # Must be called after the grid has collapsed filled rows. Every row below the top of the
+    # stack may have moved, so this is one pass over the rows (which doesn't happen often).
+    def on_rows_cleared(self, rows):
+        self.rebuild(rows)
+
+    # The features of the grid as it is
+    def get_features(self):
+        return BoardFeatures(self.aggregate_height, self.aggregate_height - self.filled,
+                             self.bumpiness, self.wells,
+                             self.total_row_transitions - 2 * min(self.profile.tops),
+                             self.total_vertical_transitions + self.floor_transitions)
+
+    # The features the grid would have if a piece with the given Shape were put with its
+    # corner at (x, y), without changing anything. Only the rows and columns the piece
+    # touches are looked at, unless it would complete rows, in which case the collapsed
+    # board is worked out from scratch.
+    def features_after(self, rows, shape, x, y):
+        full_mask = self.full_mask
+        masks = [mask << x for mask in shape.row_masks]
+        for i, mask in enumerate(masks):
+            if rows[y + i] | mask == full_mask:
+                return self.__collapsed_features(rows, masks, y)
+
+        # The piece only raises the columns it covers, which only changes the bumpiness and
+        # wells of those columns and the ones either side
+        first = x - 1 if x > 0 else 0
+        last = x + shape.width if x + shape.width < self.width else self.width - 1
+        heights = self.__heights_around(first, last)
+        old_bumpiness = sum(self.bumps[first:last + 1])
+        old_wells = sum(self.well_depths[first:last + 1])
+        aggregate_height = self.aggregate_height
+        for col, dy in enumerate(shape.top_profile):
+            new_height = self.height - y - dy
+            i = x + col - first + 1
+            if new_height > heights[i]:
+                aggregate_height += new_height - heights[i]
+                heights[i] = new_height
+        bumpiness, wells = self.__surface_features(heights, first, last)
+        bumpiness += self.bumpiness - old_bumpiness
+        wells += self.wells - old_wells
+
+        row_transitions = self.total_row_transitions
+        old_row_transitions = self.row_transitions
+        wall_bits = 1 | (1 << (self.width + 1))
+        pair_mask = (1 << (self.width + 1)) - 1
+        for i, mask in enumerate(masks):
+            walled = ((rows[y + i] | mask) << 1) | wall_bits
+            row_transitions += bin((walled ^ (walled >> 1)) & pair_mask).count('1') - old_row_transitions[y + i]
+        # the rows above the stack are empty, and don't count
+        row_transitions -= 2 * min(min(self.profile.tops), y)
+
+        column_transitions = self.total_vertical_transitions + self.floor_transitions
+        old_vertical_transitions = self.vertical_transitions
+        above = rows[y - 1] if y > 0 else 0
+        for i in range(shape.height + 1):
+            row_y = y + i
+            if row_y == self.height:
+                column_transitions += bin(full_mask & ~above).count('1') - self.floor_transitions
+                break
+            row = rows[row_y] | masks[i] if i < shape.height else rows[row_y]
+            column_transitions += bin(above ^ row).count('1') - old_vertical_transitions[row_y]
+            above = row
+
+        return BoardFeatures(aggregate_height, aggregate_height - self.filled - len(shape.cells),
+                             bumpiness, wells, row_transitions, column_transitions)
+
+    def __collapsed_features(self, rows, masks, y):
+        kept = []
+        for row_y, row in enumerate(rows):
+            if y <= row_y < y + len(masks):
+                row |= masks[row_y - y]
+            if row != self.full_mask:
+                kept.append(row)
+        collapsed = [0] * (self.height - len(kept)) + kept
+        return FeatureTracker.from_rows(collapsed, self.width).get_features()
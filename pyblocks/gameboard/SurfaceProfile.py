@@ -0,0 +1,82 @@
+from array import array
+
+
+# Tracks how tall the stack of settled blocks is in each column of a grid, so that
+# nothing needs to rescan the grid to find its top surface. The owning grid reports
+# each filled cell and each row clear, and this keeps itself up to date from those.
+class SurfaceProfile(object):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+        # heights[x] is the number of rows from the bottom of the grid up to and including
+        # the highest filled cell in column x (0 if the column is empty)
+        self.heights = array('l', [0] * width)
+
+        # tops[x] is the playing field y of the highest filled cell in column x, or the
+        # grid height if the column is empty. This is always height - heights[x].
+        self.tops = array('l', [height] * width)
+
+    # Builds the profile of a board given as row bitmasks (top row first), where bit x of a
+    # row is set if column x is filled
+    @staticmethod
+    def from_rows(rows, width):
+        height = len(rows)
+        profile = SurfaceProfile(width, height)
+        remaining = (1 << width) - 1
+        for y, row in enumerate(rows):
+            found = row & remaining
+            if not found:
+                continue
+            remaining &= ~found
+            x = 0
+            while found:
+                if found & 1:
+                    profile.tops[x] = y
+                    profile.heights[x] = height - y
+                found >>= 1
+                x += 1
+            if not remaining:
+                break
+        return profile
+
+    # A read-only view of the height of each column
+    @property
+    def column_heights(self):
+        return memoryview(self.heights).toreadonly()
+
+    # A read-only view of the y of the highest filled cell in each column
+    @property
+    def surface(self):
+        return memoryview(self.tops).toreadonly()
+
+    # Must be called whenever cell (x, y) is filled
+    def on_cell_filled(self, x, y):
+        if y < self.tops[x]:
+            self.tops[x] = y
+            self.heights[x] = self.height - y
+
+    # Must be called after the grid has collapsed filled rows.
+    # full_rows: the indices of the rows that were cleared, in ascending order
+    # is_filled: is_filled(x, y) tells whether a cell is filled in the collapsed grid
+    def on_rows_cleared(self, full_rows, is_filled):
+        num_cleared = len(full_rows)
+        highest_cleared = full_rows[0]
+        for x in range(self.width):
+            top = self.tops[x]
+            if top == self.height:
+                continue
+
+            # A full row has every column filled, so the top of a column is at or above
+            # the highest cleared row. If it's above, the whole column just drops.
+            if top < highest_cleared:
+                top += num_cleared
+            else:
+                # The top cell itself was cleared. Whatever survived fell by at least
+                # one row, so look for it below where the top used to be.
+                top += 1
+                while top < self.height and not is_filled(x, top):
+                    top += 1
+
+            self.tops[x] = top
+            self.heights[x] = self.height - top
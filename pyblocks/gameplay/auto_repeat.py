@@ -0,0 +1,96 @@
+from gameplay.key_function import KeyFunction
+
+
+class AutoRepeat(object):
+    """
+    Repeats the movement functions while their keys are held down, timed by the game clock
+    rather than by the operating system's key repeat. A held key first repeats after the
+    delay, then once every 'rate' milliseconds, at the exact point in the frame that it falls
+    due.
+
+    A rate of 0 means the movement should happen all at once (e.g. straight to the wall).
+    Those functions come up once, when the delay runs out, and not again until the key is
+    pressed again. The caller can check 'instant' to carry them out in a single step.
+    """
+    # The same timings as the pygame key repeat the game used to rely on
+    DEFAULT_DELAY_MILLIS = 250
+    DEFAULT_RATE_MILLIS = 75
+
+    # The functions that repeat. Rotating and dropping only ever happen once per press.
+    REPEATING = (KeyFunction.MOVE_LEFT, KeyFunction.MOVE_RIGHT, KeyFunction.MOVE_DOWN)
+
+    # Holding one of these cancels the other, so the most recent direction wins
+    OPPOSITES = {
+        KeyFunction.MOVE_LEFT: KeyFunction.MOVE_RIGHT,
+        KeyFunction.MOVE_RIGHT: KeyFunction.MOVE_LEFT
+    }
+
+    def __init__(self, delay_millis=DEFAULT_DELAY_MILLIS, rate_millis=DEFAULT_RATE_MILLIS):
+        """
+        Args:
+            delay_millis (int): how long a key has to be held before it starts repeating
+            rate_millis (int): the time between repeats. 0 makes the repeats instant.
+        """
+        self.delay_millis = delay_millis
+        self.rate_millis = rate_millis
+        # function -> milliseconds until it next repeats, for every function being held. None
+        # once an instant repeat has been used up.
+        self.held = {}
+
+    @property
+    def instant(self):
+        return self.rate_millis == 0
+
+    def press(self, function):
+        """
+        Args:
+            function (int): the KeyFunction whose key went down. It should already have been
+                performed once for the press itself.
+        """
+        if function not in AutoRepeat.REPEATING:
+            return
+        self.held.pop(AutoRepeat.OPPOSITES.get(function), None)
+        self.held[function] = self.delay_millis
+
+    def release(self, function):
+        """
+        Args:
+            function (int): the KeyFunction whose key went up
+        """
+        self.held.pop(function, None)
+
+    def release_all(self):
+        """ Forgets every held key, e.g. when the game stops seeing key releases """
+        self.held.clear()
+
+    def advance(self, millis):
+        """
+        Lets time go by.
+
+        Args:
+            millis (int): how much time has gone by
+
+        Returns:
+            list: a (millis, function) tuple for each repeat that fell due, in the order they
+                happened, where millis is how far into the given time it happened
+        """
+        repeats = []
+        rate = self.rate_millis
+        for function, until_next in self.held.items():
+            if until_next is None:
+                continue
+            if rate == 0:
+                if until_next <= millis:
+                    repeats.append((until_next, function))
+                    self.held[function] = None
+                else:
+                    self.held[function] = until_next - millis
+                continue
+
+            while until_next <= millis:
+                repeats.append((until_next, function))
+                until_next += rate
+            self.held[function] = until_next - millis
+
+        repeats.sort(key=lambda repeat: repeat[0])
+        return repeats
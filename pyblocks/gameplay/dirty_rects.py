@@ -0,0 +1,49 @@
+class DirtyRectTracker(object):
+    """
+    Works out which parts of the screen need to be redrawn by remembering what was drawn
+    in each named region on the last frame.
+    """
+
+    def __init__(self):
+        # name -> (rect, state) as of the last frame
+        self.regions = {}
+        self.full_redraw = True
+
+    def invalidate(self):
+        """ Forces the next frame to redraw the whole screen """
+        self.full_redraw = True
+
+    def update(self, regions):
+        """
+        Args:
+            regions (dict): maps a region name to a (rect, state) tuple describing what is drawn
+                there this frame. 'state' is anything comparable that changes whenever the
+                region would look different. 'rect' may be None if nothing is drawn.
+
+        Returns:
+            list: the rects that changed since the last frame, including the old location of
+                anything that moved or is no longer drawn. None if the whole screen needs to be
+                redrawn.
+        """
+        previous = self.regions
+        self.regions = regions
+
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+
+        dirty = []
+        for name, (rect, state) in regions.items():
+            old = previous.get(name)
+            if old is not None and old[1] == state and old[0] == rect:
+                continue
+            if old is not None and old[0] is not None:
+                dirty.append(old[0])
+            if rect is not None:
+                dirty.append(rect)
+
+        # anything that isn't drawn any more has to be painted over where it was
+        for name, (rect, state) in previous.items():
+            if name not in regions and rect is not None:
+                dirty.append(rect)
+        return dirty
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+import pygame
+from ai.player import AiPlayer
+from gameplay.dirty_rects import DirtyRectTracker
 from screens.disposition_code import MenuAction
 from screens.gameover import GameOverScreen
 from gameplay.keys import GameKeys
@@ -15,6 +18,7 @@ class Mode(Enum):
     GAME_OVER = 5
     HIGH_SCORES = 6
     NAME_ENTRY = 7
+    DEMO = 8
 
 
 class GameEventHandler(ABC):
@@ -24,13 +28,20 @@ class GameEventHandler(ABC):
         pass
 
     @abstractmethod
-    def on_tick(self, millis, key):
+    def on_tick(self, millis, key_events):
         pass
 
     @abstractmethod
     def on_quit(self):
         pass
 
+    # Whether pygame should repeat held keys while this handler is running. Checked on
+    # every frame.
+    def wants_key_repeat(self):
+        return True
+
+    # Draws the screen. Returns the list of rects that changed, or None if the whole
+    # display should be updated.
     @staticmethod
     def on_render(self):
         pass
@@ -40,13 +51,18 @@ class GameEventHandler(ABC):
 class MenuHandler(GameEventHandler):
     DEFAULT_MODE = Mode.MENU
 
+    # How long the menu has to be left alone before the game starts playing itself
+    DEMO_IDLE_MILLIS = 30000
+
     def __init__(self, menu_screen, game_in_progress):
         self.menu = menu_screen
         self.game_in_progress = game_in_progress
+        self.idle_millis = 0
 
     # Return a tuple: (continue, new_mode)
     # - new_mode: the mode to enter, or None if staying in current mode.
     def on_key(self, key):
+        self.idle_millis = 0
         result = self.menu.on_key(key)
 
         if result == MenuAction.PLAY_GAME:
@@ -68,8 +84,14 @@ class MenuHandler(GameEventHandler):
 
     # called on every frame of the game while this handler's event loop is running
     # millis - the number of milliseconds since the last frame
-    # key - the key that was pressed in this frame
-    def on_tick(self, millis, key):
+    # key_events - the gameplay.input_queue.KeyEvents for the keys pressed in this frame
+    def on_tick(self, millis, key_events):
+        # Show off a demo game if nobody is around, but never over the top of a paused game
+        if self.game_in_progress:
+            return None
+        self.idle_millis += millis
+        if self.idle_millis >= MenuHandler.DEMO_IDLE_MILLIS:
+            return Mode.DEMO
         return None
 
     # Called upon leaving this event handler's loop (transitioning to a new mode)
@@ -100,7 +122,7 @@ class GameOverHandler(GameEventHandler):
         else:
             return GameOverHandler.DEFAULT_MODE
 
-    def on_tick(self, millis, key):
+    def on_tick(self, millis, key_events):
         return None
 
     def on_quit(self):
@@ -113,15 +135,22 @@ class GameOverHandler(GameEventHandler):
 class GamePlayHandler(GameEventHandler):
     DEFAULT_MODE = Mode.CONTINUE_GAME
 
-    def __init__(self, game_context, game_keys):
+    # dirty_rects - if True, only the parts of the screen that changed are sent to the display
+    def __init__(self, game_context, game_keys, dirty_rects=False):
         self.context = game_context
         self.paused = False
         self.game_keys = game_keys
+        self.dirty_rects = dirty_rects
+        self.dirty_tracker = DirtyRectTracker()
+        # Keys that were let go of in another mode never got to the game
+        self.context.gameplay.auto_repeat.release_all()
 
     def on_key(self, key):
         if key == self.game_keys.by_id(GameKeys.P):
             self.paused = not self.paused
+            self.context.gameplay.auto_repeat.release_all()
             self.context.bg_renderer.set_paused(self.paused)
+            self.dirty_tracker.invalidate()
 
         elif key == self.game_keys.by_id(GameKeys.ESCAPE):
             return Mode.MENU
@@ -129,10 +158,10 @@ class GamePlayHandler(GameEventHandler):
         return None
 
     # millis - the number of milliseconds since the last on_tick call
-    # key - the key pressed in this frame
-    def on_tick(self, millis, key):
+    # key_events - the gameplay.input_queue.KeyEvents for the keys pressed in this frame
+    def on_tick(self, millis, key_events):
         if not self.paused:
-            result = self.context.gameplay.on_tick(millis, key)
+            result = self.context.gameplay.on_tick(millis, key_events)
             if not result:
                 return Mode.GAME_OVER
 
@@ -141,13 +170,60 @@ class GamePlayHandler(GameEventHandler):
     def on_quit(self):
         pass
 
+    # Held keys are repeated by gameplay.auto_repeat during the game, but the pause screen
+    # is left to pygame
+    def wants_key_repeat(self):
+        return self.paused
+
     def on_render(self):
-        # TODO: if this wastes CPU time rendering, I can check if the board is
-        # dirty before rendering. Gameplay.on_tick() can return true if dirty.
+        if not self.dirty_rects:
+            self.render_screen()
+            return None
+
+        dirty = self.dirty_tracker.update(self.get_render_regions())
+        if dirty is None:
+            self.render_screen()
+            return None
+
+        # Draw everything as usual, but clipped so only the changed area is touched
+        if dirty:
+            screen = self.context.bg_renderer.screen
+            screen.set_clip(dirty[0].unionall(dirty[1:]))
+            self.render_screen()
+            screen.set_clip(None)
+        return dirty
+
+    def render_screen(self):
         self.context.bg_renderer.render_base_layer()
         self.context.board.render(self.context.block_renderer)
         self.context.bg_renderer.render_top_layer()
 
+    # Describes each part of the screen that can change during the game, along with the
+    # state that decides what it looks like
+    def get_render_regions(self):
+        board = self.context.board
+        bg_renderer = self.context.bg_renderer
+        score_keeper = self.context.score_keeper
+        piece = board.active_piece
+
+        incoming = pygame.Rect(bg_renderer.upcoming_box)
+        incoming_state = []
+        for queued in board.incoming_queue:
+            incoming.union_ip(board.get_piece_rect(queued))
+            incoming_state.append((type(queued), queued.rotation_index))
+
+        regions = {
+            'field': (pygame.Rect(board.get_field_rect()), board.backing_grid.version),
+            'piece': (pygame.Rect(board.get_piece_rect(piece)), (type(piece), piece.rotation_index)),
+            'incoming': (incoming, tuple(incoming_state)),
+            'score': (pygame.Rect(bg_renderer.score_box),
+                      (score_keeper.get_score(), score_keeper.get_rows(), score_keeper.get_difficulty()))
+        }
+        if board.show_ghost:
+            regions['ghost'] = (pygame.Rect(board.get_piece_rect(piece, board.get_ghost_y())),
+                                (type(piece), piece.rotation_index))
+        return regions
+
 
 # Handler for the screen that displays the high scores. This is not for
 # entering your initials.
@@ -166,7 +242,7 @@ class ScoreBoardHandler(GameEventHandler):
         else:
             return None
 
-    def on_tick(self, millis, key):
+    def on_tick(self, millis, key_events):
         return None
 
     def on_quit(self):
@@ -198,7 +274,7 @@ class NameEntryHandler(GameEventHandler):
 
         return None
 
-    def on_tick(self, millis, key):
+    def on_tick(self, millis, key_events):
         return None
 
     def on_quit(self):
@@ -206,3 +282,39 @@ class NameEntryHandler(GameEventHandler):
 
     def on_render(self):
         self.entry_screen.render()
+
+
+class DemoHandler(GamePlayHandler):
+    """ Lets the AI play a game by itself until any key is pressed or the game ends """
+    DEFAULT_MODE = Mode.DEMO
+
+    # How often the AI makes a move, so that it plays at a pace that can be watched
+    MOVE_MILLIS = 100
+
+    def __init__(self, game_context, game_keys, dirty_rects=False, player=None):
+        """
+        Args:
+            game_context (gameplay.game_context.GameContext): the demo game
+            game_keys (gameplay.keys.GameKeys): the game keys
+            dirty_rects (bool): see GamePlayHandler
+            player (ai.player.AiPlayer): plays the game. Defaults to the standard AI.
+        """
+        super().__init__(game_context, game_keys, dirty_rects)
+        self.player = player if player is not None else AiPlayer()
+        self.move_millis = 0
+
+    def on_key(self, key):
+        return Mode.MENU
+
+    def on_tick(self, millis, key_events):
+        gameplay = self.context.gameplay
+        self.move_millis += millis
+        if self.move_millis >= DemoHandler.MOVE_MILLIS:
+            self.move_millis = 0
+            action = self.player.next_action(gameplay)
+            if action is not None:
+                gameplay.apply_function(action)
+
+        if gameplay.game_over or not gameplay.on_tick(millis, None):
+            return Mode.MENU
+        return None
@@ -1,7 +1,10 @@
 from gameplay.game_component_builders import PygameContext
 from gameplay.event_handlers import *
+from gameplay.input_queue import InputQueue
 from pygame.constants import KEYDOWN
+from pygame.constants import KEYUP
 from pygame.constants import QUIT
+from sound.audio import SilentJukebox
 
 
 class Constants:
@@ -36,10 +39,10 @@ class Game(object):
 
         elif mode == Mode.NEW_GAME:
             self.game_context = self.game_context_builder.build_new_game_in_progress(self.game_params)
-            return GamePlayHandler(self.game_context, self.game_params.keys)
+            return GamePlayHandler(self.game_context, self.game_params.keys, self.game_params.dirty_rect_rendering)
 
         elif mode == Mode.CONTINUE_GAME:
-            return GamePlayHandler(self.game_context, self.game_params.keys)
+            return GamePlayHandler(self.game_context, self.game_params.keys, self.game_params.dirty_rect_rendering)
 
         elif mode == Mode.GAME_OVER:
             self.game_context.game_in_progress = False
@@ -50,6 +53,13 @@ class Game(object):
                 self.game_states.game_over_state, score,
                 self.game_params.high_score_reader)
 
+        elif mode == Mode.DEMO:
+            # The demo game is thrown away afterwards, so it is kept out of self.game_context.
+            # It plays over the menu music, so its sound effects are kept quiet.
+            demo_context = self.game_context_builder.build_new_game_in_progress(self.game_params, SilentJukebox())
+            demo_context.game_in_progress = False
+            return DemoHandler(demo_context, self.game_params.keys, self.game_params.dirty_rect_rendering)
+
         elif mode == Mode.HIGH_SCORES:
             return ScoreBoardHandler(self.game_states.high_scores_state, self.game_params.keys)
 
@@ -84,12 +94,25 @@ class GameLoop(object):
         self.event_handler = event_handler
         self.game_keys = game_keys
         self.clock = self.pygame_context.get_clock()
+        # every key pressed or released since the last frame, so that none are lost when several
+        # come at once
+        self.input_queue = InputQueue()
+        # whether pygame is repeating held keys. Unknown until the first frame.
+        self.key_repeat = None
 
     def run_event_loop(self):
         next_mode = None
 
         while next_mode is None:
-            key = None
+            key_repeat = self.event_handler.wants_key_repeat()
+            if key_repeat != self.key_repeat:
+                self.pygame_context.set_key_repeat(key_repeat)
+                self.key_repeat = key_repeat
+
+            # pygame doesn't say when each event happened, only what order they came in. They
+            # are all stamped with the start of the frame that handles them, which keeps them
+            # ahead of that frame's gravity.
+            frame_start = self.pygame_context.get_ticks()
             for event in self.pygame_context.get_events():
                 if event.type == QUIT:
                     next_mode = Mode.QUIT
@@ -98,12 +121,22 @@ class GameLoop(object):
                 elif event.type == KEYDOWN:
                     key = self.game_keys.from_pygame(event.key)
                     if key:
+                        self.input_queue.push(key, frame_start)
                         next_mode = self.event_handler.on_key(key)
 
+                elif event.type == KEYUP:
+                    # so that the game can tell when to stop repeating a held key
+                    key = self.game_keys.from_pygame(event.key)
+                    if key:
+                        self.input_queue.push(key, frame_start, pressed=False)
+
             if next_mode is None:
                 millis = int(1 / float(Constants.FRAME_RATE) * Constants.MILLISECONDS)
-                next_mode = self.event_handler.on_tick(millis, key)
-                self.event_handler.on_render()
-                self.pygame_context.flip_display()
+                next_mode = self.event_handler.on_tick(millis, self.input_queue.take_frame(frame_start, millis))
+                dirty_rects = self.event_handler.on_render()
+                if dirty_rects is None:
+                    self.pygame_context.flip_display()
+                else:
+                    self.pygame_context.update_display(dirty_rects)
                 self.clock.tick(Constants.FRAME_RATE)
         return next_mode
@@ -4,6 +4,8 @@ from gameboard.BlockRenderer import BlockRenderer
 from gameboard.Board import Board
 from gameplay.game_params import GameParams
 from gameplay.gameplay import Gameplay
+from gameplay.gfx_constants import GFX_CONSTANTS
+from gameplay.gfx_constants import PLAY_AREA_BOUNDARY_PIXELS
 from gameplay.game_context import GameContext
 from gameplay.game_context import GameStates
 from gameplay.game_state_builders import MenuStateBuilder
@@ -19,27 +21,6 @@ from scoreboard.highscorepersistence import HighScoreWriter
 from scoreboard.LeaderBoardScreen import LeaderBoardScreen
 from sound.audio import Jukebox
 
-GFX_CONSTANTS = {
-    # (x,y) size of the screen in pixels
-    "screen_size": (800, 600),
-    "block_width": 25,
-    "block_height": 25,
-    "field_width": 14,
-    "field_height": 17
-}
-
-x1_tmp = GFX_CONSTANTS["block_width"] * 5
-y1_tmp = GFX_CONSTANTS["block_height"] * 3
-# (x1, y1, x2, y2) boundary of the playable area (where the pieces can move)
-PLAY_AREA_BOUNDARY_PIXELS = (
-    x1_tmp,
-    y1_tmp,
-    GFX_CONSTANTS["block_width"] * GFX_CONSTANTS["field_width"] + x1_tmp,
-    GFX_CONSTANTS["block_height"] * GFX_CONSTANTS["field_height"] + y1_tmp
-)
-del x1_tmp
-del y1_tmp
-
 
 class HighScoreAccessorBuilder(object):
 
@@ -54,6 +35,10 @@ class HighScoreAccessorBuilder(object):
 
 
 class PygameContext(object):
+    # How pygame repeats held keys on screens that don't repeat keys themselves
+    KEY_REPEAT_DELAY_MILLIS = 250
+    KEY_REPEAT_INTERVAL_MILLIS = 75
+
     def __init__(self):
         self.display = None
         self.clock = pygame.time.Clock()
@@ -73,6 +58,19 @@ class PygameContext(object):
     def get_events():
         return pygame.event.get()
 
+    # Turns pygame's repeating of held keys on or off
+    @staticmethod
+    def set_key_repeat(enabled):
+        if enabled:
+            pygame.key.set_repeat(PygameContext.KEY_REPEAT_DELAY_MILLIS, PygameContext.KEY_REPEAT_INTERVAL_MILLIS)
+        else:
+            pygame.key.set_repeat()
+
+    # The number of milliseconds since pygame was initialized
+    @staticmethod
+    def get_ticks():
+        return pygame.time.get_ticks()
+
     @staticmethod
     def quit():
         pygame.quit()
@@ -81,6 +79,10 @@ class PygameContext(object):
     def flip_display():
         pygame.display.flip()
 
+    @staticmethod
+    def update_display(rects):
+        pygame.display.update(rects)
+
 
 class PygameContextBuilder(object):
 
@@ -96,10 +98,10 @@ class PygameContextBuilder(object):
         surface = pygame.display.set_mode(GFX_CONSTANTS["screen_size"], pygame.DOUBLEBUF, 32)
         pygame.display.set_caption("PyBlocks")
 
-        # set the key delay for holding down buttons
-        pygame.key.set_repeat(250, 75)
-
         pygame_context = PygameContext()
+        # set the key delay for holding down buttons. Gameplay turns this off while it runs,
+        # since it repeats held keys itself (see gameplay.auto_repeat).
+        pygame_context.set_key_repeat(True)
         pygame_context.display = surface
         return pygame_context
 
@@ -119,6 +121,8 @@ class GameParamsBuilder(object):
 
         params.jukebox = Jukebox(pygame.mixer)
 
+        params.dirty_rect_rendering = GFX_CONSTANTS["dirty_rect_rendering"]
+
         # stuff for controlling what the keys are
         params.keys = GameKeys()
         key_mapper = KeyMapper(params.keys)
@@ -187,8 +191,9 @@ class GameStatesBuilder(object):
 
 class GameContextBuilder(object):
 
+    # jukebox - plays the game's sound effects. Defaults to the one in game_params.
     @staticmethod
-    def build_new_game_in_progress(game_params: GameParams):
+    def build_new_game_in_progress(game_params: GameParams, jukebox=None):
         game_context = GameContext()
         game_context.game_in_progress = True
         game_context.score_keeper = ScoreKeeper()
@@ -211,7 +216,7 @@ class GameContextBuilder(object):
             game_context.board,
             game_params.geometry,
             game_context.score_keeper,
-            game_params.jukebox,
+            jukebox if jukebox is not None else game_params.jukebox,
             game_params.key_mapper)
 
         return game_context
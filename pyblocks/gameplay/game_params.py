@@ -10,6 +10,7 @@ class GameParams(object):
         self.key_mapper = None
         self.high_score_reader = None
         self.high_score_writer = None
+        self.dirty_rect_rendering = False
 
     @property
     def screen(self):
@@ -74,3 +75,11 @@ class GameParams(object):
     @high_score_writer.setter
     def high_score_writer(self, val):
         self._high_score_writer = val
+
+    @property
+    def dirty_rect_rendering(self):
+        return self._dirty_rect_rendering
+
+    @dirty_rect_rendering.setter
+    def dirty_rect_rendering(self, val):
+        self._dirty_rect_rendering = val
@@ -1,15 +1,18 @@
 from pieces.PieceFactory import PieceFactory
-from gameplay.keys import KeyFunction
+from gameplay.auto_repeat import AutoRepeat
+from gameplay.key_function import KeyFunction
 
 
 class Gameplay(object):
     # The number of pieces to show in the "coming next" box
     INCOMING_Q_SIZE = 3
 
-    def __init__(self, board, geometry, score_keeper, jukebox, key_mapper):
+    # randomizer - a PieceRandomizer to deal the pieces. By default they differ every game.
+    # auto_repeat - an AutoRepeat that decides how held keys repeat. Defaults to the standard timing.
+    def __init__(self, board, geometry, score_keeper, jukebox, key_mapper, randomizer=None, auto_repeat=None):
         self.board = board
         self.accumulated_time = 0
-        self.piece_factory = PieceFactory(geometry)
+        self.piece_factory = PieceFactory(geometry, randomizer)
         self.init_pieces()
         self.set_difficulty(20)
         self.game_over = False
@@ -18,9 +21,22 @@ class Gameplay(object):
         # keeps track of how far the piece has fallen. Affects
         # scorekeeping.
         self.num_clicks = 0
+        # the number of pieces that have landed this game
+        self.pieces_placed = 0
 
         # Get notifications when the user changes the game keys
         self.key_mapper = key_mapper
+        self.auto_repeat = auto_repeat if auto_repeat is not None else AutoRepeat()
+
+        # What each game function does to the active piece
+        self.actions = {
+            KeyFunction.MOVE_DOWN: self.move_down,
+            KeyFunction.MOVE_LEFT: self.board.move_left,
+            KeyFunction.MOVE_RIGHT: self.board.move_right,
+            KeyFunction.ROTATE_RIGHT: self.board.rotate_right,
+            KeyFunction.ROTATE_LEFT: self.board.rotate_left,
+            KeyFunction.DROP: self.drop_piece
+        }
 
     def init_pieces(self):
         initial_queue = []
@@ -38,27 +54,13 @@ class Gameplay(object):
         self.difficulty = 1000 - difficulty * 90
 
     def move_piece(self, key):
-        function = self.key_mapper.get_key_function(key)
-        if function < 0:
-            return
+        self.apply_function(self.key_mapper.get_key_function(key))
 
-        if function == KeyFunction.MOVE_DOWN:
-            self.move_down()
-
-        elif function == KeyFunction.MOVE_LEFT:
-            self.board.move_left()
-
-        elif function == KeyFunction.MOVE_RIGHT:
-            self.board.move_right()
-
-        elif function == KeyFunction.ROTATE_RIGHT:
-            self.board.rotate_right()
-
-        elif function == KeyFunction.ROTATE_LEFT:
-            self.board.rotate_left()
-
-        elif function == KeyFunction.DROP:
-            self.drop_piece()
+    # Performs a game function (a KeyFunction value) on the active piece
+    def apply_function(self, function):
+        action = self.actions.get(function)
+        if action is not None:
+            action()
 
     # try to move down. If the piece has landed, play the next piece. If
     # the piece landed at the top of the play area, invoke the game-over logic.
@@ -69,17 +71,19 @@ class Gameplay(object):
             if not outcome.still_playing:
                 self.handle_gameover()
             else:
+                self.pieces_placed += 1
                 self.play_piece_sound(outcome.num_rows)
                 self.score_keeper.on_move_complete(outcome.num_rows, self.num_clicks)
                 self.board.play_next_piece(self.piece_factory)
             self.num_clicks = 0
         return moved
 
+    # Land the piece at the bottom of its fall in one step. The scoring is the same as if
+    # it had been moved down one row at a time.
     def drop_piece(self):
         clicks = self.num_clicks
-        success = True
-        while success:
-            success = self.move_down()
+        self.board.drop_piece()
+        self.move_down()
         self.score_keeper.on_drop(clicks)
 
     def handle_gameover(self):
@@ -96,25 +100,64 @@ class Gameplay(object):
     def on_pause(self):
         pause_screen.render()
 
-    # called on every frame of the game loop. It includes the
-    # key that was pressed, if any, and the number of
-    # milliseconds since this method was last called. If
-    # multiple keys were pressed within the frame, this method
-    # will be called more than once with the same milliseconds
-    # value.
+    # called on every frame of the game loop.
+    # millis - the number of milliseconds since this method was last called
+    # key_events - a list of the gameplay.input_queue.KeyEvents for the keys pressed and
+    #   released during the frame, oldest first (or None). Every one of them is applied, in
+    #   order. Gravity and the auto repeat of held keys happen in between them, at the point
+    #   in the frame where they come due.
     #
     # Return true if game is still going. False if game over.
-    def on_tick(self, millis, key_event):
-        self.accumulated_time += millis
+    def on_tick(self, millis, key_events):
         self.set_difficulty(self.score_keeper.get_difficulty())
-        time_left = self.difficulty - self.accumulated_time
 
-        if key_event:
-            self.move_piece(key_event)
+        elapsed = 0
+        if key_events:
+            for event in key_events:
+                self.__advance(event.millis - elapsed)
+                elapsed = event.millis
+                if self.game_over:
+                    return False
+                self.__on_key_event(event)
 
-        if time_left < 0:
+        self.__advance(millis - elapsed)
+        return not self.game_over
+
+    def __on_key_event(self, event):
+        function = self.key_mapper.get_key_function(event.key)
+        if event.pressed:
+            self.apply_function(function)
+            self.auto_repeat.press(function)
+        else:
+            self.auto_repeat.release(function)
+
+    # Lets 'millis' of game time go by, repeating held keys and making the piece fall in
+    # the order they come due
+    def __advance(self, millis):
+        elapsed = 0
+        for repeat_millis, function in self.auto_repeat.advance(millis):
+            self.__apply_gravity(repeat_millis - elapsed)
+            elapsed = repeat_millis
+            if self.game_over:
+                return
+            self.__repeat_function(function)
+        self.__apply_gravity(millis - elapsed)
+
+    def __repeat_function(self, function):
+        if not self.auto_repeat.instant:
+            self.apply_function(function)
+        elif function == KeyFunction.MOVE_LEFT:
+            self.board.shift_to_wall(-1)
+        elif function == KeyFunction.MOVE_RIGHT:
+            self.board.shift_to_wall(1)
+        elif function == KeyFunction.MOVE_DOWN:
+            # all the way down, but left to gravity to land
+            self.board.drop_piece()
+
+    # Lets 'millis' of game time go by, moving the piece down if it's been falling long enough
+    def __apply_gravity(self, millis):
+        self.accumulated_time += millis
+        if self.accumulated_time > self.difficulty:
             self.accumulated_time = 0
             self.num_clicks += 1
             self.move_down()
-
-        return not self.game_over
@@ -0,0 +1,22 @@
+GFX_CONSTANTS = {
+    # (x,y) size of the screen in pixels
+    "screen_size": (800, 600),
+    "block_width": 25,
+    "block_height": 25,
+    "field_width": 14,
+    "field_height": 17,
+    # Only push the parts of the screen that changed to the display during gameplay
+    "dirty_rect_rendering": True
+}
+
+x1_tmp = GFX_CONSTANTS["block_width"] * 5
+y1_tmp = GFX_CONSTANTS["block_height"] * 3
+# (x1, y1, x2, y2) boundary of the playable area (where the pieces can move)
+PLAY_AREA_BOUNDARY_PIXELS = (
+    x1_tmp,
+    y1_tmp,
+    GFX_CONSTANTS["block_width"] * GFX_CONSTANTS["field_width"] + x1_tmp,
+    GFX_CONSTANTS["block_height"] * GFX_CONSTANTS["field_height"] + y1_tmp
+)
+del x1_tmp
+del y1_tmp
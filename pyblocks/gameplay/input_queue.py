@@ -0,0 +1,54 @@
+from collections import namedtuple
+
+# A key going down or up, to be handled during a frame.
+#  key: the gameplay.keys.Key that was pressed or released
+#  millis: how far into the frame it happened, from 0 up to the length of the frame
+#  pressed: True if the key went down, False if it was let go
+KeyEvent = namedtuple("KeyEvent", ["key", "millis", "pressed"], defaults=[True])
+
+
+class InputQueue(object):
+    """
+    Holds on to every key press and release between frames, so that a frame can handle all of
+    them in the order they happened instead of only the last one. Like the rest of the game
+    logic, this does not use pygame, so times are given in milliseconds on whatever clock the
+    caller uses.
+    """
+
+    def __init__(self):
+        # (key, time, pressed) in the order they were pushed
+        self.pending = []
+
+    def __len__(self):
+        return len(self.pending)
+
+    def push(self, key, time, pressed=True):
+        """
+        Args:
+            key (gameplay.keys.Key): the key that was pressed or released
+            time (int): when it happened
+            pressed (bool): True if the key went down, False if it was let go
+        """
+        self.pending.append((key, time, pressed))
+
+    def take_frame(self, frame_start, millis):
+        """
+        Empties the queue into the events for one frame.
+
+        Args:
+            frame_start (int): the time the frame started, on the same clock as push()
+            millis (int): the length of the frame
+
+        Returns:
+            list: a KeyEvent for everything pushed since the last call, oldest first. Times
+                are made relative to frame_start, and anything outside of the frame is
+                moved to its start or end, so that the order is never changed.
+        """
+        events = []
+        latest = 0
+        for key, time, pressed in self.pending:
+            offset = min(max(time - frame_start, latest), millis)
+            events.append(KeyEvent(key, offset, pressed))
+            latest = offset
+        self.pending = []
+        return events
@@ -0,0 +1,10 @@
+# The game functions that keys can be mapped to. This lives apart from the rest of the key
+# handling in gameplay.keys so that game logic can use it without importing pygame.
+class KeyFunction(object):
+    INVALID = 0
+    MOVE_DOWN = 1
+    MOVE_LEFT = 2
+    MOVE_RIGHT = 3
+    ROTATE_LEFT = 4
+    ROTATE_RIGHT = 5
+    DROP = 6
@@ -1,5 +1,6 @@
 import pygame
 from collections import namedtuple
+from gameplay.key_function import KeyFunction
 
 # This module manages the keys that can be used in the game. It has
 # functionality to:
@@ -118,16 +119,6 @@ class GameKeys(object):
             return None
 
 
-class KeyFunction(object):
-    INVALID = 0
-    MOVE_DOWN = 1
-    MOVE_LEFT = 2
-    MOVE_RIGHT = 3
-    ROTATE_LEFT = 4
-    ROTATE_RIGHT = 5
-    DROP = 6
-
-
 class KeyChangePublisher(object):
     def __init__(self):
         self.listeners = []
@@ -157,15 +148,24 @@ class KeyMapper(object):
         self.keys[KeyFunction.ROTATE_RIGHT] = self.game_keys.by_id(GameKeys.X)
         self.keys[KeyFunction.DROP] = self.game_keys.by_id(self.game_keys.SPACE)
 
+        # key -> function, so that looking up what a key press does doesn't mean searching
+        # through the mappings above. Kept in step with them by on_key_change.
+        self.functions = {}
+        self.__build_function_map()
+
+    # If more than one function is mapped to a key, the key does the first of them
+    def __build_function_map(self):
+        self.functions.clear()
+        for function, key in self.keys.items():
+            self.functions.setdefault(key, function)
+
     def on_key_change(self, key_function, new_key):
         self.keys[key_function] = new_key
+        self.__build_function_map()
 
     # key is a GameKeys value
     def get_key_function(self, key):
-        for f, k in self.keys.items():
-            if k == key:
-                return f
-        return KeyFunction.INVALID
+        return self.functions.get(key, KeyFunction.INVALID)
 
     def get_key_by_function(self, function):
         if function in self.keys:
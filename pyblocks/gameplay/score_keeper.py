@@ -1,11 +1,14 @@
-import pygame
-
-
 # Houses the algorithm for keeping score and determining
 # which difficulty level the player is on.
 class ScoreKeeper(object):
     # How many rows to complete before increasing difficulty
     ROWS_PER_LEVEL = 7
+    # Points per row cleared, which also goes up with the number of rows and the difficulty
+    ROW_POINTS = 10
+    # The most bonus points for landing a piece, one less for each click it has fallen
+    LANDING_BONUS = 5
+    # The most bonus points for dropping a piece, one less for each click it has fallen
+    DROP_BONUS = 7
 
     def __init__(self):
         self.score = 0
@@ -21,14 +24,14 @@ class ScoreKeeper(object):
         self.difficulty = ScoreKeeper.calculate_difficulty(self.rows)
 
         if num_rows > 0:
-            increment = num_rows * 10 * num_rows * self.difficulty
+            increment = ScoreKeeper.calculate_row_points(num_rows, self.difficulty)
         else:
             increment = self.difficulty
 
         # calculate bonus points for landing a piece near the top where it's more difficult
         bonus = 0
-        if num_clicks < 5:
-            bonus = 5 - num_clicks
+        if num_clicks < ScoreKeeper.LANDING_BONUS:
+            bonus = ScoreKeeper.LANDING_BONUS - num_clicks
 
         self.score += increment
         self.score += bonus
@@ -42,8 +45,8 @@ class ScoreKeeper(object):
     #   that the higher the piece is dropped from, the more points.
     def on_drop(self, num_clicks):
         extra = 0
-        if num_clicks <= 7:
-            extra = 7 - num_clicks
+        if num_clicks <= ScoreKeeper.DROP_BONUS:
+            extra = ScoreKeeper.DROP_BONUS - num_clicks
         self.score += extra
 
     def get_score(self):
@@ -60,3 +63,8 @@ class ScoreKeeper(object):
     @staticmethod
     def calculate_difficulty(rows):
         return rows // ScoreKeeper.ROWS_PER_LEVEL + 1
+
+    # The points for clearing num_rows rows at once on the given difficulty level
+    @staticmethod
+    def calculate_row_points(num_rows, difficulty):
+        return num_rows * ScoreKeeper.ROW_POINTS * num_rows * difficulty
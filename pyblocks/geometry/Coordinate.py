@@ -11,55 +11,63 @@ class Coordinate:
     # origin being the top left of the playing area (area where pieces can move)
     PLAYING_FIELD = 3
 
+    # The position is stored in playing field squares (x, y), since that is what movement
+    # and collision checks work in. A position given in pixels may fall partway into a
+    # square, so the leftover pixels are kept in (dx, dy). They are 0 for anything set in
+    # squares, which keeps the common conversions down to an addition.
+    # 'layout' is the Geometry's precomputed GeometryLayout.
+    __slots__ = ('layout', 'x', 'y', 'dx', 'dy')
+
     def __init__(self, x, y, geometry, type):
-        self.geometry = geometry
-        if type == Coordinate.PIXEL:
-            self.x = x
-            self.y = y
-        elif type == Coordinate.GRID:
-            self.x = x * geometry.get_block_width()
-            self.y = y * geometry.get_block_height()
-        elif type == Coordinate.PLAYING_FIELD:
-            # they gave us a position relative to the playing field.
-            # convert it to an absolute position
-            self.x = x * geometry.get_block_width() + geometry.get_left_boundary_px()
-            self.y = y * geometry.get_block_width() + geometry.get_upper_boundary_px()
+        self.layout = geometry.layout
+        self.setX(x, type)
+        self.setY(y, type)
 
     # if type is PLAYING_FIELD, the return is in grid coordinates relative to the playing field boundary
     def getX(self, type):
-        if type == Coordinate.PIXEL:
-            return self.x
-        elif type == Coordinate.GRID:
-            return self.x // self.geometry.get_block_width()
+        if type == Coordinate.GRID:
+            if self.dx == 0:
+                return self.x + self.layout.left_grid
+            return self.getX(Coordinate.PIXEL) // self.layout.block_width
         elif type == Coordinate.PLAYING_FIELD:
-            grid_x = self.x // self.geometry.get_block_width()
-            grid_x_field = self.geometry.get_left_boundary_px() // self.geometry.get_block_width()
-            return grid_x - grid_x_field
+            if self.dx == 0:
+                return self.x
+            return self.getX(Coordinate.GRID) - self.layout.left_grid
+        elif type == Coordinate.PIXEL:
+            return self.x * self.layout.block_width + self.layout.left_px + self.dx
 
     def getY(self, type):
-        if type == Coordinate.PIXEL:
-            return self.y
-        elif type == Coordinate.GRID:
-            return self.y // self.geometry.get_block_height()
+        if type == Coordinate.GRID:
+            if self.dy == 0:
+                return self.y + self.layout.upper_grid
+            return self.getY(Coordinate.PIXEL) // self.layout.block_height
         elif type == Coordinate.PLAYING_FIELD:
-            grid_y = self.y // self.geometry.get_block_height()
-            grid_y_field = self.geometry.get_upper_boundary_px() // self.geometry.get_block_height()
-            return grid_y - grid_y_field
+            if self.dy == 0:
+                return self.y
+            return self.getY(Coordinate.GRID) - self.layout.upper_grid
+        elif type == Coordinate.PIXEL:
+            return self.y * self.layout.block_height + self.layout.upper_px + self.dy
 
     def setX(self, new_x, type):
-        if type == Coordinate.PIXEL:
+        if type == Coordinate.PLAYING_FIELD:
             self.x = new_x
-        elif type == Coordinate.GRID:
-            self.x = new_x * self.geometry.get_block_width()
-        elif type == Coordinate.PLAYING_FIELD:
-            new_x_pixels = new_x * self.geometry.get_block_width()
-            self.x = new_x_pixels + self.geometry.get_left_boundary_px()
+            self.dx = 0
+        elif type == Coordinate.GRID and self.layout.x_aligned:
+            self.x = new_x - self.layout.left_grid
+            self.dx = 0
+        else:
+            if type == Coordinate.GRID:
+                new_x *= self.layout.block_width
+            self.x, self.dx = divmod(new_x - self.layout.left_px, self.layout.block_width)
 
     def setY(self, new_y, type):
-        if type == Coordinate.PIXEL:
+        if type == Coordinate.PLAYING_FIELD:
             self.y = new_y
-        elif type == Coordinate.GRID:
-            self.y = new_y * self.geometry.get_block_height()
-        elif type == Coordinate.PLAYING_FIELD:
-            new_y_pixels = new_y * self.geometry.get_block_width()
-            self.y = new_y_pixels + self.geometry.get_upper_boundary_px()
+            self.dy = 0
+        elif type == Coordinate.GRID and self.layout.y_aligned:
+            self.y = new_y - self.layout.upper_grid
+            self.dy = 0
+        else:
+            if type == Coordinate.GRID:
+                new_y *= self.layout.block_height
+            self.y, self.dy = divmod(new_y - self.layout.upper_px, self.layout.block_height)
@@ -1,3 +1,46 @@
+from collections import namedtuple
+
+# Every boundary and size derived from a Geometry, computed once. The *_px values are
+# pixels, *_grid values are squares from the top left of the screen and *_field values
+# are squares from the top left of the playing field.
+GeometryLayout = namedtuple("GeometryLayout", [
+    "block_width", "block_height",
+    "left_px", "right_px", "upper_px", "lower_px",
+    "left_grid", "right_grid", "upper_grid", "lower_grid",
+    "left_field", "right_field", "upper_field", "lower_field",
+    "play_area_width", "play_area_height",
+    # whether the playing field starts exactly on a grid line
+    "x_aligned", "y_aligned"
+])
+
+
+def _build_layout(block_width, block_height, playing_field):
+    left_px, upper_px, right_px, lower_px = playing_field
+    left_grid = left_px // block_width
+    right_grid = right_px // block_width
+    upper_grid = upper_px // block_height
+    lower_grid = lower_px // block_height
+    return GeometryLayout(
+        block_width=block_width,
+        block_height=block_height,
+        left_px=left_px,
+        right_px=right_px,
+        upper_px=upper_px,
+        lower_px=lower_px,
+        left_grid=left_grid,
+        right_grid=right_grid,
+        upper_grid=upper_grid,
+        lower_grid=lower_grid,
+        left_field=0,
+        right_field=(right_px - left_px) // block_width,
+        upper_field=0,
+        lower_field=(lower_px - upper_px) // block_height,
+        play_area_width=right_grid - left_grid,
+        play_area_height=lower_grid - upper_grid,
+        x_aligned=left_px % block_width == 0,
+        y_aligned=upper_px % block_height == 0)
+
+
 class Geometry(object):
 
     # param: block_width - the width of one square of the playing grid
@@ -8,6 +51,9 @@ class Geometry(object):
         self.block_width = block_width
         self.block_height = block_height
         self.playing_field = playable_field
+        # Everything below is derived from these, so work it out once. Hot paths can
+        # read the attributes straight off of the layout.
+        self.layout = _build_layout(block_width, block_height, playable_field)
 
     def get_block_width(self):
         return self.block_width
@@ -16,46 +62,43 @@ class Geometry(object):
         return self.block_height
 
     def get_play_area_width(self):
-        return self.get_right_boundary_grid() - self.get_left_boundary_grid()
+        return self.layout.play_area_width
 
     def get_play_area_height(self):
-        return self.get_lower_boundary_grid() - self.get_upper_boundary_grid()
+        return self.layout.play_area_height
 
     def get_left_boundary_px(self):
-        return self.playing_field[0]
+        return self.layout.left_px
 
     def get_left_boundary_grid(self):
-        return self.get_left_boundary_px() // self.block_width
+        return self.layout.left_grid
 
     def get_left_boundary_playing_field(self):
-        return 0
+        return self.layout.left_field
 
     def get_right_boundary_px(self):
-        return self.playing_field[2]
+        return self.layout.right_px
 
     def get_right_boundary_playing_field(self):
-        # TODO: store the width and height in the constructor instead of calculating each time
-        width_px = self.get_right_boundary_px() - self.get_left_boundary_px()
-        return width_px // self.block_width
+        return self.layout.right_field
 
     def get_right_boundary_grid(self):
-        return self.get_right_boundary_px() // self.block_width
+        return self.layout.right_grid
 
     def get_upper_boundary_px(self):
-        return self.playing_field[1]
+        return self.layout.upper_px
 
     def get_upper_boundary_grid(self):
-        return self.get_upper_boundary_px() // self.block_width
+        return self.layout.upper_grid
 
     def get_upper_boundary_playing_field(self):
-        return 0
+        return self.layout.upper_field
 
     def get_lower_boundary_px(self):
-        return self.playing_field[3]
+        return self.layout.lower_px
 
     def get_lower_boundary_grid(self):
-        return self.get_lower_boundary_px() // self.block_width
+        return self.layout.lower_grid
 
     def get_lower_boundary_playing_field(self):
-        height_px = self.get_lower_boundary_px() - self.get_upper_boundary_px()
-        return height_px // self.block_width
+        return self.layout.lower_field
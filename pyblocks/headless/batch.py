@@ -0,0 +1,199 @@
+import argparse
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from ai.player import AiPlayer
+from gameplay.key_function import KeyFunction
+from headless.engine import HeadlessGame
+from pyblocks.pieces.PieceRandomizer import STRATEGIES
+
+# Runs many headless games in parallel and summarises how they went. From the pyblocks directory:
+#   python -m headless.batch --games 1000 --policy random
+
+# The outcome of one simulated game. 'duration' is wall clock seconds.
+GameResult = namedtuple("GameResult", ["seed", "score", "rows", "level", "pieces_placed", "frames", "duration"])
+
+
+class Policy(ABC):
+    """ Decides what to do on each frame of a headless game """
+
+    @abstractmethod
+    def choose_action(self, game):
+        """
+        Args:
+            game (headless.engine.HeadlessGame): the game being played
+
+        Returns:
+            int: a KeyFunction value, or None to do nothing this frame
+        """
+        pass
+
+
+class RandomPolicy(Policy):
+    """ Mashes keys at random, dropping the piece every so often """
+    ACTIONS = [None, KeyFunction.MOVE_LEFT, KeyFunction.MOVE_RIGHT, KeyFunction.MOVE_DOWN,
+               KeyFunction.ROTATE_LEFT, KeyFunction.ROTATE_RIGHT]
+    DROP_CHANCE = 0.05
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def choose_action(self, game):
+        if self.rng.random() < RandomPolicy.DROP_CHANCE:
+            return KeyFunction.DROP
+        return self.rng.choice(RandomPolicy.ACTIONS)
+
+
+class AiPolicy(Policy):
+    """ Plays with the built-in AI, which always plays the same way so it ignores the seed """
+
+    def __init__(self, seed):
+        self.player = AiPlayer()
+
+    def choose_action(self, game):
+        return self.player.next_action(game.gameplay)
+
+
+# The policies that can be picked by name from the command line
+POLICIES = {
+    "random": RandomPolicy,
+    "ai": AiPolicy
+}
+
+
+def play_game(seed, policy_factory, max_frames, strategy="uniform"):
+    """
+    Plays one game to the end (or until max_frames have gone by).
+
+    Args:
+        seed (int): seeds the piece sequence and the policy
+        policy_factory (callable): called with the seed to make the Policy. Has to be
+            picklable (e.g. a Policy subclass) so that it can be sent to worker processes.
+        max_frames (int): stop the game after this many frames even if it isn't over
+        strategy (str): the piece randomizer strategy (see PieceRandomizer)
+
+    Returns:
+        GameResult
+    """
+    start = time.perf_counter()
+    policy = policy_factory(seed)
+    game = HeadlessGame(seed=seed, strategy=strategy)
+
+    frames = 0
+    playing = True
+    while playing and frames < max_frames:
+        # the frame that ends the game still counts
+        playing = game.step(policy.choose_action(game))
+        frames += 1
+
+    score_keeper = game.score_keeper
+    return GameResult(seed, score_keeper.get_score(), score_keeper.get_rows(), score_keeper.get_difficulty(),
+                      game.gameplay.pieces_placed, frames, time.perf_counter() - start)
+
+
+def play_games(seeds, policy_factory, max_frames, strategy="uniform"):
+    """
+    Plays one game per seed, one after the other. See play_game().
+
+    Returns:
+        list: a GameResult for each seed, in the same order
+    """
+    return [play_game(seed, policy_factory, max_frames, strategy) for seed in seeds]
+
+
+def run_batch(seeds, policy_factory, workers=None, max_frames=100000, strategy="uniform"):
+    """
+    Plays one game per seed across a pool of worker processes.
+
+    Args:
+        seeds (list): one seed per game
+        policy_factory (callable): see play_game()
+        workers (int): the number of processes. Defaults to the number of CPUs.
+        max_frames (int): see play_game()
+        strategy (str): see play_game()
+
+    Returns:
+        iterator: a GameResult for each seed, yielded as soon as the chunk of games it was
+            played in finishes. They don't come back in the order of 'seeds', so use each
+            result's seed to tell them apart.
+    """
+    workers = workers or os.cpu_count() or 1
+    # Hand out the games in chunks to keep the overhead of talking to the workers down,
+    # while leaving enough chunks that the workers finish at about the same time
+    chunksize = max(1, len(seeds) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = [executor.submit(play_games, seeds[start:start + chunksize], policy_factory, max_frames, strategy)
+                  for start in range(0, len(seeds), chunksize)]
+        for chunk in as_completed(chunks):
+            yield from chunk.result()
+
+
+class BatchReport(object):
+    """ Aggregates GameResults as they come in """
+    FIELDS = ["score", "rows", "level", "pieces_placed", "frames", "duration"]
+
+    def __init__(self):
+        self.games = 0
+        self.totals = dict((field, 0) for field in BatchReport.FIELDS)
+        self.minimums = {}
+        self.maximums = {}
+        self.wall_time = 0
+
+    def add(self, result):
+        self.games += 1
+        for field in BatchReport.FIELDS:
+            value = getattr(result, field)
+            self.totals[field] += value
+            self.minimums[field] = min(value, self.minimums.get(field, value))
+            self.maximums[field] = max(value, self.maximums.get(field, value))
+
+    def mean(self, field):
+        return self.totals[field] / self.games if self.games else 0
+
+    def format(self):
+        lines = ["{} games in {:.2f}s".format(self.games, self.wall_time),
+                 "{:<14} {:>12} {:>12} {:>12}".format("", "mean", "min", "max")]
+        for field in BatchReport.FIELDS:
+            lines.append("{:<14} {:>12.2f} {:>12.2f} {:>12.2f}".format(
+                field, self.mean(field), self.minimums.get(field, 0), self.maximums.get(field, 0)))
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many headless games")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the number of CPUs")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the first game")
+    parser.add_argument("--max-frames", type=int, default=100000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--randomizer", choices=sorted(STRATEGIES), default="uniform",
+                        help="how the piece sequence is generated")
+    parser.add_argument("--results", help="also write every game's result to this CSV file")
+    args = parser.parse_args()
+
+    seeds = list(range(args.seed, args.seed + args.games))
+    report = BatchReport()
+    results_file = open(args.results, "w") if args.results else None
+    try:
+        if results_file:
+            results_file.write(",".join(GameResult._fields) + "\n")
+        start = time.perf_counter()
+        for result in run_batch(seeds, POLICIES[args.policy], args.workers, args.max_frames, args.randomizer):
+            report.add(result)
+            if results_file:
+                results_file.write(",".join(str(value) for value in result) + "\n")
+        report.wall_time = time.perf_counter() - start
+    finally:
+        if results_file:
+            results_file.close()
+
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from gameboard.Board import Board
+from gameplay.gameplay import Gameplay
+from gameplay.gfx_constants import GFX_CONSTANTS
+from gameplay.gfx_constants import PLAY_AREA_BOUNDARY_PIXELS
+from gameplay.score_keeper import ScoreKeeper
+from geometry.Geometry import Geometry
+from pyblocks.pieces.PieceRandomizer import PieceRandomizer
+from sound.audio import SilentJukebox
+
+# This module runs the game with no display, sound or keyboard, and must never import
+# pygame (directly or through anything it imports). Actions are KeyFunction values.
+
+# The length of one frame of the interactive game, which runs at 60 FPS
+FRAME_MILLIS = 16
+
+
+def build_default_geometry():
+    return Geometry(
+        GFX_CONSTANTS["block_width"],
+        GFX_CONSTANTS["block_height"],
+        PLAY_AREA_BOUNDARY_PIXELS)
+
+
+class HeadlessGame(object):
+    """
+    A complete game (spawning, gravity, movement, rotation, landing, scoring and game over)
+    driven by a stream of actions instead of the keyboard.
+    """
+
+    def __init__(self, geometry=None, seed=None, strategy="uniform"):
+        """
+        Args:
+            geometry (geometry.Geometry.Geometry): the board layout. Defaults to the one the
+                interactive game uses.
+            seed (int): games with the same seed and strategy get the same pieces. None
+                gives a different sequence every time.
+            strategy (str): the name of the piece randomizer strategy (see PieceRandomizer)
+        """
+        self.geometry = geometry if geometry is not None else build_default_geometry()
+        self.score_keeper = ScoreKeeper()
+        self.board = Board(self.geometry)
+        # Nothing ever draws this board
+        self.board.show_ghost = False
+        # there are no keys to map, since actions are given as game functions
+        self.gameplay = Gameplay(self.board, self.geometry, self.score_keeper, SilentJukebox(), None,
+                                 PieceRandomizer(seed, strategy))
+        self.elapsed_millis = 0
+
+    @property
+    def game_over(self):
+        return self.gameplay.game_over
+
+    def step(self, action=None, millis=FRAME_MILLIS):
+        """
+        Advances the game by one frame.
+
+        Args:
+            action (int): a KeyFunction value to perform at the start of the frame, or None
+            millis (int): how much game time the frame covers. Gravity uses this.
+
+        Returns:
+            bool: True if the game is still going
+        """
+        if self.game_over:
+            return False
+
+        if action:
+            self.gameplay.apply_function(action)
+        self.elapsed_millis += millis
+        return self.gameplay.on_tick(millis, None)
+
+    def run(self, actions, millis=FRAME_MILLIS):
+        """
+        Plays one frame per action until the actions run out or the game ends.
+
+        Args:
+            actions (iterable): KeyFunction values, or None for frames with no input
+
+        Returns:
+            bool: True if the game is still going
+        """
+        for action in actions:
+            if not self.step(action, millis):
+                return False
+        return not self.game_over
@@ -0,0 +1,104 @@
+from collections import namedtuple
+
+from gameplay.key_function import KeyFunction
+from geometry.Coordinate import Coordinate
+from headless.engine import FRAME_MILLIS
+from headless.engine import HeadlessGame
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+# A Gym-style reset()/step() interface over HeadlessGame, for training agents on the real
+# game one frame at a time. Like the engine, this must never import pygame.
+
+# What an agent sees after each reset or step.
+#  board: a read-only memoryview of the settled blocks, one unsigned 64-bit row bitmask per
+#      row, top row first (see BitboardGrid.row_view). It is a view of the live grid, not a
+#      copy, so it changes as the game goes on. numpy.asarray(board) wraps it without copying.
+#  piece: the type of the falling piece (an index into PieceFactory.PIECE_TYPES)
+#  x, y: the playing field coordinates of the falling piece's corner
+#  rotation: the index into the falling piece's 'fill_arrays'
+Observation = namedtuple("Observation", ["board", "piece", "x", "y", "rotation"])
+
+# piece class -> its index in PieceFactory.PIECE_TYPES
+_PIECE_TYPE_INDEX = dict((piece_class, index) for index, piece_class in enumerate(PieceFactory.PIECE_TYPES))
+
+
+class GameEnv(object):
+    """
+    One game behind reset(seed) and step(action). Each step is one frame of the game.
+    """
+
+    # Every action step() accepts. None does nothing for a frame.
+    ACTIONS = (None, KeyFunction.MOVE_LEFT, KeyFunction.MOVE_RIGHT, KeyFunction.MOVE_DOWN,
+               KeyFunction.ROTATE_LEFT, KeyFunction.ROTATE_RIGHT, KeyFunction.DROP)
+
+    def __init__(self, geometry=None, strategy="uniform", millis=FRAME_MILLIS):
+        """
+        Args:
+            geometry (geometry.Geometry.Geometry): the board layout. Defaults to the one the
+                interactive game uses. The playing field can be at most 64 columns wide.
+            strategy (str): the name of the piece randomizer strategy (see PieceRandomizer)
+            millis (int): how much game time each step covers
+        """
+        self.geometry = geometry
+        self.strategy = strategy
+        self.millis = millis
+        self.game = None
+
+    def reset(self, seed=None):
+        """
+        Starts a new game.
+
+        Args:
+            seed (int): games with the same seed get the same pieces. None gives a different
+                sequence every time.
+
+        Returns:
+            Observation
+        """
+        self.game = HeadlessGame(self.geometry, seed, self.strategy)
+        self.geometry = self.game.geometry
+        if self.game.board.backing_grid.row_view is None:
+            raise ValueError("The playing field is too wide to observe. It can be at most 64 columns.")
+        return self.observe()
+
+    def step(self, action):
+        """
+        Plays one frame.
+
+        Args:
+            action (int): one of ACTIONS
+
+        Returns:
+            tuple: (observation, reward, done, info). The reward is the points scored this
+                frame. done is True once the game is over, after which reset() has to be
+                called. info is a dict with the game's "score", "rows", "level" and
+                "pieces_placed" so far.
+        """
+        if self.game is None:
+            raise RuntimeError("reset() has to be called before step()")
+        if self.game.game_over:
+            raise RuntimeError("The game is over. Call reset() to start a new one.")
+
+        score_keeper = self.game.score_keeper
+        score = score_keeper.get_score()
+        playing = self.game.step(action, self.millis)
+        info = {
+            "score": score_keeper.get_score(),
+            "rows": score_keeper.get_rows(),
+            "level": score_keeper.get_difficulty(),
+            "pieces_placed": self.game.gameplay.pieces_placed
+        }
+        return self.observe(), info["score"] - score, not playing, info
+
+    def observe(self):
+        """
+        Returns:
+            Observation: the current state of the game, without stepping it
+        """
+        board = self.game.board
+        piece = board.active_piece
+        return Observation(board.backing_grid.row_view,
+                           _PIECE_TYPE_INDEX[type(piece)],
+                           piece.get_x(Coordinate.PLAYING_FIELD),
+                           piece.get_y(Coordinate.PLAYING_FIELD),
+                           piece.rotation_index)
@@ -0,0 +1,248 @@
+import numpy as np
+
+from gameplay.score_keeper import ScoreKeeper
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+# Plays many games at once, one placement per game per step, with every game's board held
+# in one NumPy array. This needs numpy, which is an optional dependency:
+#   pip install pyblocks[vector]
+#
+# Each step takes a rotation and column for the current piece of every game and drops the
+# piece straight down from the top of the board there, like the placements in ai.placements.
+# The piece shapes, landing rules and scoring are the same as in the real game.
+
+# The most rotations any piece has
+_MAX_ROTATIONS = max(len(piece_class.shapes) for piece_class in PieceFactory.PIECE_TYPES)
+# The tallest and widest any piece is
+_MAX_PIECE_HEIGHT = max(shape.height for piece_class in PieceFactory.PIECE_TYPES for shape in piece_class.shapes)
+_MAX_PIECE_WIDTH = max(shape.width for piece_class in PieceFactory.PIECE_TYPES for shape in piece_class.shapes)
+
+# Stands in for the profile of the columns to the right of a piece's shape, so that they never
+# decide where it lands or change the top of the stack
+_NOT_IN_SHAPE = 1 << 20
+
+
+def _shape_tables():
+    """
+    Returns:
+        tuple: the widths, row masks, bottom profiles and top profiles (see ShapeTable) of every
+            shape, and the number of rotations of each piece type. Shape
+            (piece type * _MAX_ROTATIONS + rotation) is at index [shape] of the widths and
+            [:, shape] of the others, so that looking up a batch of shapes gives one row per
+            cell of the shape. Pieces with fewer rotations repeat theirs, the same way
+            Piece.rotate() wraps around.
+    """
+    num_shapes = len(PieceFactory.PIECE_TYPES) * _MAX_ROTATIONS
+    widths = np.zeros(num_shapes, dtype=np.int64)
+    masks = np.zeros((_MAX_PIECE_HEIGHT, num_shapes), dtype=np.int64)
+    bottoms = np.full((_MAX_PIECE_WIDTH, num_shapes), -_NOT_IN_SHAPE, dtype=np.int64)
+    tops = np.full((_MAX_PIECE_WIDTH, num_shapes), _NOT_IN_SHAPE, dtype=np.int64)
+    num_rotations = np.zeros(len(PieceFactory.PIECE_TYPES), dtype=np.int64)
+    for piece_type, piece_class in enumerate(PieceFactory.PIECE_TYPES):
+        shapes = piece_class.shapes
+        num_rotations[piece_type] = len(shapes)
+        for rotation in range(_MAX_ROTATIONS):
+            shape = shapes[rotation % len(shapes)]
+            index = piece_type * _MAX_ROTATIONS + rotation
+            widths[index] = shape.width
+            masks[:shape.height, index] = shape.row_masks
+            bottoms[:shape.width, index] = shape.bottom_profile
+            tops[:shape.width, index] = shape.top_profile
+    return widths, masks, bottoms, tops, num_rotations
+
+
+_SHAPE_WIDTHS, _SHAPE_MASKS, _SHAPE_BOTTOMS, _SHAPE_TOPS, _NUM_ROTATIONS = _shape_tables()
+
+# The points for a drop from the top of the board: the landing bonus in
+# ScoreKeeper.on_move_complete() plus the ScoreKeeper.on_drop() bonus, with no clicks
+_DROP_BONUS = ScoreKeeper.LANDING_BONUS + ScoreKeeper.DROP_BONUS
+
+
+class VectorEnv(object):
+    """
+    A batch of games, stepped together with NumPy operations.
+
+    Each board is an array of row bitmasks, top row first, where bit x of a row is set if
+    column x is filled (the same layout as BitboardGrid.rows). There are a few extra rows
+    under the bottom of the playing field, which pieces never reach.
+
+    Like SurfaceProfile, the y of the highest filled cell of each column is kept up to date,
+    so a piece's landing row comes from a few lookups instead of a sweep down the board.
+
+    Every part of a step works on all of the games at once, so its cost is a fixed number of
+    NumPy calls whose work grows with the number of games. That is well short of the goal of
+    4096 games costing about as much as one HeadlessGame drop: they cost 11 to 15 times as
+    much (see benchmarks.bench_vector_env), and a single game costs more than the plain
+    engine. Use it for large batches, where each game costs a fraction of a microsecond.
+    """
+
+    def __init__(self, num_envs, width=14, height=17, seed=None):
+        """
+        Args:
+            num_envs (int): how many games to play at once
+            width (int): the number of columns in each board (62 at most)
+            height (int): the number of rows in each board
+            seed (int): seeds the piece sequences. None gives different pieces every time.
+        """
+        if width > 62:
+            raise ValueError("Boards can be at most 62 columns wide. Was " + str(width))
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.full_mask = (1 << width) - 1
+        self.rng = np.random.default_rng(seed)
+
+        self.boards = np.zeros((num_envs, height + _MAX_PIECE_HEIGHT), dtype=np.int64)
+        # tops[n, x] is the y of the highest filled cell in column x of game n (the height if
+        # it's empty). The extra columns on the right are scratch space, so a piece's columns
+        # can always be looked up as x to x + _MAX_PIECE_WIDTH - 1.
+        self.tops = np.zeros((num_envs, width + _MAX_PIECE_WIDTH - 1), dtype=np.int64)
+        # the type (index into PieceFactory.PIECE_TYPES) of the piece each game has to place
+        self.pieces = np.zeros(num_envs, dtype=np.int64)
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+        self.rows = np.zeros(num_envs, dtype=np.int64)
+        self.done = np.zeros(num_envs, dtype=bool)
+        self.pieces_placed = np.zeros(num_envs, dtype=np.int64)
+
+        # Flat views of the boards and tops. Gathering and scattering through flat indices is
+        # a good deal quicker than indexing the 2D arrays with a pair of index arrays.
+        self._flat_boards = self.boards.reshape(-1)
+        self._flat_tops = self.tops.reshape(-1)
+        self._board_starts = np.arange(num_envs) * self.boards.shape[1]
+        self._tops_starts = np.arange(num_envs) * self.tops.shape[1]
+        self._piece_rows = np.arange(_MAX_PIECE_HEIGHT)[:, None]
+        self._piece_columns = np.arange(_MAX_PIECE_WIDTH)[:, None]
+        self._field_rows = np.arange(height)
+        self._columns = np.arange(width, dtype=np.int64)
+        self.reset()
+
+    def reset(self, seed=None):
+        """
+        Starts every game again with an empty board.
+
+        Args:
+            seed (int): if given, reseeds the piece sequences
+
+        Returns:
+            numpy.ndarray: the observation (see observe())
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.__restart(np.arange(self.num_envs))
+        return self.observe()
+
+    def reset_done(self):
+        """
+        Starts the games that have ended again, leaving the others alone.
+
+        Returns:
+            numpy.ndarray: the indices of the games that were restarted
+        """
+        finished = np.flatnonzero(self.done)
+        if len(finished):
+            self.__restart(finished)
+        return finished
+
+    # which - the indices of the games to start again
+    def __restart(self, which):
+        self.boards[which] = 0
+        self.tops[which] = self.height
+        self.scores[which] = 0
+        self.rows[which] = 0
+        self.pieces_placed[which] = 0
+        self.done[which] = False
+        self.pieces[which] = self.rng.integers(len(PieceFactory.PIECE_TYPES), size=len(which))
+
+    def observe(self):
+        """
+        Returns:
+            numpy.ndarray: a (num_envs, height) view of the boards' row bitmasks. It is not a
+                copy, so it changes as the games are stepped.
+        """
+        return self.boards[:, :self.height]
+
+    def cells(self):
+        """
+        Returns:
+            numpy.ndarray: a new (num_envs, height, width) uint8 array, 1 where a cell is filled
+        """
+        return ((self.observe()[:, :, None] >> self._columns) & 1).astype(np.uint8)
+
+    def step(self, rotations, xs):
+        """
+        Drops every game's current piece.
+
+        Args:
+            rotations (numpy.ndarray): for each game, the index into the piece's 'fill_arrays'.
+                Wraps around like Piece.rotate().
+            xs (numpy.ndarray): for each game, the column of the piece's left edge. Clipped so
+                that the piece is on the board.
+
+        Returns:
+            tuple: (rewards, done) arrays. rewards holds the points each game scored this step,
+                and done is True for every game that has ended, including ones that had
+                already ended before this step (those are not changed).
+        """
+        height = self.height
+        playing = ~self.done
+        pieces = self.pieces
+        # The per-cell arrays below are (cell of the piece, game) rather than the other way
+        # around, since NumPy is much quicker at reducing over a long leading axis
+        rotations = np.asarray(rotations) % _NUM_ROTATIONS.take(pieces)
+        shapes = pieces * _MAX_ROTATIONS + rotations
+        xs = np.clip(xs, 0, self.width - _SHAPE_WIDTHS.take(shapes))
+
+        # The lowest cell of each of the piece's columns stops just above the top of the stack
+        # in that column
+        columns = self._tops_starts + xs + self._piece_columns
+        column_tops = self._flat_tops.take(columns)
+        landing_y = (column_tops - 1 - _SHAPE_BOTTOMS.take(shapes, axis=1)).min(axis=0)
+
+        # Like the real game, it's over when a piece can't get below the row it starts in
+        lost = playing & (landing_y <= 0)
+        placed = playing & ~lost
+
+        # Games that aren't placing anything OR nothing into a row below the playing field,
+        # and don't change the tops of their columns. Choosing the values for each game and
+        # then applying them to every cell is much cheaper than masking the per-cell arrays.
+        rows = self._board_starts + np.where(placed, landing_y, height) + self._piece_rows
+        masks = (_SHAPE_MASKS.take(shapes, axis=1) << xs) * placed
+        piece_rows = self._flat_boards.take(rows) | masks
+        # plain index assignment is quicker than ndarray.put() here
+        self._flat_boards[rows] = piece_rows
+        top_y = np.where(placed, landing_y, _NOT_IN_SHAPE)
+        self._flat_tops[columns] = np.minimum(column_tops, top_y + _SHAPE_TOPS.take(shapes, axis=1))
+
+        # only the rows the piece went into can have been completed
+        cleared = (piece_rows == self.full_mask).sum(axis=0)
+        if cleared.any():
+            self.__clear_rows(np.flatnonzero(cleared))
+
+        self.rows += cleared
+        difficulty = ScoreKeeper.calculate_difficulty(self.rows)
+        rewards = np.where(cleared > 0, ScoreKeeper.calculate_row_points(cleared, difficulty), difficulty) + _DROP_BONUS
+        rewards = np.where(placed, rewards, 0)
+        self.scores += rewards
+        self.pieces_placed += placed
+        self.done |= lost
+
+        self.pieces[placed] = self.rng.integers(len(PieceFactory.PIECE_TYPES), size=int(placed.sum()))
+        return rewards, self.done.copy()
+
+    # Removes every full row from the given games' boards, moving the rows above down
+    def __clear_rows(self, clearing):
+        height = self.height
+        boards = self.boards[clearing, :height]
+        full = boards == self.full_mask
+        cleared = full.sum(axis=1)
+
+        # A stable sort on "not full" puts the full rows first and keeps the rest in order.
+        # The full rows at the top then become the new empty rows.
+        order = np.argsort(~full, axis=1, kind='stable')
+        collapsed = np.take_along_axis(boards, order, axis=1)
+        collapsed[self._field_rows < cleared[:, None]] = 0
+        self.boards[clearing, :height] = collapsed
+
+        # Work out the tops of these boards again from scratch
+        filled = ((collapsed[:, :, None] >> self._columns) & 1).astype(bool)
+        self.tops[clearing, :self.width] = np.where(filled.any(axis=1), filled.argmax(axis=1), height)
@@ -33,6 +33,3 @@ class Bar(Piece):
 
     def get_color(self):
         return 'yellow'
-
-    def get_x_y_rota_delta(self, oldindex, newindex):
-        return self.rotation_table[oldindex][newindex]
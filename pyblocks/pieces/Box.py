@@ -21,6 +21,3 @@ class Box(Piece):
 
     def get_color(self):
         return 'green'
-
-    def get_x_y_rota_delta(self, oldindex, newindex):
-        return self.rotation_table[oldindex][newindex]
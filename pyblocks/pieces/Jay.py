@@ -29,8 +29,5 @@ class Jay(Piece):
     def get_fill_arrays(self):
         return self.fill_arrays
 
-    def get_x_y_rota_delta(self, oldindex, newindex):
-        return self.rotation_table[oldindex][newindex]
-
     def get_color(self):
         return 'brown'
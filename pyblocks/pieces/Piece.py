@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from geometry.Coordinate import Coordinate
+from pyblocks.pieces.ShapeTable import compile_shapes
 
 
 class Piece(ABC):
@@ -7,10 +8,27 @@ class Piece(ABC):
     ROTATION_R = 1
     ROTATION_L = -1
 
+    # Every orientation of the piece, precompiled from 'fill_arrays' when the subclass is defined
+    shapes = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, 'fill_arrays'):
+            cls.shapes = compile_shapes(cls)
+
     # param: geometry - defines the board and piece geometry (size and layout)
     def __init__(self, geometry):
         self.coord = Coordinate(0, 0, geometry, Coordinate.GRID)
         self.curr_rotation = 0
+        # the index into 'fill_arrays' (and 'shapes') for the current rotation
+        self.rotation_index = 0
+        self.shape = self.shapes[0]
+
+    # Puts the piece back in its starting orientation so it can be used again
+    def reset(self):
+        self.curr_rotation = 0
+        self.rotation_index = 0
+        self.shape = self.shapes[0]
 
     @abstractmethod
     def get_color(self):
@@ -20,32 +38,27 @@ class Piece(ABC):
     def get_fill_arrays(self):
         pass
 
-    @abstractmethod
-    def get_x_y_rota_delta(self, oldindex, newindex):
-        pass
-
     # Changes the stored orientation of the piece.
     # Returns a tuple of (deltaX, deltaY) to be applied to
     # the piece's current coordinates to determine the new coordinates
     # (a rotation CAN change where the corner of the piece is).
     def rotate(self, rotation):
-        oldindex = self.get_mask_index(self.get_fill_arrays())
+        old_shape = self.shape
         self.curr_rotation += rotation
-        newindex = self.get_mask_index(self.get_fill_arrays())
+        newindex = self.curr_rotation % len(self.shapes)
+        self.rotation_index = newindex
+        self.shape = self.shapes[newindex]
 
-        return self.get_x_y_rota_delta(oldindex, newindex)
-
-    # Get the index into 'fill_arrays' to use with the current rotation.
-    def get_mask_index(self, arrays, rotation=ROTATION_CURR):
-        target = self.curr_rotation + rotation
-        if target != 0:
-            target = target % len(arrays)
-        return target
+        return old_shape.rotation_deltas[newindex]
 
     def get_fill_mask(self, rotation=ROTATION_CURR):
-        arrays = self.get_fill_arrays()
-        index = self.get_mask_index(arrays, rotation)
-        return arrays[index]
+        if rotation == Piece.ROTATION_CURR:
+            return self.shape.fill_mask
+        return self.shapes[(self.curr_rotation + rotation) % len(self.shapes)].fill_mask
+
+    # The precompiled Shape for the current rotation
+    def get_shape(self):
+        return self.shape
 
     # The x-coordinate relative to the playable grid, in
     # block-sized units (i.e. not pixel position)
@@ -65,17 +78,8 @@ class Piece(ABC):
 
     # this takes the current rotation into account
     def get_height(self):
-        arrays = self.get_fill_arrays()
-        index = self.get_mask_index(arrays)
-        return len(arrays[index])
+        return self.shape.height
 
     # this takes the current rotation into account
     def get_width(self):
-        arrays = self.get_fill_arrays()
-        index = self.get_mask_index(arrays)
-        # The width is the maximum width of all rows in the piece
-        max_width = 0
-        for row in arrays[index]:
-            if len(row) > max_width:
-                max_width = len(row)
-        return max_width
+        return self.shape.width
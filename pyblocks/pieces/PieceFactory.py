@@ -1,4 +1,3 @@
-import random
 from pyblocks.pieces.Tee import Tee
 from pyblocks.pieces.Ess import Ess
 from pyblocks.pieces.Zee import Zee
@@ -6,38 +5,51 @@ from pyblocks.pieces.Bar import Bar
 from pyblocks.pieces.Box import Box
 from pyblocks.pieces.Jay import Jay
 from pyblocks.pieces.Ell import Ell
+from pyblocks.pieces.PieceRandomizer import NUM_PIECE_TYPES
+from pyblocks.pieces.PieceRandomizer import PieceRandomizer
 
 
 class PieceFactory(object):
     # The number of different pieces possible
-    NUM_PIECE_TYPES = 7
+    NUM_PIECE_TYPES = NUM_PIECE_TYPES
+
+    # The piece class for each piece type
+    PIECE_TYPES = (Tee, Ess, Bar, Zee, Box, Jay, Ell)
 
     # param: geometry - defines the geometry of the board (size, layout, etc)
-    def __init__(self, geometry):
+    # param: randomizer - a PieceRandomizer that decides which pieces random_piece() makes.
+    #        By default the pieces are different every game.
+    def __init__(self, geometry, randomizer=None):
         self.geometry = geometry
+        self.randomizer = randomizer if randomizer is not None else PieceRandomizer()
+
+        # Pieces that are done with and can be handed out again, one list per piece type.
+        # Once a game has been going for a bit, every piece comes from here.
+        self.pools = {piece_class: [] for piece_class in PieceFactory.PIECE_TYPES}
+        # how many pieces have been constructed, and how many were handed out from the pools
+        self.pieces_allocated = 0
+        self.pieces_reused = 0
 
     def make_piece(self, which_piece):
-        if which_piece == 0:
-            return Tee(self.geometry)
-        elif which_piece == 1:
-            return Ess(self.geometry)
-        elif which_piece == 2:
-            return Bar(self.geometry)
-        elif which_piece == 3:
-            return Zee(self.geometry)
-        elif which_piece == 4:
-            return Box(self.geometry)
-        elif which_piece == 5:
-            return Jay(self.geometry)
-        elif which_piece == 6:
-            return Ell(self.geometry)
-        else:
+        if not 0 <= which_piece < PieceFactory.NUM_PIECE_TYPES:
             print("Error: piece type out of range")
-            raise ValueError("Piece type out of range. Was " + which_piece)
+            raise ValueError("Piece type out of range. Was " + str(which_piece))
+
+        piece_class = PieceFactory.PIECE_TYPES[which_piece]
+        pool = self.pools[piece_class]
+        if pool:
+            self.pieces_reused += 1
+            piece = pool.pop()
+            piece.reset()
+            return piece
+
+        self.pieces_allocated += 1
+        return piece_class(self.geometry)
+
+    # Hands a piece back once nothing refers to it any more (e.g. after it has landed and
+    # been copied into the grid), so make_piece() can give it out again
+    def release(self, piece):
+        self.pools[type(piece)].append(piece)
 
     def random_piece(self):
-        # TODO: this doesn't seem very random. The python docs even
-        # say randrange isn't distributed properly because of floating
-        # point conversion.
-        type = random.randrange(0, PieceFactory.NUM_PIECE_TYPES)
-        return self.make_piece(type)
+        return self.make_piece(self.randomizer.next_type())
@@ -0,0 +1,91 @@
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+
+# The number of different pieces possible (see PieceFactory)
+NUM_PIECE_TYPES = 7
+
+
+# Decides the order the piece types come in
+class RandomizerStrategy(ABC):
+
+    # Returns a list of 'count' piece types (0 to NUM_PIECE_TYPES - 1), drawing from rng
+    @abstractmethod
+    def generate(self, rng, count):
+        pass
+
+
+# Every piece type is equally likely every time, independent of what came before
+class UniformStrategy(RandomizerStrategy):
+
+    def generate(self, rng, count):
+        return [rng.randrange(NUM_PIECE_TYPES) for _ in range(count)]
+
+
+# Deals out the piece types in shuffled bags of one of each, so every type comes up
+# exactly once in each group of NUM_PIECE_TYPES pieces
+class BagStrategy(RandomizerStrategy):
+
+    def __init__(self):
+        self.bag = []
+
+    def generate(self, rng, count):
+        types = []
+        while len(types) < count:
+            if not self.bag:
+                self.bag = list(range(NUM_PIECE_TYPES))
+                rng.shuffle(self.bag)
+            types.append(self.bag.pop())
+        return types
+
+
+# Picks at random but re-rolls a few times if the piece was one of the last few dealt,
+# which makes droughts and repeats rare without making the order predictable
+class HistoryStrategy(RandomizerStrategy):
+    HISTORY_SIZE = 4
+    ROLLS = 4
+
+    def __init__(self):
+        self.history = deque(maxlen=HistoryStrategy.HISTORY_SIZE)
+
+    def generate(self, rng, count):
+        types = []
+        for _ in range(count):
+            piece_type = rng.randrange(NUM_PIECE_TYPES)
+            for _ in range(HistoryStrategy.ROLLS - 1):
+                if piece_type not in self.history:
+                    break
+                piece_type = rng.randrange(NUM_PIECE_TYPES)
+            self.history.append(piece_type)
+            types.append(piece_type)
+        return types
+
+
+# The strategies that can be picked by name
+STRATEGIES = {
+    "uniform": UniformStrategy,
+    "bag": BagStrategy,
+    "history": HistoryStrategy
+}
+
+
+# Produces the sequence of piece types for one game. It has its own random number generator,
+# so a game with a given seed and strategy always gets the same pieces, no matter what else
+# is using random numbers.
+class PieceRandomizer(object):
+    # how many piece types to work out at a time
+    CHUNK_SIZE = 64
+
+    # param: seed - seeds this game's generator. None picks a different sequence every time.
+    # param: strategy - a RandomizerStrategy instance or the name of one in STRATEGIES
+    def __init__(self, seed=None, strategy="uniform"):
+        if isinstance(strategy, str):
+            strategy = STRATEGIES[strategy]()
+        self.strategy = strategy
+        self.rng = random.Random(seed)
+        self.upcoming = deque()
+
+    def next_type(self):
+        if not self.upcoming:
+            self.upcoming.extend(self.strategy.generate(self.rng, PieceRandomizer.CHUNK_SIZE))
+        return self.upcoming.popleft()
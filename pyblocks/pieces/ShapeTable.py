@@ -0,0 +1,46 @@
+from collections import namedtuple
+
+# Everything about one orientation of a piece that can be worked out ahead of time.
+#  fill_mask: the piece's bitmap for this orientation (one of its 'fill_arrays')
+#  width, height: the size of the bitmap, in blocks
+#  cells: (dx, dy) of every filled cell, relative to the piece's corner
+#  row_masks: one integer per row, where bit i is set if column i of that row is filled
+#  bottom_profile: for each column, the dy of the lowest filled cell in that column
+#  top_profile: for each column, the dy of the highest filled cell in that column
+#  rotation_deltas: the piece's rotation_table row for this orientation. Indexed by the
+#    orientation being rotated to, giving the (x', y') to add to the piece's coordinates.
+Shape = namedtuple("Shape", ["fill_mask", "width", "height", "cells", "row_masks",
+                             "bottom_profile", "top_profile", "rotation_deltas"])
+
+
+def _compile_shape(fill_mask, rotation_deltas):
+    height = len(fill_mask)
+    width = max(len(row) for row in fill_mask)
+
+    cells = []
+    row_masks = []
+    bottom_profile = [None] * width
+    top_profile = [None] * width
+    for dy, row in enumerate(fill_mask):
+        mask = 0
+        for dx, bit in enumerate(row):
+            if bit == 1:
+                cells.append((dx, dy))
+                mask |= 1 << dx
+                bottom_profile[dx] = dy
+                if top_profile[dx] is None:
+                    top_profile[dx] = dy
+        row_masks.append(mask)
+
+    return Shape(fill_mask, width, height, tuple(cells), tuple(row_masks),
+                 tuple(bottom_profile), tuple(top_profile), tuple(rotation_deltas))
+
+
+# Compiles every orientation of a Piece subclass.
+# Returns the shapes as a tuple indexed by rotation (the index into 'fill_arrays').
+def compile_shapes(piece_type):
+    shapes = []
+    for rotation, fill_mask in enumerate(piece_type.fill_arrays):
+        shape = _compile_shape(fill_mask, piece_type.rotation_table[rotation])
+        shapes.append(shape)
+    return tuple(shapes)
@@ -37,6 +37,3 @@ class Tee(Piece):
 
     def get_color(self):
         return 'blue'
-
-    def get_x_y_rota_delta(self, oldindex, newindex):
-        return self.rotation_table[oldindex][newindex]
@@ -22,8 +22,5 @@ class Zee(Piece):
     def get_fill_arrays(self):
         return self.fill_arrays
 
-    def get_x_y_rota_delta(self, oldindex, newindex):
-        return self.rotation_table[oldindex][newindex]
-
     def get_color(self):
         return 'orange'
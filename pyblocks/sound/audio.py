@@ -96,3 +96,16 @@ class Jukebox(object):
     def play_sound_multi_row(self):
         self.sounds['piece_land'].stop()
         self.sounds['multi_row'].play()
+
+
+# Stands in for Jukebox during gameplay when nothing should be heard, e.g. in headless
+# games and the demo that plays over the menu music
+class SilentJukebox(object):
+    def play_sound_piece_landed(self):
+        pass
+
+    def play_sound_one_row(self):
+        pass
+
+    def play_sound_multi_row(self):
+        pass
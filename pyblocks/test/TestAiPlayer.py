@@ -0,0 +1,61 @@
+import unittest
+
+from ai.player import AiPlayer
+from gameplay.key_function import KeyFunction
+from geometry.Coordinate import Coordinate
+from headless.batch import AiPolicy
+from headless.batch import play_game
+from headless.engine import HeadlessGame
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.Box import Box
+
+
+class TestAiPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.game = HeadlessGame(seed=4)
+        self.player = AiPlayer()
+
+    def play_pieces(self, count):
+        while self.game.gameplay.pieces_placed < count:
+            self.assertTrue(self.game.step(self.player.next_action(self.game.gameplay)))
+
+    def test_plays_and_clears_rows(self):
+        self.play_pieces(40)
+        self.assertGreater(self.game.score_keeper.get_rows(), 5)
+
+    def test_plans_end_with_a_drop(self):
+        actions = self.player.choose_moves(self.game.board)
+        self.assertEqual(KeyFunction.DROP, actions[-1])
+        self.assertNotIn(KeyFunction.DROP, actions[:-1])
+
+    def test_takes_the_row_clear(self):
+        # fill the bottom row apart from the four columns on the right
+        grid = self.game.board.backing_grid
+        for piece, x in ((Bar(self.game.geometry), 0), (Bar(self.game.geometry), 4), (Box(self.game.geometry), 8)):
+            piece.set_x(x, Coordinate.PLAYING_FIELD)
+            piece.set_y(grid.height - piece.get_height(), Coordinate.PLAYING_FIELD)
+            grid.add(piece)
+        bar = Bar(self.game.geometry)
+        bar.set_x(7, Coordinate.PLAYING_FIELD)
+        bar.set_y(0, Coordinate.PLAYING_FIELD)
+        self.game.board.active_piece = bar
+
+        self.player.choose_moves(self.game.board)
+        self.assertEqual(1, self.player.target.rows_cleared)
+
+    def test_keeps_going_when_piece_falls(self):
+        # let gravity pull the piece down partway through the plan
+        self.player.next_action(self.game.gameplay)
+        self.game.board.advance_piece()
+        self.game.board.advance_piece()
+        self.play_pieces(3)
+
+    def test_batch_policy(self):
+        result = play_game(1, AiPolicy, max_frames=300)
+        self.assertEqual(300, result.frames)
+        self.assertGreater(result.pieces_placed, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from gameplay.auto_repeat import AutoRepeat
+from gameplay.input_queue import KeyEvent
+from gameplay.key_function import KeyFunction
+from gameplay.keys import GameKeys
+from gameplay.keys import KeyMapper
+from geometry.Coordinate import Coordinate
+from headless.engine import HeadlessGame
+
+
+class TestAutoRepeat(unittest.TestCase):
+
+    def setUp(self):
+        self.repeat = AutoRepeat(delay_millis=100, rate_millis=30)
+
+    def test_repeats_after_the_delay_at_the_rate(self):
+        self.repeat.press(KeyFunction.MOVE_LEFT)
+        self.assertEqual([], self.repeat.advance(99))
+        self.assertEqual([(1, KeyFunction.MOVE_LEFT)], self.repeat.advance(16))
+        # due at 30 and 60 into this call, with 15 already used up
+        self.assertEqual([(15, KeyFunction.MOVE_LEFT), (45, KeyFunction.MOVE_LEFT)], self.repeat.advance(50))
+
+    def test_release_stops_repeating(self):
+        self.repeat.press(KeyFunction.MOVE_DOWN)
+        self.repeat.release(KeyFunction.MOVE_DOWN)
+        self.assertEqual([], self.repeat.advance(1000))
+
+    def test_only_movement_repeats(self):
+        self.repeat.press(KeyFunction.ROTATE_LEFT)
+        self.repeat.press(KeyFunction.DROP)
+        self.assertEqual([], self.repeat.advance(1000))
+
+    def test_latest_direction_wins(self):
+        self.repeat.press(KeyFunction.MOVE_LEFT)
+        self.repeat.advance(50)
+        self.repeat.press(KeyFunction.MOVE_RIGHT)
+        self.assertEqual([(100, KeyFunction.MOVE_RIGHT)], self.repeat.advance(100))
+
+    def test_repeats_are_in_time_order(self):
+        self.repeat.press(KeyFunction.MOVE_DOWN)
+        self.repeat.advance(20)
+        self.repeat.press(KeyFunction.MOVE_LEFT)
+        repeats = self.repeat.advance(200)
+        self.assertEqual(sorted(repeats), repeats)
+        self.assertEqual((80, KeyFunction.MOVE_DOWN), repeats[0])
+        self.assertEqual((100, KeyFunction.MOVE_LEFT), repeats[1])
+
+    def test_instant_repeat_comes_once(self):
+        repeat = AutoRepeat(delay_millis=50, rate_millis=0)
+        repeat.press(KeyFunction.MOVE_RIGHT)
+        self.assertEqual([], repeat.advance(40))
+        self.assertEqual([(10, KeyFunction.MOVE_RIGHT)], repeat.advance(20))
+        self.assertEqual([], repeat.advance(16))
+
+        # pressing it again starts over
+        repeat.release(KeyFunction.MOVE_RIGHT)
+        repeat.press(KeyFunction.MOVE_RIGHT)
+        self.assertEqual([(50, KeyFunction.MOVE_RIGHT)], repeat.advance(60))
+
+    def test_instant_repeat_is_not_repeated_by_empty_advances(self):
+        repeat = AutoRepeat(delay_millis=50, rate_millis=0)
+        repeat.press(KeyFunction.MOVE_LEFT)
+        repeats = repeat.advance(50)
+        for _ in range(5):
+            repeats += repeat.advance(0)
+        self.assertEqual([(50, KeyFunction.MOVE_LEFT)], repeats)
+
+
+class TestGameplayAutoRepeat(unittest.TestCase):
+    FRAME = 16
+
+    def start(self, auto_repeat):
+        game = HeadlessGame(seed=1)
+        game.gameplay.auto_repeat = auto_repeat
+        game.gameplay.key_mapper = KeyMapper(GameKeys())
+        self.gameplay = game.gameplay
+        self.board = game.board
+        self.keys = GameKeys()
+
+    def hold(self, key_id, millis):
+        key = self.keys.by_id(key_id)
+        self.gameplay.on_tick(TestGameplayAutoRepeat.FRAME, [KeyEvent(key, 0)])
+        for _ in range(millis // TestGameplayAutoRepeat.FRAME - 1):
+            self.gameplay.on_tick(TestGameplayAutoRepeat.FRAME, [])
+        self.gameplay.on_tick(TestGameplayAutoRepeat.FRAME, [KeyEvent(key, 0, False)])
+
+    def test_held_key_repeats(self):
+        self.start(AutoRepeat(delay_millis=100, rate_millis=50))
+        piece = self.board.active_piece
+        start_x = piece.get_x(Coordinate.PLAYING_FIELD)
+        # once for the press, then at 100 and 150 ms
+        self.hold(GameKeys.LEFT, 160)
+        self.assertEqual(start_x - 3, piece.get_x(Coordinate.PLAYING_FIELD))
+
+        # nothing more once it's been let go
+        for _ in range(20):
+            self.gameplay.on_tick(TestGameplayAutoRepeat.FRAME, [])
+        self.assertEqual(start_x - 3, piece.get_x(Coordinate.PLAYING_FIELD))
+
+    def test_instant_repeat_goes_straight_to_the_wall(self):
+        self.start(AutoRepeat(delay_millis=50, rate_millis=0))
+        piece = self.board.active_piece
+        self.hold(GameKeys.RIGHT, 64)
+        self.assertEqual(self.board.layout.play_area_width - piece.get_width(), piece.get_x(Coordinate.PLAYING_FIELD))
+
+    def test_instant_soft_drop_leaves_landing_to_gravity(self):
+        self.start(AutoRepeat(delay_millis=50, rate_millis=0))
+        piece = self.board.active_piece
+        key = self.keys.by_id(GameKeys.DOWN)
+        self.gameplay.on_tick(TestGameplayAutoRepeat.FRAME, [KeyEvent(key, 0)])
+        for _ in range(4):
+            self.gameplay.on_tick(TestGameplayAutoRepeat.FRAME, [])
+        self.assertIs(piece, self.board.active_piece)
+        self.assertEqual(self.board.find_drop_y(piece), piece.get_y(Coordinate.PLAYING_FIELD))
+        self.assertEqual(0, self.gameplay.pieces_placed)
+
+
+if __name__ == '__main__':
+    unittest.main()
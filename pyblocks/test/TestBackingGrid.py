@@ -294,6 +294,125 @@ class TestBackingGrid(unittest.TestCase):
         self.assert_row_state(8, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1])
         self.assert_row_state(9, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1])
 
+    # the two rows at the very top of the grid are completed at once
+    def test_piece_completes_top_two_rows(self):
+        # Before rows cleared:
+        # y=0: 1111222255
+        # y=1: 3333444455
+        # y=2: ..........
+        for x, y in [(0, 0), (4, 0), (0, 1), (4, 1)]:
+            bar = Bar(self.geo)
+            bar.set_x(x)
+            bar.set_y(y)
+            self.grid.add(bar)
+        self.assertEqual(0, self.grid.clear_filled_rows())
+
+        box = Box(self.geo)
+        box.set_x(8)
+        box.set_y(0)
+        self.grid.add(box)
+        self.assertEqual(2, self.grid.clear_filled_rows())
+
+        for y in range(self.HEIGHT):
+            self.assert_row_empty(y)
+
+    def test_cleared_rows_are_not_counted_again(self):
+        bar1 = Bar(self.geo)
+        bar1.set_x(0)
+        bar1.set_y(9)
+        bar2 = Bar(self.geo)
+        bar2.set_x(4)
+        bar2.set_y(9)
+        box = Box(self.geo)
+        box.set_x(8)
+        box.set_y(8)
+
+        self.grid.add(bar1)
+        self.grid.add(bar2)
+        self.grid.add(box)
+        self.assertEqual(1, self.grid.clear_filled_rows())
+        self.assertEqual(0, self.grid.clear_filled_rows())
+        self.assert_row_state(9, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1])
+
+    def test_column_heights_track_added_pieces(self):
+        self.assertEqual([0] * self.WIDTH, list(self.grid.column_heights))
+        self.assertEqual([self.HEIGHT] * self.WIDTH, list(self.grid.surface))
+
+        box = Box(self.geo)
+        box.set_x(0)
+        box.set_y(8)
+        tee = Tee(self.geo)
+        tee.set_x(3)
+        tee.set_y(8)
+        self.grid.add(box)
+        self.grid.add(tee)
+
+        self.assertEqual([2, 2, 0, 1, 2, 1, 0, 0, 0, 0], list(self.grid.column_heights))
+        self.assertEqual([8, 8, 10, 9, 8, 9, 10, 10, 10, 10], list(self.grid.surface))
+
+    def test_column_heights_are_read_only(self):
+        def write():
+            self.grid.column_heights[0] = 5
+        self.assertRaises(TypeError, write)
+
+    def test_column_heights_after_clearing_row_under_overhang(self):
+        # Before row cleared:
+        # y=7: 11112222xx
+        # y=8: .....33.xx
+        # y=9: .....33...
+        for x in [0, 4]:
+            bar = Bar(self.geo)
+            bar.set_x(x)
+            bar.set_y(7)
+            self.grid.add(bar)
+        for x, y in [(5, 8), (8, 7)]:
+            box = Box(self.geo)
+            box.set_x(x)
+            box.set_y(y)
+            self.grid.add(box)
+        self.assertEqual(1, self.grid.clear_filled_rows())
+
+        self.assertEqual([0, 0, 0, 0, 0, 2, 2, 0, 2, 2], list(self.grid.column_heights))
+
+    def test_column_heights_after_clearing_rows_under_stack(self):
+        # Before rows cleared:
+        # y=6: ........56
+        # y=7: 3333444456
+        # y=8: ........56
+        # y=9: 1111222256
+        for x, y in [(0, 9), (4, 9), (0, 7), (4, 7)]:
+            bar = Bar(self.geo)
+            bar.set_x(x)
+            bar.set_y(y)
+            self.grid.add(bar)
+        for x in [8, 9]:
+            bar = Bar(self.geo)
+            bar.rotate(1)
+            bar.set_x(x)
+            bar.set_y(6)
+            self.grid.add(bar)
+        self.assertEqual(2, self.grid.clear_filled_rows())
+
+        self.assertEqual([0, 0, 0, 0, 0, 0, 0, 0, 2, 2], list(self.grid.column_heights))
+        self.assertEqual(8, self.grid.surface[9])
+
+    def test_slide_distance(self):
+        box = Box(self.geo)
+        box.set_x(2)
+        box.set_y(8)
+        self.grid.add(box)
+        bar = Bar(self.geo).get_fill_mask(Bar.ROTATION_R)
+        # the bottom two cells of the bar are level with the box
+        self.assertEqual(5, self.grid.slide_distance(9, 6, bar, -1))
+        # passes over the top of the box
+        self.assertEqual(9, self.grid.slide_distance(9, 4, bar, -1))
+        self.assertEqual(0, self.grid.slide_distance(9, 4, bar, 1))
+        self.assertEqual(5, self.grid.slide_distance(4, 6, bar, 1))
+        self.assertEqual(1, self.grid.slide_distance(0, 6, bar, 1))
+        # partly above the top of the play area
+        self.assertEqual(0, self.grid.slide_distance(0, -2, bar, -1))
+        self.assertEqual(9, self.grid.slide_distance(0, -2, bar, 1))
+
     # helper for checking what is in a single cell
     def assert_space_empty(self, x, y):
         self.assertFalse(self.grid.is_collision(x, y, self.SINGLE_BLOCK),
@@ -0,0 +1,62 @@
+import unittest
+
+from gameplay.key_function import KeyFunction
+from headless.batch import BatchReport
+from headless.batch import GameResult
+from headless.batch import Policy
+from headless.batch import RandomPolicy
+from headless.batch import play_game
+from headless.batch import run_batch
+from headless.engine import HeadlessGame
+
+
+class DropPolicy(Policy):
+    """ Drops every piece straight away """
+
+    def __init__(self, seed):
+        pass
+
+    def choose_action(self, game):
+        return KeyFunction.DROP
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_game_is_reproducible_from_seed(self):
+        first = play_game(5, RandomPolicy, 5000)
+        second = play_game(5, RandomPolicy, 5000)
+        self.assertEqual(first[:-1], second[:-1])
+        self.assertEqual(5, first.seed)
+        self.assertGreater(first.pieces_placed, 0)
+
+    def test_max_frames_cuts_game_short(self):
+        result = play_game(1, RandomPolicy, 10)
+        self.assertEqual(10, result.frames)
+
+    def test_last_frame_is_counted(self):
+        result = play_game(2, DropPolicy, 5000)
+        game = HeadlessGame(seed=2)
+        frames = 1
+        while game.step(KeyFunction.DROP):
+            frames += 1
+        self.assertEqual(frames, result.frames)
+
+    def test_batch_plays_every_seed(self):
+        results = list(run_batch([3, 1, 2], RandomPolicy, workers=2, max_frames=2000))
+        self.assertEqual([1, 2, 3], sorted(result.seed for result in results))
+        result = next(result for result in results if result.seed == 1)
+        self.assertEqual(play_game(1, RandomPolicy, 2000)[:-1], result[:-1])
+
+    def test_report_aggregates_results(self):
+        report = BatchReport()
+        report.add(GameResult(0, 100, 2, 1, 10, 500, 0.5))
+        report.add(GameResult(1, 300, 8, 2, 30, 1500, 1.5))
+        self.assertEqual(2, report.games)
+        self.assertEqual(200, report.mean("score"))
+        self.assertEqual(2, report.minimums["rows"])
+        self.assertEqual(30, report.maximums["pieces_placed"])
+        self.assertIn("2 games", report.format())
+
+
+if __name__ == '__main__':
+    unittest.main()
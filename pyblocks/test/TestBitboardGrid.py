@@ -0,0 +1,99 @@
+import unittest
+
+import test.TestBackingGrid as backing_grid_tests
+from gameboard.BitboardGrid import BitboardGrid
+from geometry.Geometry import Geometry
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.Box import Box
+from pyblocks.pieces.Tee import Tee
+
+
+# BitboardGrid is a drop-in replacement for BackingGrid, so it has to pass all the same tests
+class TestBitboardGrid(backing_grid_tests.TestBackingGrid):
+
+    def setUp(self):
+        self.grid = BitboardGrid(TestBitboardGrid.WIDTH, TestBitboardGrid.HEIGHT)
+        self.geo = Geometry(20, 20, (0, 0, 100, 100))
+
+    def test_rows_are_bitmasks(self):
+        tee = Tee(self.geo)
+        tee.set_x(3)
+        tee.set_y(8)
+        self.grid.add(tee)
+        # [[0, 1, 0], [1, 1, 1]] shifted over by 3 columns
+        self.assertEqual(0b10000, self.grid.rows[8])
+        self.assertEqual(0b111000, self.grid.rows[9])
+
+    def test_collision_above_top_of_field(self):
+        bar = Bar(self.geo)
+        bar.set_x(0)
+        bar.set_y(0)
+        self.grid.add(bar)
+
+        vertical = Bar(self.geo).get_fill_mask(Bar.ROTATION_R)
+        # only the bottom of the bar is in the play area
+        self.assertTrue(self.grid.is_collision(0, -3, vertical))
+        self.assertFalse(self.grid.is_collision(4, -3, vertical))
+
+    def test_colors_follow_collapsed_rows(self):
+        bar1 = Bar(self.geo)
+        bar1.set_x(0)
+        bar1.set_y(9)
+        bar2 = Bar(self.geo)
+        bar2.set_x(4)
+        bar2.set_y(9)
+        box = Box(self.geo)
+        box.set_x(8)
+        box.set_y(8)
+        # pointing down, sitting on the bars
+        tee = Tee(self.geo)
+        tee.rotate(Tee.ROTATION_R)
+        tee.rotate(Tee.ROTATION_R)
+        tee.set_x(0)
+        tee.set_y(7)
+
+        self.grid.add(bar1)
+        self.grid.add(bar2)
+        self.grid.add(tee)
+        self.grid.add(box)
+        self.assertEqual(1, self.grid.clear_filled_rows())
+
+        cells = list(self.grid)
+        # everything above the cleared row fell by one
+        self.assertEqual((True, 0, 8, 'blue'), cells[80])
+        self.assertEqual((True, 2, 8, 'blue'), cells[82])
+        self.assertEqual((True, 1, 9, 'blue'), cells[91])
+        self.assertEqual((True, 8, 9, 'green'), cells[98])
+        self.assertEqual((True, 9, 9, 'green'), cells[99])
+        self.assertEqual((False, None, None, None), cells[90])
+        self.assertEqual((False, None, None, None), cells[88])
+
+    def test_row_view_follows_the_grid(self):
+        view = self.grid.row_view
+        self.assertTrue(view.readonly)
+        self.assertEqual([0] * TestBitboardGrid.HEIGHT, view.tolist())
+
+        bar1 = Bar(self.geo)
+        bar1.set_x(0)
+        bar1.set_y(9)
+        bar2 = Bar(self.geo)
+        bar2.set_x(4)
+        bar2.set_y(9)
+        box = Box(self.geo)
+        box.set_x(8)
+        box.set_y(8)
+        self.grid.add(bar1)
+        self.grid.add(box)
+        self.assertEqual(self.grid.rows, view.tolist())
+        self.grid.add(bar2)
+        self.grid.clear_filled_rows()
+
+        # the same view sees the rows move down
+        self.assertEqual([0] * 9 + [0b1100000000], view.tolist())
+        self.assertEqual(self.grid.rows, view.tolist())
+
+    def test_no_row_view_when_too_wide(self):
+        self.assertIsNone(BitboardGrid(65, 10).row_view)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import unittest
+
+from gameboard.Board import Board
+from geometry.Coordinate import Coordinate
+from geometry.Geometry import Geometry
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.Box import Box
+from pyblocks.pieces.PieceFactory import PieceFactory
+from pyblocks.pieces.Tee import Tee
+
+
+class TestBoard(unittest.TestCase):
+    # Same layout as the real game: a 14x17 playing field, 5 blocks from the left and 3 from the top
+    FIELD_WIDTH = 14
+    FIELD_HEIGHT = 17
+
+    def setUp(self):
+        self.geo = Geometry(25, 25, (125, 75, 125 + 25 * self.FIELD_WIDTH, 75 + 25 * self.FIELD_HEIGHT))
+        self.board = Board(self.geo)
+        self.board.set_starting_pieces([Box(self.geo) for _ in range(3)], Tee(self.geo))
+
+    def test_drop_onto_empty_board(self):
+        self.assertEqual(0, self.board.active_piece.get_y(Coordinate.PLAYING_FIELD))
+        self.assertEqual(15, self.board.drop_piece())
+        self.assertEqual(15, self.board.active_piece.get_y(Coordinate.PLAYING_FIELD))
+        self.assertFalse(self.board.advance_piece())
+
+    def test_drop_onto_stack(self):
+        # a vertical bar right under the point of the tee
+        self.place(self.vertical_bar(), 8, 13)
+        self.assertEqual(11, self.board.find_drop_y(self.board.active_piece))
+
+    def test_drop_from_under_overhang(self):
+        # A roof over columns 6-9 with the tee tucked in below it
+        self.place(Bar(self.geo), 6, 10)
+        self.board.active_piece.set_y(11, Coordinate.PLAYING_FIELD)
+        self.assertEqual(15, self.board.find_drop_y(self.board.active_piece))
+
+    def test_drop_matches_falling_one_row_at_a_time(self):
+        rng = random.Random(7)
+        factory = PieceFactory(self.geo)
+        for _ in range(200):
+            piece = factory.make_piece(rng.randrange(PieceFactory.NUM_PIECE_TYPES))
+            for _ in range(rng.randrange(4)):
+                piece.rotate(1)
+            x = rng.randrange(self.FIELD_WIDTH - piece.get_width() + 1)
+            piece.set_x(x, Coordinate.PLAYING_FIELD)
+            piece.set_y(0, Coordinate.PLAYING_FIELD)
+            if self.board.backing_grid.is_collision(x, 0, piece.get_fill_mask()):
+                break
+            self.board.active_piece = piece
+
+            expected = 0
+            while self.board.piece_can_move_down(piece):
+                piece.set_y(piece.get_y() + 1)
+                expected += 1
+            piece.set_y(0, Coordinate.PLAYING_FIELD)
+
+            self.assertEqual(expected, self.board.drop_piece())
+            self.board.backing_grid.add(piece)
+            self.board.backing_grid.clear_filled_rows()
+
+    def test_ghost_follows_active_piece(self):
+        # grid y is 3 more than playing field y in this layout
+        self.assertEqual(18, self.board.get_ghost_y())
+        self.place(self.vertical_bar(), 8, 13)
+        self.assertEqual(14, self.board.get_ghost_y())
+        self.board.move_left()
+        self.board.move_left()
+        self.assertEqual(18, self.board.get_ghost_y())
+        # the ghost doesn't move the piece
+        self.assertEqual(0, self.board.active_piece.get_y(Coordinate.PLAYING_FIELD))
+
+    def test_drop_cache_is_invalidated_when_grid_changes(self):
+        piece = self.board.active_piece
+        self.assertEqual(15, self.board.find_drop_y(piece))
+        self.place(Box(self.geo), 7, 15)
+        self.assertEqual(13, self.board.find_drop_y(piece))
+
+    def vertical_bar(self):
+        bar = Bar(self.geo)
+        bar.rotate(Bar.ROTATION_R)
+        return bar
+
+    def place(self, piece, x, y):
+        piece.set_x(x, Coordinate.PLAYING_FIELD)
+        piece.set_y(y, Coordinate.PLAYING_FIELD)
+        self.board.backing_grid.add(piece)
+
+
+if __name__ == '__main__':
+    unittest.main()
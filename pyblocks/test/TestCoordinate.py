@@ -102,6 +102,28 @@ class TestCoordinate(unittest.TestCase):
     self.assertEqual(60, coord.getX(Coordinate.PIXEL))
     self.assertEqual(40, coord.getY(Coordinate.PIXEL))
     
+  # a grid square that is partly outside an unaligned playing field keeps its exact pixel location
+  def test_grid_coords_in_unaligned_field(self):
+    self.geo = Geometry(20, 20, (30, 10, 100, 100))
+    coord = Coordinate(1, 1, self.geo, Coordinate.GRID)
+    self.assertEqual(20, coord.getX(Coordinate.PIXEL))
+    self.assertEqual(20, coord.getY(Coordinate.PIXEL))
+    self.assertEqual(1, coord.getX(Coordinate.GRID))
+    self.assertEqual(1, coord.getY(Coordinate.GRID))
+    self.assertEqual(0, coord.getX(Coordinate.PLAYING_FIELD))
+    self.assertEqual(1, coord.getY(Coordinate.PLAYING_FIELD))
+
+    coord.setX(2, Coordinate.PLAYING_FIELD)
+    self.assertEqual(70, coord.getX(Coordinate.PIXEL))
+    self.assertEqual(3, coord.getX(Coordinate.GRID))
+
+  def test_playing_field_uses_block_height_for_y(self):
+    self.geo = Geometry(10, 20, (10, 40, 100, 100))
+    coord = Coordinate(1, 1, self.geo, Coordinate.PLAYING_FIELD)
+    self.assertEqual(20, coord.getX(Coordinate.PIXEL))
+    self.assertEqual(60, coord.getY(Coordinate.PIXEL))
+    self.assertEqual(3, coord.getY(Coordinate.GRID))
+
   # make sure Coordinate is calling get_height and get_width correctly
   def test_nonsquare_pieces(self):
     self.geo = Geometry(10, 20, (0,0,100,100))
@@ -0,0 +1,39 @@
+import unittest
+
+from gameplay.dirty_rects import DirtyRectTracker
+
+
+class TestDirtyRectTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = DirtyRectTracker()
+
+    def test_first_frame_is_full_redraw(self):
+        self.assertIsNone(self.tracker.update({'piece': ((0, 0, 10, 10), 1)}))
+
+    def test_unchanged_regions_are_clean(self):
+        self.tracker.update({'piece': ((0, 0, 10, 10), 1), 'score': ((50, 50, 10, 10), 100)})
+        self.assertEqual([], self.tracker.update({'piece': ((0, 0, 10, 10), 1), 'score': ((50, 50, 10, 10), 100)}))
+
+    def test_moved_region_dirties_old_and_new_location(self):
+        self.tracker.update({'piece': ((0, 0, 10, 10), 1)})
+        self.assertEqual([(0, 0, 10, 10), (0, 10, 10, 10)], self.tracker.update({'piece': ((0, 10, 10, 10), 1)}))
+
+    def test_state_change_dirties_region(self):
+        self.tracker.update({'score': ((50, 50, 10, 10), 100)})
+        self.assertEqual([(50, 50, 10, 10), (50, 50, 10, 10)], self.tracker.update({'score': ((50, 50, 10, 10), 110)}))
+
+    def test_removed_region_dirties_old_location(self):
+        self.tracker.update({'piece': ((0, 0, 10, 10), 1), 'ghost': ((0, 80, 10, 10), 1)})
+        self.assertEqual([(0, 80, 10, 10)], self.tracker.update({'piece': ((0, 0, 10, 10), 1)}))
+        self.assertEqual([], self.tracker.update({'piece': ((0, 0, 10, 10), 1)}))
+
+    def test_invalidate_forces_full_redraw(self):
+        self.tracker.update({'piece': ((0, 0, 10, 10), 1)})
+        self.tracker.invalidate()
+        self.assertIsNone(self.tracker.update({'piece': ((0, 0, 10, 10), 1)}))
+        self.assertEqual([], self.tracker.update({'piece': ((0, 0, 10, 10), 1)}))
+
+
+if __name__ == '__main__':
+    unittest.main()
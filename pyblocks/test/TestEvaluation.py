@@ -0,0 +1,38 @@
+import unittest
+
+from ai.evaluation import Weights
+from ai.evaluation import board_features
+from ai.evaluation import evaluate
+
+
+class TestEvaluation(unittest.TestCase):
+    WIDTH = 4
+
+    def test_empty_board(self):
+        features = board_features([0] * 5, TestEvaluation.WIDTH)
+        self.assertEqual((0, 0, 0), (features.aggregate_height, features.holes, features.bumpiness))
+
+    def test_heights_and_bumpiness(self):
+        rows = [0, 0, 0b0010, 0b0011, 0b1011]
+        # column heights are 2, 3, 0 and 1
+        features = board_features(rows, TestEvaluation.WIDTH)
+        self.assertEqual((6, 0, 1 + 3 + 1), (features.aggregate_height, features.holes, features.bumpiness))
+
+    def test_holes(self):
+        rows = [0, 0b0110, 0b0000, 0b1111, 0b1001]
+        # two holes under the top row, and two more at the bottom
+        self.assertEqual(4, board_features(rows, TestEvaluation.WIDTH).holes)
+
+    def test_holes_below_full_coverage(self):
+        rows = [0b1111, 0b0101, 0b1010]
+        self.assertEqual(4, board_features(rows, TestEvaluation.WIDTH).holes)
+
+    def test_weighted_score(self):
+        rows = [0, 0b0110, 0b0000, 0b1111]
+        weights = Weights(aggregate_height=-1, holes=-10, bumpiness=-100, rows_cleared=1000)
+        # heights 1, 3, 3, 1 so bumpiness 4, with 2 holes
+        self.assertEqual(-8 - 20 - 400 + 2000, evaluate(rows, TestEvaluation.WIDTH, 2, weights))
+
+
+if __name__ == '__main__':
+    unittest.main()
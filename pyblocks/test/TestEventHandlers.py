@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import Mock
+
+from gameplay.event_handlers import DemoHandler
+from gameplay.event_handlers import MenuHandler
+from gameplay.event_handlers import Mode
+from gameplay.game_context import GameContext
+from gameplay.key_function import KeyFunction
+from gameplay.keys import GameKeys
+from headless.engine import HeadlessGame
+
+
+class TestMenuHandler(unittest.TestCase):
+    FRAME = 16
+
+    def idle(self, handler, millis):
+        mode = None
+        for _ in range(millis // TestMenuHandler.FRAME):
+            mode = handler.on_tick(TestMenuHandler.FRAME, None)
+            if mode is not None:
+                break
+        return mode
+
+    def test_idle_menu_starts_demo(self):
+        handler = MenuHandler(Mock(), False)
+        self.assertEqual(Mode.DEMO, self.idle(handler, MenuHandler.DEMO_IDLE_MILLIS + TestMenuHandler.FRAME))
+
+    def test_key_press_resets_idle_time(self):
+        menu = Mock()
+        menu.on_key.return_value = None
+        handler = MenuHandler(menu, False)
+        self.assertIsNone(self.idle(handler, MenuHandler.DEMO_IDLE_MILLIS - 100))
+        handler.on_key(GameKeys().by_id(GameKeys.DOWN))
+        self.assertIsNone(self.idle(handler, MenuHandler.DEMO_IDLE_MILLIS - 100))
+
+    def test_no_demo_while_game_paused(self):
+        handler = MenuHandler(Mock(), True)
+        self.assertIsNone(self.idle(handler, MenuHandler.DEMO_IDLE_MILLIS * 2))
+
+
+class TestDemoHandler(unittest.TestCase):
+
+    def setUp(self):
+        game = HeadlessGame(seed=2)
+        self.context = GameContext()
+        self.context.board = game.board
+        self.context.gameplay = game.gameplay
+        self.context.score_keeper = game.score_keeper
+        self.player = Mock()
+        self.handler = DemoHandler(self.context, GameKeys(), player=self.player)
+
+    def test_any_key_returns_to_menu(self):
+        self.assertEqual(Mode.MENU, self.handler.on_key(GameKeys().by_id(GameKeys.LEFT)))
+
+    def test_ai_moves_at_a_steady_pace(self):
+        self.player.next_action.return_value = KeyFunction.MOVE_LEFT
+        piece = self.context.board.active_piece
+        start_x = piece.get_x()
+        for _ in range(DemoHandler.MOVE_MILLIS // 10 * 2):
+            self.assertIsNone(self.handler.on_tick(10, None))
+        self.assertEqual(start_x - 2, piece.get_x())
+
+    def test_game_over_returns_to_menu(self):
+        self.player.next_action.return_value = KeyFunction.DROP
+        mode = None
+        for _ in range(10000):
+            mode = self.handler.on_tick(DemoHandler.MOVE_MILLIS, None)
+            if mode is not None:
+                break
+        self.assertEqual(Mode.MENU, mode)
+        self.assertTrue(self.context.gameplay.game_over)
+
+
+if __name__ == '__main__':
+    unittest.main()
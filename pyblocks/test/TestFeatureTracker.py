@@ -0,0 +1,108 @@
+import random
+import unittest
+
+from ai.placements import apply_placement
+from ai.placements import find_placements
+from gameboard.BitboardGrid import BitboardGrid
+from gameboard.FeatureTracker import BoardFeatures
+from gameboard.FeatureTracker import FeatureTracker
+from geometry.Coordinate import Coordinate
+from geometry.Geometry import Geometry
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+
+# Works the features out cell by cell, the slow and obvious way
+def features_of(rows, width):
+    height = len(rows)
+
+    def filled(x, y):
+        if x < 0 or x >= width or y >= height:
+            return True
+        return y >= 0 and rows[y] >> x & 1 == 1
+
+    heights = []
+    holes = 0
+    for x in range(width):
+        top = next((y for y in range(height) if filled(x, y)), height)
+        heights.append(height - top)
+        holes += sum(1 for y in range(top, height) if not filled(x, y))
+    bumpiness = sum(abs(heights[x] - heights[x + 1]) for x in range(width - 1))
+    wells = 0
+    for x in range(width):
+        left = heights[x - 1] if x > 0 else height
+        right = heights[x + 1] if x < width - 1 else height
+        wells += max(0, min(left, right) - heights[x])
+    stack_top = height - max(heights)
+    row_transitions = sum(1 for y in range(stack_top, height) for x in range(-1, width)
+                          if filled(x, y) != filled(x + 1, y))
+    column_transitions = sum(1 for x in range(width) for y in range(-1, height)
+                             if filled(x, y) != filled(x, y + 1))
+    return BoardFeatures(sum(heights), holes, bumpiness, wells, row_transitions, column_transitions)
+
+
+class TestFeatureTracker(unittest.TestCase):
+    WIDTH = 8
+    HEIGHT = 12
+
+    def setUp(self):
+        self.geo = Geometry(20, 20, (0, 0, 20 * TestFeatureTracker.WIDTH, 20 * TestFeatureTracker.HEIGHT))
+        self.grid = BitboardGrid(TestFeatureTracker.WIDTH, TestFeatureTracker.HEIGHT)
+        self.factory = PieceFactory(self.geo)
+        self.rng = random.Random(5)
+
+    def test_empty_grid(self):
+        expected = BoardFeatures(0, 0, 0, 0, 0, TestFeatureTracker.WIDTH)
+        self.assertEqual(expected, self.grid.features.get_features())
+        self.assertEqual(expected, features_of(self.grid.rows, self.grid.width))
+
+    def test_known_board(self):
+        rows = [0] * 4 + [0b0000, 0b0010, 0b0001, 0b1011]
+        # heights 2, 3, 0, 1 with one hole under the 3, and wells in the first and third columns
+        self.assertEqual(BoardFeatures(6, 1, 1 + 3 + 1, 1 + 1, 4 + 2 + 2, 1 + 3 + 1 + 1), FeatureTracker.from_rows(rows, 4).get_features())
+
+    # Lands random pieces in random places, clearing rows as they fill, and checks the
+    # tracker against the obvious computation after every piece
+    def test_follows_adds_and_clears(self):
+        cleared = 0
+        for _ in range(200):
+            piece_type = self.rng.choice(PieceFactory.PIECE_TYPES)
+            placements = find_placements(self.grid, piece_type)
+            if not placements:
+                break
+            # keep the stack low, or the board fills up before any rows are cleared
+            placement = max(placements, key=lambda p: (p.y + piece_type.shapes[p.rotation].height, self.rng.random()))
+            piece = self.factory.make_piece(PieceFactory.PIECE_TYPES.index(piece_type))
+            while piece.rotation_index != placement.rotation:
+                piece.rotate(1)
+            piece.set_x(placement.x, Coordinate.PLAYING_FIELD)
+            piece.set_y(placement.y, Coordinate.PLAYING_FIELD)
+            self.grid.add(piece)
+            cleared += self.grid.clear_filled_rows()
+            self.assertEqual(features_of(self.grid.rows, self.grid.width), self.grid.features.get_features())
+        self.assertGreater(cleared, 0)
+
+    def test_what_if_matches_placing_the_piece(self):
+        for _ in range(40):
+            piece_type = self.rng.choice(PieceFactory.PIECE_TYPES)
+            placements = find_placements(self.grid, piece_type)
+            if not placements:
+                break
+            rows = list(self.grid.rows)
+            for placement in placements:
+                shape = piece_type.shapes[placement.rotation]
+                expected = features_of(apply_placement(rows, self.grid.width, piece_type, placement), self.grid.width)
+                self.assertEqual(expected, self.grid.features.features_after(rows, shape, placement.x, placement.y))
+            self.assertEqual(rows, self.grid.rows)
+
+            placement = self.rng.choice(placements)
+            piece = self.factory.make_piece(PieceFactory.PIECE_TYPES.index(piece_type))
+            while piece.rotation_index != placement.rotation:
+                piece.rotate(1)
+            piece.set_x(placement.x, Coordinate.PLAYING_FIELD)
+            piece.set_y(placement.y, Coordinate.PLAYING_FIELD)
+            self.grid.add(piece)
+            self.grid.clear_filled_rows()
+
+
+if __name__ == '__main__':
+    unittest.main()
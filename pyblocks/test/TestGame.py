@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import Mock
+
+from gameplay.event_handlers import DemoHandler
+from gameplay.event_handlers import GamePlayHandler
+from gameplay.event_handlers import MenuHandler
+from gameplay.event_handlers import Mode
+from gameplay.game import Game
+from gameplay.game import GameLoop
+from gameplay.keys import GameKeys
+from sound.audio import SilentJukebox
+
+
+class TestGame(unittest.TestCase):
+
+    def setUp(self):
+        self.game_context_builder = Mock()
+        self.game = Game(Mock(), Mock(), self.game_context_builder, Mock())
+
+    def test_demo_is_silent(self):
+        handler = self.game.enter_mode(Mode.DEMO)
+        self.assertIsInstance(handler, DemoHandler)
+        args = self.game_context_builder.build_new_game_in_progress.call_args[0]
+        self.assertIs(self.game.game_params, args[0])
+        self.assertIsInstance(args[1], SilentJukebox)
+        # and it isn't taken for a game in progress
+        self.assertIsNone(self.game.game_context)
+
+    def test_new_game_has_sound(self):
+        self.game.enter_mode(Mode.NEW_GAME)
+        self.game_context_builder.build_new_game_in_progress.assert_called_once_with(self.game.game_params)
+
+
+
+class TestGameLoop(unittest.TestCase):
+
+    def setUp(self):
+        self.pygame_context = Mock()
+        self.pygame_context.get_events.return_value = []
+        self.pygame_context.get_ticks.return_value = 0
+
+    def run_frames(self, handler, frames):
+        # leave after the given number of frames
+        handler.on_tick = Mock(side_effect=[None] * (frames - 1) + [Mode.MENU])
+        handler.on_render = Mock(return_value=None)
+        return GameLoop(self.pygame_context, handler, GameKeys()).run_event_loop()
+
+    def test_menus_keep_pygame_key_repeat(self):
+        self.run_frames(MenuHandler(Mock(), False), 3)
+        self.pygame_context.set_key_repeat.assert_called_once_with(True)
+
+    def test_gameplay_repeats_keys_itself_until_paused(self):
+        handler = GamePlayHandler(Mock(), GameKeys())
+        self.run_frames(handler, 2)
+        self.pygame_context.set_key_repeat.assert_called_once_with(False)
+
+        self.pygame_context.reset_mock()
+        handler.on_key(GameKeys().by_id(GameKeys.P))
+        self.run_frames(handler, 2)
+        self.pygame_context.set_key_repeat.assert_called_once_with(True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from gameplay.key_function import KeyFunction
+from geometry.Geometry import Geometry
+from headless.env import GameEnv
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+
+class TestGameEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.env = GameEnv()
+
+    def test_reset(self):
+        observation = self.env.reset(seed=1)
+        grid = self.env.game.board.backing_grid
+        self.assertEqual([0] * grid.height, observation.board.tolist())
+        piece = self.env.game.board.active_piece
+        self.assertIs(type(piece), PieceFactory.PIECE_TYPES[observation.piece])
+        self.assertEqual(0, observation.rotation)
+
+    def test_same_seed_same_game(self):
+        first = [self.env.reset(seed=5).piece]
+        while not self.env.step(KeyFunction.DROP)[2]:
+            first.append(self.env.observe().piece)
+
+        second = [self.env.reset(seed=5).piece]
+        while not self.env.step(KeyFunction.DROP)[2]:
+            second.append(self.env.observe().piece)
+        self.assertEqual(first, second)
+
+    def test_step(self):
+        start = self.env.reset(seed=2)
+        observation, reward, done, info = self.env.step(KeyFunction.MOVE_LEFT)
+        self.assertEqual(start.x - 1, observation.x)
+        self.assertEqual(0, reward)
+        self.assertFalse(done)
+
+        observation, reward, done, info = self.env.step(KeyFunction.DROP)
+        self.assertFalse(done)
+        # the same as HeadlessGame: 7 for the drop, 1 for landing and 5 for landing with no clicks
+        self.assertEqual(13, reward)
+        self.assertEqual(13, info["score"])
+        self.assertEqual(1, info["pieces_placed"])
+        self.assertEqual(self.env.game.board.backing_grid.rows, observation.board.tolist())
+
+    def test_board_is_a_live_view(self):
+        board = self.env.reset(seed=3).board
+        self.env.step(KeyFunction.DROP)
+        self.assertNotEqual(0, sum(board))
+        self.assertEqual(self.env.game.board.backing_grid.rows, board.tolist())
+        with self.assertRaises(TypeError):
+            board[0] = 1
+
+    def test_game_over(self):
+        self.env.reset(seed=4)
+        done = False
+        while not done:
+            observation, reward, done, info = self.env.step(KeyFunction.DROP)
+        with self.assertRaises(RuntimeError):
+            self.env.step(None)
+        self.assertFalse(self.env.reset().board.tolist()[-1])
+
+    def test_step_before_reset(self):
+        with self.assertRaises(RuntimeError):
+            self.env.step(None)
+
+    def test_too_wide_to_observe(self):
+        env = GameEnv(Geometry(10, 10, (0, 0, 650, 200)))
+        with self.assertRaises(ValueError):
+            env.reset()
+
+
+if __name__ == '__main__':
+    unittest.main()
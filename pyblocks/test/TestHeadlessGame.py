@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from gameplay.key_function import KeyFunction
+from geometry.Coordinate import Coordinate
+from headless.engine import HeadlessGame
+
+
+class TestHeadlessGame(unittest.TestCase):
+
+    def setUp(self):
+        self.game = HeadlessGame()
+
+    def test_does_not_import_pygame(self):
+        code = "import sys; import headless.engine; sys.exit('pygame' in sys.modules)"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], env=env,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(0, result.returncode)
+
+    def test_gravity_moves_piece_down(self):
+        piece = self.game.board.active_piece
+        start_y = piece.get_y()
+        # the piece falls one row every 910ms at the first level
+        self.game.run([None] * 60)
+        self.assertEqual(start_y + 1, piece.get_y())
+
+    def test_actions_move_piece(self):
+        piece = self.game.board.active_piece
+        start_x = piece.get_x()
+        self.game.run([KeyFunction.MOVE_LEFT, KeyFunction.MOVE_LEFT, KeyFunction.MOVE_RIGHT])
+        self.assertEqual(start_x - 1, piece.get_x())
+
+    def test_drop_lands_piece_and_scores(self):
+        first = self.game.board.active_piece
+        self.assertTrue(self.game.step(KeyFunction.DROP))
+        self.assertIsNot(first, self.game.board.active_piece)
+        # dropped from the top: 7 for the drop, 1 for landing and 5 for landing with no clicks
+        self.assertEqual(13, self.game.score_keeper.get_score())
+        self.assertNotEqual(0, sum(self.game.board.backing_grid.column_heights))
+
+    def test_dropping_in_one_column_ends_game(self):
+        while self.game.step(KeyFunction.DROP):
+            pass
+        self.assertTrue(self.game.game_over)
+        self.assertFalse(self.game.step(KeyFunction.DROP))
+        self.assertLessEqual(self.game.board.active_piece.get_y(Coordinate.PLAYING_FIELD), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from gameplay.input_queue import InputQueue
+from gameplay.input_queue import KeyEvent
+from gameplay.keys import GameKeys
+from gameplay.keys import KeyMapper
+from headless.engine import HeadlessGame
+
+
+class TestInputQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = InputQueue()
+        self.keys = GameKeys()
+
+    def test_keeps_every_key_in_order(self):
+        left = self.keys.by_id(GameKeys.LEFT)
+        up = self.keys.by_id(GameKeys.Z)
+        self.queue.push(left, 1000)
+        self.queue.push(up, 1004)
+        self.queue.push(left, 1009)
+        self.assertEqual(3, len(self.queue))
+        self.assertEqual([KeyEvent(left, 0), KeyEvent(up, 4), KeyEvent(left, 9)],
+                         self.queue.take_frame(1000, 16))
+        self.assertEqual(0, len(self.queue))
+        self.assertEqual([], self.queue.take_frame(1016, 16))
+
+    def test_times_are_kept_in_the_frame_and_in_order(self):
+        left = self.keys.by_id(GameKeys.LEFT)
+        self.queue.push(left, 990)
+        self.queue.push(left, 1030)
+        self.queue.push(left, 1005)
+        self.assertEqual([0, 16, 16], [event.millis for event in self.queue.take_frame(1000, 16)])
+
+
+class TestGameplayKeyEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.game = HeadlessGame(seed=1)
+        self.keys = GameKeys()
+        self.gameplay = self.game.gameplay
+        self.gameplay.key_mapper = KeyMapper(self.keys)
+        self.piece = self.game.board.active_piece
+
+    def event(self, key_id, millis=0):
+        return KeyEvent(self.keys.by_id(key_id), millis)
+
+    def test_every_key_in_a_frame_is_applied(self):
+        key_ids = [GameKeys.X, GameKeys.LEFT, GameKeys.LEFT]
+        self.gameplay.on_tick(16, [self.event(key_id, i) for i, key_id in enumerate(key_ids)])
+
+        # the same as pressing them one frame at a time
+        other = HeadlessGame(seed=1)
+        other.gameplay.key_mapper = KeyMapper(self.keys)
+        for key_id in key_ids:
+            other.gameplay.on_tick(1, [self.event(key_id)])
+        other_piece = other.board.active_piece
+        self.assertEqual(other_piece.rotation_index, self.piece.rotation_index)
+        self.assertNotEqual(0, self.piece.rotation_index)
+        self.assertEqual(other_piece.get_x(), self.piece.get_x())
+        self.assertEqual(other_piece.get_y(), self.piece.get_y())
+
+    def test_gravity_happens_between_keys(self):
+        start_y = self.piece.get_y()
+        # 10ms before the piece is due to fall
+        self.gameplay.set_difficulty(self.game.score_keeper.get_difficulty())
+        self.gameplay.accumulated_time = self.gameplay.difficulty - 10
+        self.gameplay.on_tick(16, [self.event(GameKeys.LEFT, 5), self.event(GameKeys.DOWN, 12)])
+        # it fell once on its own, after the first key, then once more for the down key
+        self.assertEqual(start_y + 2, self.piece.get_y())
+        self.assertEqual(4, self.gameplay.accumulated_time)
+        self.assertEqual(1, self.gameplay.num_clicks)
+
+    def test_keys_after_game_over_are_ignored(self):
+        drops = [self.event(GameKeys.SPACE)] * 100
+        self.assertFalse(self.gameplay.on_tick(16, drops))
+        self.assertTrue(self.gameplay.game_over)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from gameplay.key_function import KeyFunction
+from gameplay.keys import GameKeys
+from gameplay.keys import KeyChangePublisher
+from gameplay.keys import KeyMapper
+
+
+class TestKeyMapper(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = GameKeys()
+        self.mapper = KeyMapper(self.keys)
+
+    def test_default_keys(self):
+        self.assertEqual(KeyFunction.MOVE_LEFT, self.mapper.get_key_function(self.keys.by_id(GameKeys.LEFT)))
+        self.assertEqual(KeyFunction.DROP, self.mapper.get_key_function(self.keys.by_id(GameKeys.SPACE)))
+        self.assertEqual(KeyFunction.INVALID, self.mapper.get_key_function(self.keys.by_id(GameKeys.Q)))
+        self.assertEqual(KeyFunction.INVALID, self.mapper.get_key_function(None))
+
+    def test_remapped_key(self):
+        publisher = KeyChangePublisher()
+        publisher.subscribe(self.mapper.on_key_change)
+        publisher.on_key_change(KeyFunction.ROTATE_LEFT, self.keys.by_id(GameKeys.A))
+
+        self.assertEqual(KeyFunction.ROTATE_LEFT, self.mapper.get_key_function(self.keys.by_id(GameKeys.A)))
+        # the old key doesn't do anything any more
+        self.assertEqual(KeyFunction.INVALID, self.mapper.get_key_function(self.keys.by_id(GameKeys.Z)))
+        self.assertEqual(self.keys.by_id(GameKeys.A), self.mapper.get_key_by_function(KeyFunction.ROTATE_LEFT))
+
+    def test_key_mapped_twice_does_the_first_function(self):
+        self.mapper.on_key_change(KeyFunction.DROP, self.keys.by_id(GameKeys.LEFT))
+        self.assertEqual(KeyFunction.MOVE_LEFT, self.mapper.get_key_function(self.keys.by_id(GameKeys.LEFT)))
+        self.assertEqual(KeyFunction.INVALID, self.mapper.get_key_function(self.keys.by_id(GameKeys.SPACE)))
+
+        # and the other one again once it's moved off
+        self.mapper.on_key_change(KeyFunction.MOVE_LEFT, self.keys.by_id(GameKeys.J))
+        self.assertEqual(KeyFunction.DROP, self.mapper.get_key_function(self.keys.by_id(GameKeys.LEFT)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from ai.moves import ReachableMoves
+from ai.moves import find_reachable
+from ai.placements import find_placements
+from gameboard.BitboardGrid import BitboardGrid
+from geometry.Coordinate import Coordinate
+from headless.engine import HeadlessGame
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+
+class TestMoves(unittest.TestCase):
+
+    def setUp(self):
+        self.game = HeadlessGame(seed=0)
+        self.board = self.game.board
+        self.grid = self.board.backing_grid
+        self.geo = self.game.geometry
+
+    def add_overhang(self):
+        # a bar lying across columns 0 to 3, two rows above the floor
+        bar = Bar(self.geo)
+        bar.set_x(0, Coordinate.PLAYING_FIELD)
+        bar.set_y(self.grid.height - 3, Coordinate.PLAYING_FIELD)
+        self.grid.add(bar)
+
+    def test_empty_board_reaches_every_drop(self):
+        for piece_class in PieceFactory.PIECE_TYPES:
+            grid = BitboardGrid(14, 17)
+            moves = ReachableMoves(grid.rows, grid.width, piece_class, 7, 0, 0)
+            self.assertEqual(set(find_placements(grid, piece_class)), set(moves.placements))
+
+    def test_blocked_start_has_no_placements(self):
+        rows = [0b1111] * 17
+        self.assertEqual([], ReachableMoves(rows, 14, Bar, 0, 0, 0).placements)
+
+    def test_finds_tucks_under_overhangs(self):
+        self.add_overhang()
+        piece = self.board.active_piece
+        moves = find_reachable(self.grid, piece)
+        drops = set(find_placements(self.grid, type(piece)))
+        tucks = [p for p in moves.placements if p not in drops]
+        self.assertTrue(tucks)
+        under_bar = 0b1111
+        for tuck in tucks:
+            # some part of the piece has to be underneath the bar
+            masks = type(piece).shapes[tuck.rotation].row_masks
+            covered = [tuck.y + i for i, mask in enumerate(masks) if (mask << tuck.x) & under_bar]
+            self.assertGreater(max(covered), self.grid.height - 3)
+
+    def test_path_lands_piece_at_placement(self):
+        self.add_overhang()
+        piece = self.board.active_piece
+        moves = find_reachable(self.grid, piece)
+        tuck = next(p for p in moves.placements if p.x == 0 and p.y > self.grid.height - 3)
+        shape = type(piece).shapes[tuck.rotation]
+        pieces_placed = self.game.gameplay.pieces_placed
+
+        path = moves.path_to(tuck)
+        self.assertEqual(1, path.count(path[-1]))
+        for action in path:
+            self.game.gameplay.apply_function(action)
+
+        self.assertEqual(pieces_placed + 1, self.game.gameplay.pieces_placed)
+        for i, mask in enumerate(shape.row_masks):
+            self.assertEqual(mask << tuck.x, self.grid.rows[tuck.y + i] & (mask << tuck.x))
+
+
+if __name__ == '__main__':
+    unittest.main()
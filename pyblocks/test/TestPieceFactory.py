@@ -0,0 +1,51 @@
+import unittest
+
+from gameboard.Board import Board
+from geometry.Geometry import Geometry
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.PieceFactory import PieceFactory
+from pyblocks.pieces.PieceRandomizer import PieceRandomizer
+
+
+class TestPieceFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.geo = Geometry(20, 20, (0, 0, 200, 400))
+        self.factory = PieceFactory(self.geo, PieceRandomizer(0))
+
+    def test_makes_each_type(self):
+        for which, piece_class in enumerate(PieceFactory.PIECE_TYPES):
+            self.assertIsInstance(self.factory.make_piece(which), piece_class)
+        self.assertEqual(PieceFactory.NUM_PIECE_TYPES, self.factory.pieces_allocated)
+
+    def test_out_of_range_type(self):
+        self.assertRaises(ValueError, self.factory.make_piece, PieceFactory.NUM_PIECE_TYPES)
+        self.assertRaises(ValueError, self.factory.make_piece, -1)
+
+    def test_released_piece_is_reused_in_starting_orientation(self):
+        bar = self.factory.make_piece(2)
+        bar.rotate(1)
+        self.factory.release(bar)
+
+        reused = self.factory.make_piece(2)
+        self.assertIs(bar, reused)
+        self.assertEqual(0, reused.rotation_index)
+        self.assertIs(Bar.shapes[0], reused.get_shape())
+        self.assertEqual(1, self.factory.pieces_allocated)
+        self.assertEqual(1, self.factory.pieces_reused)
+
+    def test_released_piece_only_reused_for_same_type(self):
+        self.factory.release(self.factory.make_piece(2))
+        self.assertIsNot(Bar, type(self.factory.make_piece(0)))
+        self.assertEqual(2, self.factory.pieces_allocated)
+
+    def test_play_allocates_at_most_one_piece_per_live_piece(self):
+        board = Board(self.geo)
+        board.set_starting_pieces([self.factory.random_piece() for _ in range(3)], self.factory.random_piece())
+        for _ in range(1000):
+            board.play_next_piece(self.factory)
+
+        # only the queue and the active piece are ever in use, so even if they are all the
+        # same type, no more than that many of each type are ever needed
+        self.assertLessEqual(self.factory.pieces_allocated, 4 * PieceFactory.NUM_PIECE_TYPES)
+        self.assertEqual(1004, self.factory.pieces_allocated + self.factory.pieces_reused)
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from geometry.Geometry import Geometry
+from pyblocks.pieces.PieceFactory import PieceFactory
+from pyblocks.pieces.PieceRandomizer import NUM_PIECE_TYPES
+from pyblocks.pieces.PieceRandomizer import PieceRandomizer
+from pyblocks.pieces.PieceRandomizer import STRATEGIES
+
+
+class TestPieceRandomizer(unittest.TestCase):
+
+    def take(self, randomizer, count):
+        return [randomizer.next_type() for _ in range(count)]
+
+    def test_same_seed_gives_same_sequence(self):
+        for strategy in STRATEGIES:
+            first = self.take(PieceRandomizer(42, strategy), 200)
+            second = self.take(PieceRandomizer(42, strategy), 200)
+            self.assertEqual(first, second)
+
+    def test_different_seeds_give_different_sequences(self):
+        self.assertNotEqual(self.take(PieceRandomizer(1), 50), self.take(PieceRandomizer(2), 50))
+
+    def test_not_affected_by_global_random(self):
+        randomizer = PieceRandomizer(7)
+        expected = self.take(PieceRandomizer(7), 200)
+        actual = []
+        for _ in range(200):
+            random.random()
+            actual.append(randomizer.next_type())
+        self.assertEqual(expected, actual)
+
+    def test_types_are_in_range(self):
+        for strategy in STRATEGIES:
+            types = self.take(PieceRandomizer(3, strategy), 500)
+            self.assertEqual(set(range(NUM_PIECE_TYPES)), set(types))
+
+    def test_bag_deals_each_type_once_per_bag(self):
+        types = self.take(PieceRandomizer(11, "bag"), NUM_PIECE_TYPES * 30)
+        for start in range(0, len(types), NUM_PIECE_TYPES):
+            self.assertEqual(list(range(NUM_PIECE_TYPES)), sorted(types[start:start + NUM_PIECE_TYPES]))
+
+    def test_history_repeats_less_than_uniform(self):
+        def repeats(types):
+            return sum(1 for a, b in zip(types, types[1:]) if a == b)
+        uniform = self.take(PieceRandomizer(5, "uniform"), 2000)
+        history = self.take(PieceRandomizer(5, "history"), 2000)
+        self.assertLess(repeats(history), repeats(uniform))
+
+    def test_factory_uses_randomizer(self):
+        geo = Geometry(20, 20, (0, 0, 200, 400))
+        factory = PieceFactory(geo, PieceRandomizer(9, "bag"))
+        expected = self.take(PieceRandomizer(9, "bag"), 14)
+        pieces = [factory.random_piece() for _ in range(14)]
+        self.assertEqual([type(factory.make_piece(t)) for t in expected], [type(p) for p in pieces])
+
+
+if __name__ == '__main__':
+    unittest.main()
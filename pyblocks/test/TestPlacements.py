@@ -0,0 +1,93 @@
+import unittest
+
+from ai.placements import Placement
+from ai.placements import apply_placement
+from ai.placements import column_tops
+from ai.placements import find_placements
+from ai.placements import placements_on_rows
+from gameboard.BitboardGrid import BitboardGrid
+from geometry.Geometry import Geometry
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.Box import Box
+from pyblocks.pieces.PieceFactory import PieceFactory
+from pyblocks.pieces.Tee import Tee
+
+
+class TestPlacements(unittest.TestCase):
+    WIDTH = 10
+    HEIGHT = 12
+
+    def setUp(self):
+        self.geo = Geometry(20, 20, (0, 0, 20 * TestPlacements.WIDTH, 20 * TestPlacements.HEIGHT))
+        self.grid = BitboardGrid(TestPlacements.WIDTH, TestPlacements.HEIGHT)
+
+    def add(self, piece_class, x, y, rotations=0):
+        piece = piece_class(self.geo)
+        for _ in range(rotations):
+            piece.rotate(1)
+        piece.set_x(x)
+        piece.set_y(y)
+        self.grid.add(piece)
+
+    def test_empty_board(self):
+        self.assertEqual(9, len(find_placements(self.grid, Box)))
+        # 7 lying down and 10 standing up
+        self.assertEqual(17, len(find_placements(self.grid, Bar)))
+        self.assertEqual(8 + 9 + 8 + 9, len(find_placements(self.grid, Tee)))
+        for placement in find_placements(self.grid, Box):
+            self.assertEqual(TestPlacements.HEIGHT - 2, placement.y)
+            self.assertEqual(0, placement.rows_cleared)
+
+    def test_matches_sweeping_down_the_board(self):
+        self.add(Tee, 2, 10)
+        self.add(Bar, 6, 8, rotations=1)
+        self.add(Box, 0, 10)
+        for piece_class in PieceFactory.PIECE_TYPES:
+            placements = find_placements(self.grid, piece_class)
+            for placement in placements:
+                shape = piece_class.shapes[placement.rotation]
+                y = 0
+                while y + shape.height < self.grid.height and \
+                        not self.grid.is_collision(placement.x, y + 1, shape.fill_mask):
+                    y += 1
+                self.assertEqual(y, placement.y)
+
+    def test_counts_rows_cleared(self):
+        # leave columns 0 to 3 of the bottom two rows open
+        for x in range(4, 10, 2):
+            self.add(Box, x, 10)
+        placements = find_placements(self.grid, Bar)
+        self.assertIn(Placement(0, 0, 11, 1), placements)
+        self.assertIn(Placement(1, 0, 8, 0), placements)
+
+    def test_does_not_change_the_grid(self):
+        self.add(Tee, 2, 10)
+        rows = list(self.grid.rows)
+        version = self.grid.version
+        find_placements(self.grid, Tee)
+        self.assertEqual(rows, self.grid.rows)
+        self.assertEqual(version, self.grid.version)
+
+    def test_skips_placements_above_the_field(self):
+        for y in range(0, TestPlacements.HEIGHT, 4):
+            self.add(Bar, 0, y, rotations=1)
+        for placement in find_placements(self.grid, Box):
+            self.assertNotEqual(0, placement.x)
+
+    def test_works_from_rows_alone(self):
+        self.add(Tee, 2, 10)
+        self.add(Bar, 6, 8, rotations=1)
+        self.assertEqual(list(self.grid.surface), column_tops(self.grid.rows, self.grid.width))
+        self.assertEqual(find_placements(self.grid, Tee), placements_on_rows(self.grid.rows, self.grid.width, Tee))
+
+    def test_apply_placement_clears_rows(self):
+        for x in range(4, 10, 2):
+            self.add(Box, x, 10)
+        rows = list(self.grid.rows)
+        new_rows = apply_placement(rows, self.grid.width, Bar, Placement(0, 0, 11, 1))
+        self.assertEqual(rows, self.grid.rows)
+        self.assertEqual([0] * 11 + [0b1111110000], new_rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
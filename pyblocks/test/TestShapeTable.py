@@ -0,0 +1,58 @@
+import unittest
+
+from geometry.Geometry import Geometry
+from pyblocks.pieces.Bar import Bar
+from pyblocks.pieces.Box import Box
+from pyblocks.pieces.Ell import Ell
+from pyblocks.pieces.Piece import Piece
+from pyblocks.pieces.Tee import Tee
+
+
+class TestShapeTable(unittest.TestCase):
+
+    def setUp(self):
+        self.geo = Geometry(20, 20, (0, 0, 100, 100))
+
+    def test_every_orientation_is_compiled(self):
+        self.assertEqual(4, len(Tee.shapes))
+        self.assertEqual(2, len(Bar.shapes))
+        self.assertEqual(1, len(Box.shapes))
+        for rotation, fill_mask in enumerate(Ell.fill_arrays):
+            self.assertIs(fill_mask, Ell.shapes[rotation].fill_mask)
+
+    def test_tee_pointing_up(self):
+        shape = Tee.shapes[0]
+        self.assertEqual(3, shape.width)
+        self.assertEqual(2, shape.height)
+        self.assertEqual(((1, 0), (0, 1), (1, 1), (2, 1)), shape.cells)
+        self.assertEqual((0b010, 0b111), shape.row_masks)
+        self.assertEqual((1, 1, 1), shape.bottom_profile)
+        self.assertEqual((1, 0, 1), shape.top_profile)
+        self.assertEqual((None, (1, 0), None, (0, 0)), shape.rotation_deltas)
+
+    def test_ell_pointing_right(self):
+        shape = Ell.shapes[1]
+        self.assertEqual(2, shape.width)
+        self.assertEqual(3, shape.height)
+        self.assertEqual((0b01, 0b01, 0b11), shape.row_masks)
+        self.assertEqual((2, 2), shape.bottom_profile)
+        self.assertEqual((0, 2), shape.top_profile)
+
+    def test_piece_tracks_shape_through_rotations(self):
+        bar = Bar(self.geo)
+        self.assertEqual((4, 1), (bar.get_width(), bar.get_height()))
+        self.assertEqual((1, -1), bar.rotate(Piece.ROTATION_L))
+        self.assertIs(Bar.shapes[1], bar.get_shape())
+        self.assertEqual((1, 4), (bar.get_width(), bar.get_height()))
+        self.assertEqual((-1, 1), bar.rotate(Piece.ROTATION_L))
+        self.assertIs(Bar.shapes[0], bar.get_shape())
+
+    def test_box_rotation_does_not_move(self):
+        box = Box(self.geo)
+        self.assertEqual((0, 0), box.rotate(Piece.ROTATION_R))
+        self.assertEqual((0, 0), box.rotate(Piece.ROTATION_L))
+        self.assertEqual([[1, 1], [1, 1]], box.get_fill_mask())
+
+
+if __name__ == '__main__':
+    unittest.main()
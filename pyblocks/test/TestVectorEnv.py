@@ -0,0 +1,139 @@
+import random
+import unittest
+
+from ai.placements import apply_placement
+from ai.placements import placements_on_rows
+from gameplay.score_keeper import ScoreKeeper
+from pyblocks.pieces.PieceFactory import PieceFactory
+
+try:
+    import numpy as np
+    from headless.vector_env import VectorEnv
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorEnv(unittest.TestCase):
+    WIDTH = 10
+    HEIGHT = 12
+
+    def make_env(self, num_envs, seed=0):
+        return VectorEnv(num_envs, TestVectorEnv.WIDTH, TestVectorEnv.HEIGHT, seed=seed)
+
+    def test_reset(self):
+        env = self.make_env(5)
+        observation = env.reset()
+        self.assertEqual((5, TestVectorEnv.HEIGHT), observation.shape)
+        self.assertFalse(observation.any())
+        self.assertFalse(env.done.any())
+        self.assertTrue(((env.pieces >= 0) & (env.pieces < len(PieceFactory.PIECE_TYPES))).all())
+
+    def test_observation_is_a_view(self):
+        env = self.make_env(3)
+        observation = env.observe()
+        env.step(np.zeros(3, dtype=np.int64), np.zeros(3, dtype=np.int64))
+        self.assertTrue(np.shares_memory(observation, env.boards))
+        self.assertTrue(observation.any(axis=1).all())
+
+    def test_same_seed_same_pieces(self):
+        first = self.make_env(8, seed=42)
+        second = self.make_env(8, seed=42)
+        actions = np.zeros(8, dtype=np.int64)
+        for _ in range(10):
+            np.testing.assert_array_equal(first.pieces, second.pieces)
+            first.step(actions, actions)
+            second.step(actions, actions)
+
+    def test_matches_the_real_placement_rules(self):
+        # Play random placements and check every board and score against ai.placements and
+        # the ScoreKeeper
+        num_envs = 16
+        env = self.make_env(num_envs, seed=3)
+        rng = random.Random(3)
+        boards = [[0] * TestVectorEnv.HEIGHT for _ in range(num_envs)]
+        keepers = [ScoreKeeper() for _ in range(num_envs)]
+        finished = [False] * num_envs
+        total_cleared = 0
+
+        for _ in range(60):
+            rotations = np.zeros(num_envs, dtype=np.int64)
+            xs = np.zeros(num_envs, dtype=np.int64)
+            expected = []
+            for n in range(num_envs):
+                piece_type = PieceFactory.PIECE_TYPES[env.pieces[n]]
+                placements = placements_on_rows(boards[n], TestVectorEnv.WIDTH, piece_type)
+                # favour the low placements, so that rows get cleared now and then
+                placements = sorted(p for p in placements if p.y > 0)
+                choice = None
+                if placements and not finished[n]:
+                    lowest = max(p.y for p in placements)
+                    choice = rng.choice([p for p in placements if p.y >= lowest - 1])
+                    rotations[n] = choice.rotation
+                    xs[n] = choice.x
+                expected.append((piece_type, choice))
+
+            rewards, done = env.step(rotations, xs)
+
+            for n, (piece_type, choice) in enumerate(expected):
+                if finished[n]:
+                    self.assertTrue(done[n])
+                    self.assertEqual(0, rewards[n])
+                    continue
+                if choice is None:
+                    # there was nowhere to put the piece
+                    self.assertTrue(done[n])
+                    finished[n] = True
+                    continue
+                self.assertFalse(done[n])
+                boards[n] = apply_placement(boards[n], TestVectorEnv.WIDTH, piece_type, choice)
+                before = keepers[n].get_score()
+                keepers[n].on_move_complete(choice.rows_cleared, 0)
+                keepers[n].on_drop(0)
+                total_cleared += choice.rows_cleared
+                self.assertEqual(keepers[n].get_score() - before, rewards[n])
+
+            for n in range(num_envs):
+                self.assertEqual(boards[n], env.observe()[n].tolist())
+                self.assertEqual(keepers[n].get_score(), env.scores[n])
+                self.assertEqual(keepers[n].get_rows(), env.rows[n])
+
+        self.assertGreater(total_cleared, 0)
+
+    def test_game_over_and_reset_done(self):
+        env = self.make_env(2)
+        # keep stacking in column 0 of the first game and spread out the second game's pieces
+        for step in range(TestVectorEnv.HEIGHT):
+            env.step(np.array([1, 0]), np.array([0, (step * 4) % TestVectorEnv.WIDTH]))
+            if env.done[0]:
+                break
+        self.assertTrue(env.done[0])
+        self.assertFalse(env.done[1])
+        placed = env.pieces_placed[0]
+
+        # finished games are left alone by later steps
+        board = env.observe()[0].copy()
+        rewards, done = env.step(np.array([0, 0]), np.array([5, 5]))
+        self.assertEqual(0, rewards[0])
+        self.assertTrue(done[0])
+        np.testing.assert_array_equal(board, env.observe()[0])
+        self.assertEqual(placed, env.pieces_placed[0])
+
+        second_board = env.observe()[1].copy()
+        np.testing.assert_array_equal([0], env.reset_done())
+        self.assertFalse(env.done.any())
+        self.assertFalse(env.observe()[0].any())
+        self.assertEqual(0, env.scores[0])
+        np.testing.assert_array_equal(second_board, env.observe()[1])
+
+    def test_cells(self):
+        env = self.make_env(1)
+        env.boards[0, TestVectorEnv.HEIGHT - 1] = 0b101
+        cells = env.cells()
+        self.assertEqual((1, TestVectorEnv.HEIGHT, TestVectorEnv.WIDTH), cells.shape)
+        self.assertEqual([1, 0, 1, 0], cells[0, TestVectorEnv.HEIGHT - 1, :4].tolist())
+        self.assertEqual(2, cells.sum())
+
+    def test_too_wide(self):
+        with self.assertRaises(ValueError):
+            VectorEnv(1, width=63)
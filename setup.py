@@ -8,6 +8,8 @@ setup(name='pyblocks',
       author='Benjamin Dunton',
       packages=find_packages(),
       install_requires=['wheel', 'pygame>=2.0.2', 'nose'],
+      # headless.vector_env steps many games at once with numpy
+      extras_require={'vector': ['numpy']},
       test_suite='nose.collector',
       tests_require=['nose'],
       # TODO: this is not quite right. Not sure if I even need a setup.py for this.